@@ -67,6 +67,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'Website.context_processors.navigation',
             ],
         },
     },
@@ -98,6 +99,38 @@ elif env(var="MODE") == "dev":
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# "locmem" is per process, "file" is shared by the processes of a host, "redis" (needs the redis package) by hosts
+
+E5_CACHE_BACKEND = env(var="E5_CACHE_BACKEND", default="locmem")
+CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "analystats"),
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", str(BASE_DIR / "cache")),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379"),
+}
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[E5_CACHE_BACKEND][0],
+        'LOCATION': env(var="E5_CACHE_LOCATION", default=CACHE_BACKENDS[E5_CACHE_BACKEND][1]),
+    }
+}
+
+# Website pages are cached until a scrape commits new stats or a deploy changes E5_BUILD_ID
+# E5_BUILD_ID defaults to a stamp of the Website sources, set it e.g. to the deployed commit to share it between hosts
+# A page rebuild holds its lock for E5_PAGE_CACHE_LOCK_SECONDS, requests for a page never built wait for it meanwhile
+
+E5_PAGE_CACHE = env.bool(var="E5_PAGE_CACHE", default=not DEBUG)
+E5_PAGE_CACHE_TIMEOUT = env.int(var="E5_PAGE_CACHE_TIMEOUT", default=24 * 3600)
+E5_PAGE_CACHE_LOCK_SECONDS = env.int(var="E5_PAGE_CACHE_LOCK_SECONDS", default=30)
+E5_PAGE_CACHE_WAIT_SECONDS = env.float(var="E5_PAGE_CACHE_WAIT_SECONDS", default=10.0)
+E5_BUILD_ID = env(var="E5_BUILD_ID", default="")
+
+# Directory E5ExportStatic renders the website pages into, for nginx to serve them directly
+
+E5_STATIC_EXPORT_DIR = env(var="E5_STATIC_EXPORT_DIR", default=str(BASE_DIR / "static_site"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -140,3 +173,67 @@ MEDIA_ROOT = BASE_DIR / 'mediafiles'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Scrapper
+# Number of headless Chrome instances shared by every scrape command of a run, a stage fetches its iframe and day
+# pages on that many browsers at once
+# 0 : as many as the scrape steps E5GetAll runs at once (--parallelism), otherwise the CPU count
+
+E5_WEBDRIVER_POOL_SIZE = env.int(var="E5_WEBDRIVER_POOL_SIZE", default=0)
+
+# Scrape steps run at once by E5GetAll, independent stats families share the webdriver pool
+
+E5_SCHEDULER_PARALLELISM = env.int(var="E5_SCHEDULER_PARALLELISM",
+                                   default=E5_WEBDRIVER_POOL_SIZE or os.cpu_count() or 1)
+
+# E5GetAll without --families schedules every stats family on every run and relies on the freshness tracker to skip
+# the seasons without new matches. When the league tables fail to parse, every family parses every season, which
+# about doubles the daily page fetches compared to the original weekday rotation
+# True : E5GetAll without --families only runs the families of the day, see E5ScrapeGraph.SCHEDULE
+
+E5_FAMILY_SCHEDULE = env.bool(var="E5_FAMILY_SCHEDULE", default=False)
+
+# Hours during which E5GetAll --resume picks up an unfinished run instead of starting over
+
+E5_RESUME_WINDOW_HOURS = env.int(var="E5_RESUME_WINDOW_HOURS", default=24)
+
+# Job queue of E5ScrapeWorker : a claimed job is retaken once its lease expires, and given up after max attempts
+
+E5_JOB_LEASE_SECONDS = env.int(var="E5_JOB_LEASE_SECONDS", default=600)
+E5_JOB_MAX_ATTEMPTS = env.int(var="E5_JOB_MAX_ATTEMPTS", default=3)
+E5_WORKER_POLL_SECONDS = env.int(var="E5_WORKER_POLL_SECONDS", default=10)
+
+# Directory of the json telemetry report written at the end of every scrape run
+
+E5_TELEMETRY_DIR = env(var="E5_TELEMETRY_DIR", default=str(BASE_DIR / "telemetry"))
+
+# Seasons are scraped soonest kickoff first, these bound a time boxed run (0 : no bound)
+# Only the first seasons of that order, and only the seasons with a fixture within the horizon
+
+E5_PRIORITY_MAX_SEASONS = env.int(var="E5_PRIORITY_MAX_SEASONS", default=0)
+E5_PRIORITY_HORIZON_HOURS = env.int(var="E5_PRIORITY_HORIZON_HOURS", default=0)
+
+# Page archive : "record" saves every scraped page, "replay" serves them back without browser nor network
+
+E5_PAGE_ARCHIVE_MODE = env(var="E5_PAGE_ARCHIVE_MODE", default="off")
+E5_PAGE_ARCHIVE_DIR = env(var="E5_PAGE_ARCHIVE_DIR", default=str(BASE_DIR / "page_archive"))
+
+# Keep-alive http connections used to fetch the published sheets without a browser
+
+E5_HTTP_POOL_SIZE = env.int(var="E5_HTTP_POOL_SIZE", default=10)
+E5_HTTP_TIMEOUT = env.float(var="E5_HTTP_TIMEOUT", default=20.0)
+
+# Published sheets fetched concurrently by the trio fetch engine, keep it below E5_HTTP_POOL_SIZE
+
+E5_FETCH_CONCURRENCY = env.int(var="E5_FETCH_CONCURRENCY", default=8)
+
+# Seconds to wait for the predictions tables to render before parsing what is there
+
+E5_PREDICTIONS_TIMEOUT = env.int(var="E5_PREDICTIONS_TIMEOUT", default=30)
+
+# Predictions pages login, the session cookies are saved once and reused until they expire
+
+E5_PREDICTIONS_USER = env(var="E5_PREDICTIONS_USER", default="")
+E5_PREDICTIONS_PASSWORD = env(var="E5_PREDICTIONS_PASSWORD", default="")
+E5_SESSION_COOKIES_PATH = env(var="E5_SESSION_COOKIES_PATH", default=str(BASE_DIR / "session_cookies.json"))
+E5_SESSION_COOKIES_TTL = env.int(var="E5_SESSION_COOKIES_TTL", default=7 * 24 * 3600)
@@ -441,3 +441,56 @@ class E5LateGoalsStatsAdmin(admin.ModelAdmin):
     search_fields = ('team',)
     list_filter = ('team',)
     list_per_page = 15000
+
+
+# E5
+@admin.register(models.E5SeasonFreshness)
+class E5SeasonFreshnessAdmin(admin.ModelAdmin):
+    list_display = ('id', 'season', 'family', 'matches_played', 'date_updated')
+    search_fields = ('family',)
+    list_filter = ('family', 'season')
+    list_per_page = 15000
+
+
+# E5
+@admin.register(models.E5ScrapeRun)
+class E5ScrapeRunAdmin(admin.ModelAdmin):
+    list_display = ('id', 'status', 'started_at', 'finished_at')
+    list_filter = ('status',)
+    list_per_page = 15000
+
+
+# E5
+@admin.register(models.E5ScrapeJournal)
+class E5ScrapeJournalAdmin(admin.ModelAdmin):
+    list_display = ('id', 'run', 'stage', 'season', 'slot', 'content_hash', 'date_added')
+    search_fields = ('stage',)
+    list_filter = ('run', 'stage')
+    list_per_page = 15000
+
+
+# E5
+@admin.register(models.E5ScrapeJob)
+class E5ScrapeJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'family', 'season', 'status', 'priority', 'attempts', 'worker', 'heartbeat_at',
+                    'lease_expires_at', 'date_updated')
+    search_fields = ('family', 'worker')
+    list_filter = ('status', 'family')
+    list_per_page = 15000
+
+
+# E5
+@admin.register(models.E5ScrapeReport)
+class E5ScrapeReportAdmin(admin.ModelAdmin):
+    list_display = ('id', 'run', 'benchmark', 'started_at', 'wall_seconds', 'pages', 'bytes', 'fetch_latency_p50_ms',
+                    'fetch_latency_p90_ms', 'rows_parsed', 'rows_skipped', 'rows_written', 'queries',
+                    'pages_per_minute')
+    list_filter = ('benchmark', 'started_at')
+    list_per_page = 15000
+
+
+# E5
+@admin.register(models.E5DataVersion)
+class E5DataVersionAdmin(admin.ModelAdmin):
+    list_display = ('id', 'version', 'date_updated')
+    list_per_page = 15000
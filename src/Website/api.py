@@ -0,0 +1,197 @@
+import datetime
+import hashlib
+import json
+from typing import Any, Callable
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Count, Max, QuerySet
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import require_safe
+
+from .cache import E5PageCache
+from .models import E5DataVersion, E5Fixture, E5League, E5Team, E5TeamRanking
+from .navigation import E5Navigation
+from .stats import E5StatsLoader
+
+API_VERSION: int = 1
+DEFAULT_LIMIT: int = 100
+MAX_LIMIT: int = 1000
+
+# Stat tables by family name, as in /api/v1/league/<league>/<family>
+FAMILIES: dict[str, type[models.Model]] = {"league_table": E5TeamRanking, **E5StatsLoader.MODELS}
+# Columns of the related team returned with every stats row
+TEAM_FIELDS: tuple[str, ...] = ("team__name", "team__slug")
+FIXTURE_FIELDS: tuple[str, ...] = ("home_team__name", "home_team__slug", "away_team__name", "away_team__slug",
+                                   "home_team__season__league__slug")
+
+
+####################################################### HELPERS ########################################################
+# E5
+def error(message: str, status: int) -> JsonResponse:
+    return JsonResponse({"version": API_VERSION, "error": message}, status=status)
+
+
+# E5
+def model_fields(model: type[models.Model]) -> list[str]:
+    # Foreign keys as their column, e.g. team_id, so .values() does not follow them
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+# E5
+def updated_field(model: type[models.Model]) -> str | None:
+    for field in model._meta.concrete_fields:
+        if isinstance(field, models.DateTimeField) and (field.auto_now or field.auto_now_add):
+            return field.name
+    return None
+
+
+# E5
+def select_fields(request: HttpRequest, model: type[models.Model], extra: tuple[str, ...] = ()) -> list[str]:
+    # ?fields=a,b restricts the columns, id is always returned since it is the pagination cursor
+    allowed: list[str] = [*model_fields(model=model), *extra]
+    requested: str = request.GET.get("fields", "")
+    if not requested:
+        return allowed
+
+    fields: list[str] = [field.strip() for field in requested.split(",") if field.strip()]
+    unknown: list[str] = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields {', '.join(unknown)}, expected some of {', '.join(allowed)}")
+    return ["id", *[field for field in fields if field != "id"]]
+
+
+# E5
+def page_bounds(request: HttpRequest) -> tuple[int, int]:
+    # Keyset pagination on id, ?cursor= is the last id of the previous page
+    try:
+        cursor: int = int(request.GET.get("cursor", 0))
+        limit: int = int(request.GET.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ValueError("cursor and limit must be integers")
+    if cursor < 0 or not 0 < limit <= MAX_LIMIT:
+        raise ValueError(f"cursor must be positive and limit between 1 and {MAX_LIMIT}")
+    return cursor, limit
+
+
+# E5
+def last_modified(queryset: QuerySet, model: type[models.Model]) -> tuple[datetime.datetime | None, int]:
+    # Models without a timestamp column change when the scrape pipeline bumps the data version
+    field: str | None = updated_field(model=model)
+    if field is None:
+        stamp: dict[str, Any] = queryset.aggregate(count=Count('id'))
+        return (E5DataVersion.objects.filter(id=E5PageCache.VERSION_ID)
+                .values_list('date_updated', flat=True).first()), stamp["count"]
+    stamp: dict[str, Any] = queryset.aggregate(last=Max(field), count=Count('id'))
+    return stamp["last"], stamp["count"]
+
+
+# E5
+def conditional(request: HttpRequest, etag: str, modified: datetime.datetime | None,
+                build: Callable[[], dict[str, Any]]) -> HttpResponse:
+    # The payload is only built when the client's copy is stale
+    etag = quote_etag(hashlib.md5(f"{API_VERSION}:{request.get_full_path()}:{etag}".encode()).hexdigest())
+    timestamp: int | None = int(modified.timestamp()) if modified is not None else None
+    response: HttpResponse | None = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = JsonResponse({"version": API_VERSION, **build()})
+
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    return response
+
+
+# E5
+def paginated(request: HttpRequest, queryset: QuerySet, model: type[models.Model],
+              extra: tuple[str, ...] = ()) -> HttpResponse:
+    try:
+        fields: list[str] = select_fields(request=request, model=model, extra=extra)
+        cursor, limit = page_bounds(request=request)
+    except ValueError as exception:
+        return error(message=str(exception), status=400)
+
+    modified, count = last_modified(queryset=queryset, model=model)
+
+    def build() -> dict[str, Any]:
+        # Rows straight from .values(), one more than the page to know whether there is a next one
+        rows: list[dict[str, Any]] = list(queryset.filter(id__gt=cursor).order_by('id').values(*fields)[:limit + 1])
+        next_cursor: int | None = rows[limit - 1]["id"] if len(rows) > limit else None
+        return {"count": count, "next_cursor": next_cursor, "results": rows[:limit]}
+
+    return conditional(request=request, etag=f"{count}:{modified.isoformat() if modified else ''}", modified=modified,
+                       build=build)
+
+
+######################################################### INDEX ########################################################
+# E5
+@require_safe
+def api_index(request):
+    return JsonResponse({"version": API_VERSION, "families": list(FAMILIES), "max_limit": MAX_LIMIT})
+
+
+######################################################## LEAGUES #######################################################
+# E5
+@gzip_page
+@require_safe
+def api_leagues(request):
+    return paginated(request=request, queryset=E5League.objects.all(), model=E5League)
+
+
+# E5
+@gzip_page
+@require_safe
+def api_league_stats(request, league_slug: str, family: str):
+    model: type[models.Model] | None = FAMILIES.get(family)
+    if model is None:
+        return error(message=f"Unknown family {family}, expected one of {', '.join(FAMILIES)}", status=404)
+    try:
+        league: E5League = E5Navigation.shared().get_league(request=request, slug=league_slug)
+    except Http404:
+        return error(message=f"Unknown league {league_slug}", status=404)
+
+    return paginated(request=request, queryset=model.objects.filter(team__season__league=league), model=model,
+                     extra=TEAM_FIELDS)
+
+
+######################################################### TEAMS ########################################################
+# E5
+@gzip_page
+@require_safe
+def api_team(request, league_slug: str, team_slug: str):
+    # A team is saved once per season, the active one first then the latest
+    team: dict[str, Any] | None = (E5Team.objects.filter(slug=team_slug, season__league__slug=league_slug)
+                                   .order_by('-season__active', '-season_id')
+                                   .values(*model_fields(model=E5Team)).first())
+    if team is None:
+        return error(message=f"Unknown team {league_slug}/{team_slug}", status=404)
+
+    # ?families=a,b restricts the bundle
+    requested: str = request.GET.get("families", "")
+    families: list[str] = [family.strip() for family in requested.split(",") if family.strip()] or list(FAMILIES)
+    unknown: list[str] = [family for family in families if family not in FAMILIES]
+    if unknown:
+        return error(message=f"Unknown families {', '.join(unknown)}, expected some of {', '.join(FAMILIES)}",
+                     status=400)
+
+    # One row per family, the bundle is small enough to be hashed for its ETag
+    stats: dict[str, dict[str, Any] | None] = {
+        family: FAMILIES[family].objects.filter(team=team["id"]).values(*model_fields(model=FAMILIES[family])).first()
+        for family in families}
+    stamps: list[datetime.datetime] = [row["date_updated"] for row in [team, *stats.values()]
+                                       if row is not None and row.get("date_updated") is not None]
+    payload: dict[str, Any] = {"team": team, "stats": stats}
+    content_hash: str = hashlib.md5(json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True).encode()).hexdigest()
+    return conditional(request=request, etag=content_hash, modified=max(stamps, default=None), build=lambda: payload)
+
+
+######################################################## FIXTURES ######################################################
+# E5
+@gzip_page
+@require_safe
+def api_fixtures(request):
+    return paginated(request=request, queryset=E5Fixture.objects.filter(date__gte=datetime.date.today()),
+                     model=E5Fixture, extra=FIXTURE_FIELDS)
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class WebsiteConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Website'
+
+    # E5
+    def ready(self):
+        # Registers the query path index check
+        from Website import checks  # noqa: F401
+        # Registers the navigation cache invalidation
+        from Website import navigation  # noqa: F401
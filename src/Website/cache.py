@@ -0,0 +1,209 @@
+import dataclasses
+import datetime
+import functools
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, ClassVar, Optional
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db.models import F
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.http import http_date
+
+from .models import E5DataVersion
+
+
+# E5
+@dataclasses.dataclass
+class E5PageCache:
+    SHARED: ClassVar[Optional["E5PageCache"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    # Id of the single E5DataVersion row
+    VERSION_ID: ClassVar[int] = 1
+    PREFIX: ClassVar[str] = "e5page"
+    # Sources pages are built from when E5_BUILD_ID is not set
+    SOURCE_SUFFIXES: ClassVar[tuple[str, ...]] = (".py", ".html", ".css", ".js")
+    POLL_SECONDS: ClassVar[float] = 0.05
+    # max-age and stale-while-revalidate seconds of a view's pages, and whether they also change with the date
+    POLICIES: ClassVar[dict[str, tuple[int, int, bool]]] = {
+        "fixtures": (300, 3600, True),
+        "fixture_details": (300, 3600, True),
+    }
+    # Stats pages only change when a scrape commits
+    DEFAULT_POLICY: ClassVar[tuple[int, int, bool]] = (900, 24 * 3600, False)
+
+    enabled: bool = True
+    alias: str = "default"
+    timeout: int = 24 * 3600
+    # Seconds a page rebuild holds its lock, past that another request may rebuild it
+    lock_seconds: int = 30
+    # Seconds a request waits for another one to build a page that has no stale copy to serve meanwhile
+    wait_seconds: float = 10.0
+    # Deploy the pages are built by, part of their token so a new one rebuilds and revalidates every page
+    build: str = ""
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def key(path: str) -> str:
+        # One entry per url whatever the version, the stale copy is served while the current one is rebuilt
+        return f"{E5PageCache.PREFIX}:{hashlib.sha256(path.encode()).hexdigest()}"
+
+    # E5
+    @staticmethod
+    def lock_key(path: str, token: str) -> str:
+        return f"{E5PageCache.key(path=path)}:lock:{token}"
+
+    # E5
+    @staticmethod
+    def version() -> int:
+        # Read from the database, scrapes run in other processes than the website and may not share its cache
+        version: int | None = (E5DataVersion.objects.filter(id=E5PageCache.VERSION_ID)
+                               .values_list('version', flat=True).first())
+        return version or 0
+
+    # E5
+    @staticmethod
+    def stamp() -> tuple[int, datetime.datetime | None]:
+        # Version and time of the last bump, in one query
+        return (E5DataVersion.objects.filter(id=E5PageCache.VERSION_ID)
+                .values_list('version', 'date_updated').first()) or (0, None)
+
+    # E5
+    @staticmethod
+    def bump() -> None:
+        # update() skips auto_now, date_updated is the Last-Modified of every page and must move with the version
+        updated: int = (E5DataVersion.objects.filter(id=E5PageCache.VERSION_ID)
+                        .update(version=F('version') + 1, date_updated=timezone.now()))
+        if not updated:
+            _, created = E5DataVersion.objects.get_or_create(id=E5PageCache.VERSION_ID, defaults={'version': 1})
+            if not created:
+                (E5DataVersion.objects.filter(id=E5PageCache.VERSION_ID)
+                 .update(version=F('version') + 1, date_updated=timezone.now()))
+
+    # E5
+    @staticmethod
+    def source_stamp() -> str:
+        # Names, sizes and modification times of the website sources, any deploy changing them changes the stamp
+        root: str = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for directory, _, files in sorted(os.walk(root)):
+            for name in sorted(files):
+                if name.endswith(E5PageCache.SOURCE_SUFFIXES):
+                    stat: os.stat_result = os.stat(os.path.join(directory, name))
+                    digest.update(f"{os.path.relpath(os.path.join(directory, name), root)}:{stat.st_size}:"
+                                  f"{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()[:12]
+
+    # E5
+    @staticmethod
+    def cacheable(response: HttpResponse) -> bool:
+        # Errors and responses setting cookies are not shared between visitors
+        return response.status_code == 200 and not response.streaming and not response.cookies
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5PageCache":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls(enabled=getattr(settings, "E5_PAGE_CACHE", True),
+                                 timeout=getattr(settings, "E5_PAGE_CACHE_TIMEOUT", 24 * 3600),
+                                 lock_seconds=getattr(settings, "E5_PAGE_CACHE_LOCK_SECONDS", 30),
+                                 wait_seconds=getattr(settings, "E5_PAGE_CACHE_WAIT_SECONDS", 10.0),
+                                 build=getattr(settings, "E5_BUILD_ID", "") or cls.source_stamp())
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def cache(self) -> BaseCache:
+        return caches[self.alias]
+
+    # E5
+    def get_or_render(self, path: str, token: str, render: Callable[[], HttpResponse]) -> HttpResponse:
+        # Token is the data version the page is built from, with the date for pages listing upcoming fixtures
+        cache: BaseCache = self.cache()
+        key: str = self.key(path=path)
+        entry: tuple[str, str, bytes] | None = cache.get(key)
+        if entry is not None and entry[0] == token:
+            return HttpResponse(content=entry[2], content_type=entry[1])
+
+        # Single flight : only the request holding the lock rebuilds the page of this version
+        lock_key: str = self.lock_key(path=path, token=token)
+        if cache.add(lock_key, True, timeout=self.lock_seconds):
+            try:
+                response: HttpResponse = render()
+                if self.cacheable(response=response):
+                    cache.set(key, (token, response["Content-Type"], response.content), timeout=self.timeout)
+                return response
+            finally:
+                cache.delete(lock_key)
+
+        # Another request is rebuilding it, serve the previous version meanwhile
+        if entry is not None:
+            return HttpResponse(content=entry[2], content_type=entry[1])
+
+        # Never built, wait for the other request rather than rendering the same page again
+        deadline: float = time.monotonic() + self.wait_seconds
+        while time.monotonic() < deadline:
+            time.sleep(self.POLL_SECONDS)
+            # Lock read first, a page cached before the lock was released is then always seen below
+            released: bool = cache.get(lock_key) is None
+            entry = cache.get(key)
+            if entry is not None and entry[0] == token:
+                return HttpResponse(content=entry[2], content_type=entry[1])
+            # The other request is done but did not cache it, e.g. a 404 or an exception, nothing is left to wait for
+            if released:
+                break
+        return render()
+
+    # E5
+    def serve(self, request: HttpRequest, view_name: str, render: Callable[[], HttpResponse]) -> HttpResponse:
+        # Read once per request, the navigation cache checks it too
+        request.data_version, updated = self.stamp()
+        max_age, stale_seconds, daily = self.POLICIES.get(view_name, self.DEFAULT_POLICY)
+
+        # Validators follow the deploy and the data version, pages listing upcoming fixtures also move at midnight
+        token: str = f"{self.build}:{request.data_version}"
+        modified: datetime.datetime | None = updated
+        if daily:
+            today: datetime.date = datetime.date.today()
+            token = f"{token}:{today}"
+            midnight: datetime.datetime = timezone.make_aware(datetime.datetime.combine(today, datetime.time.min))
+            modified = max(modified, midnight) if modified is not None else midnight
+        # One ETag per url, only sent with a page that rendered, so an error url never matches a client's copy
+        path: str = request.get_full_path()
+        etag: str = quote_etag(hashlib.md5(f"{token}:{path}".encode()).hexdigest())
+        timestamp: int | None = int(modified.timestamp()) if modified is not None else None
+
+        # The client's copy is current, nothing is read nor rendered
+        response: HttpResponse | None = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            # Without the server side cache the page is rendered every time, browsers still revalidate it
+            response = self.get_or_render(path=path, token=token, render=render) if self.enabled else render()
+            if not self.cacheable(response=response):
+                return response
+
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        patch_cache_control(response, public=True, max_age=max_age, stale_while_revalidate=stale_seconds)
+        return response
+
+
+# E5
+def cached_page(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    # Pages are rebuilt once per url and per data version, scrapes bump the version when they commit new stats
+    # Browsers and proxies revalidate them against the same version
+    @functools.wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if request.method not in ("GET", "HEAD"):
+            return view(request, *args, **kwargs)
+        return E5PageCache.shared().serve(request=request, view_name=view.__name__,
+                                          render=lambda: view(request, *args, **kwargs))
+    return wrapper
@@ -0,0 +1,80 @@
+import ast
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+from django.db import models
+
+QUERY_METHODS: tuple[str, ...] = ("get", "filter", "exclude", "get_or_create", "update_or_create")
+QUERY_SOURCES: tuple[str, ...] = ("Website", "e5toolbox")
+IGNORED_DIRS: tuple[str, ...] = ("migrations", "__pycache__")
+
+
+# E5
+def leading_columns(model: type[models.Model]) -> set[str]:
+    # A lookup can only use an index whose first column it filters on
+    columns: set[str] = {field.name for field in model._meta.concrete_fields
+                         if field.primary_key or field.unique or field.db_index}
+    columns.update(index.fields[0].lstrip('-') for index in model._meta.indexes if index.fields)
+    columns.update(constraint.fields[0] for constraint in model._meta.constraints
+                   if isinstance(constraint, models.UniqueConstraint) and constraint.fields)
+    columns.update(fields[0] for fields in model._meta.unique_together)
+    return columns
+
+
+# E5
+def query_model_name(node: ast.expr) -> str | None:
+    # Walk down chained calls (E5Team.objects.filter(...).filter(...)) to the model name
+    while isinstance(node, (ast.Call, ast.Attribute)):
+        if isinstance(node, ast.Attribute) and node.attr == "objects" and isinstance(node.value, ast.Name):
+            return node.value.id
+        node = node.func if isinstance(node, ast.Call) else node.value
+    return None
+
+
+# E5
+def query_paths(path: Path) -> list[tuple[str, str, tuple[str, ...], int]]:
+    paths: list[tuple[str, str, tuple[str, ...], int]] = []
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"), filename=str(path))):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in QUERY_METHODS):
+            continue
+        model_name: str | None = query_model_name(node=node.func.value)
+        # Only the first hop of a lookup hits this table, the rest goes through the related table's primary key
+        fields: tuple[str, ...] = tuple(sorted({keyword.arg.split('__')[0] for keyword in node.keywords
+                                                if keyword.arg is not None and keyword.arg != "defaults"}))
+        if model_name is not None and fields:
+            paths.append((model_name, node.func.attr, fields, node.lineno))
+    return paths
+
+
+# E5
+# Runs with every check, runserver and test run, parsing the sources takes a fraction of a second
+@checks.register(checks.Tags.models)
+def check_query_paths_are_indexed(app_configs=None, **kwargs) -> list[checks.CheckMessage]:
+    base_dir: Path = Path(settings.BASE_DIR)
+    website_models: dict[str, type[models.Model]] = {model.__name__: model
+                                                     for model in apps.get_app_config('Website').get_models()}
+
+    errors: list[checks.CheckMessage] = []
+    for source in QUERY_SOURCES:
+        for path in sorted((base_dir / source).rglob("*.py")):
+            if any(part in IGNORED_DIRS for part in path.parts):
+                continue
+            for model_name, method, fields, lineno in query_paths(path=path):
+                model: type[models.Model] | None = website_models.get(model_name)
+                if model is None:
+                    continue
+                # season_id=... filters on the same column as season=...
+                attnames: dict[str, str] = {field.attname: field.name for field in model._meta.concrete_fields}
+                if leading_columns(model=model).intersection(attnames.get(field, field) for field in fields):
+                    continue
+                errors.append(checks.Error(
+                    f"{model_name}.objects.{method}() on {', '.join(fields)} is not covered by any index "
+                    f"({path.relative_to(base_dir)}:{lineno})",
+                    hint="Add a models.Index or a UniqueConstraint leading with one of these fields to the model's Meta "
+                         "and generate its migration.",
+                    obj=model,
+                    id='Website.E001'))
+    return errors
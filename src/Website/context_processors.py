@@ -0,0 +1,11 @@
+import functools
+
+from django.http import HttpRequest
+
+from .navigation import E5Navigation
+
+
+# E5
+def navigation(request: HttpRequest) -> dict:
+    # Templates call it on first use, pages without the league menu never load it
+    return {'nav_leagues': functools.partial(E5Navigation.shared().get_leagues, request=request)}
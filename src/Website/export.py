@@ -0,0 +1,147 @@
+import dataclasses
+import datetime
+import logging
+import os
+import tempfile
+from typing import ClassVar, Iterable
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import URLPattern, resolve, reverse
+
+from .models import E5Fixture, E5Season, E5SeasonFreshness, E5Team
+from .urls import urlpatterns
+
+
+# E5
+@dataclasses.dataclass
+class E5StaticExporter:
+    # Every page is saved as <path>/index.html, served by nginx with try_files $uri $uri/index.html
+    PAGE_NAME: ClassVar[str] = "index.html"
+    # Routes of Website/urls.py that are not html pages
+    SKIPPED_PREFIX: ClassVar[str] = "Website-api_"
+
+    output: str
+    written: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def route_names(params: set[str]) -> list[str]:
+        # Page routes taking exactly these url parameters, e.g. {'league_slug'} for every league stat page
+        return [pattern.name for pattern in urlpatterns
+                if isinstance(pattern, URLPattern) and pattern.name
+                and not pattern.name.startswith(E5StaticExporter.SKIPPED_PREFIX)
+                and set(pattern.pattern.converters) == params]
+
+    # E5
+    @staticmethod
+    def changed_leagues(since: datetime.datetime) -> list[str]:
+        # Leagues with a season parsed since then, the freshness of a family is recorded once its parse succeeded
+        parsed: set[str] = set(E5SeasonFreshness.objects.filter(season__active=True, date_updated__gte=since)
+                               .values_list('season__league__slug', flat=True))
+        # And leagues with new upcoming fixtures, the /fixtures page links to their pages whether stats changed or not
+        scheduled: set[str] = set(E5Fixture.objects.filter(date__gte=datetime.date.today(), date_added__gte=since)
+                                  .values_list('home_team__season__league__slug', flat=True))
+        return sorted((parsed | scheduled) - {None})
+
+    # E5
+    @staticmethod
+    def paths(leagues: Iterable[str] | None = None) -> list[str]:
+        # Every page of the active data, or of the given leagues plus the pages listing all of them
+        active: set[str] = set(E5Season.objects.filter(active=True).values_list('league__slug', flat=True)) - {None}
+        slugs: set[str] = active if leagues is None else active.intersection(leagues)
+
+        teams = E5Team.objects.filter(season__active=True, season__league__slug__in=slugs)
+        fixtures = E5Fixture.objects.filter(date__gte=datetime.date.today(), home_team__season__league__slug__in=slugs)
+
+        paths: list[str] = [reverse(name) for name in E5StaticExporter.route_names(params=set())]
+        paths.extend(reverse(name, kwargs={'league_slug': slug})
+                     for slug in sorted(slugs) for name in E5StaticExporter.route_names(params={'league_slug'}))
+        paths.extend(reverse('Website-team_details', kwargs={'league_slug': league_slug, 'team_slug': team_slug})
+                     for league_slug, team_slug in teams.values_list('season__league__slug', 'slug') if team_slug)
+        paths.extend(reverse('Website-fixture_details', kwargs={'fixture_slug': slug})
+                     for slug in fixtures.values_list('slug', flat=True) if slug)
+        return paths
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def from_settings(cls, output: str | None = None) -> "E5StaticExporter":
+        return cls(output=output or str(getattr(settings, "E5_STATIC_EXPORT_DIR", "static_site")))
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def fullpath(self, path: str) -> str:
+        return os.path.join(self.output, path.strip("/"), self.PAGE_NAME)
+
+    # E5
+    def render(self, path: str) -> bytes | None:
+        # Through the view itself, the same response the website would serve
+        try:
+            match = resolve(path)
+            response: HttpResponse = match.func(RequestFactory().get(path), *match.args, **match.kwargs)
+        except Exception as ex:
+            logging.warning(msg=f"E5StaticExporter.render() : {path} : {type(ex).__name__} : {ex}")
+            return None
+        if response.status_code != 200:
+            logging.warning(msg=f"E5StaticExporter.render() : {path} : status {response.status_code}")
+            return None
+        return response.content
+
+    # E5
+    def write(self, fullpath: str, content: bytes) -> None:
+        # Unchanged pages keep their file, changed ones are swapped in at once so nginx never serves half a page
+        try:
+            with open(fullpath, "rb") as file:
+                if file.read() == content:
+                    self.unchanged += 1
+                    return
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(fullpath), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(fullpath), prefix=".", suffix=".tmp",
+                                         delete=False) as file:
+            file.write(content)
+        os.chmod(file.name, 0o644)
+        os.replace(file.name, fullpath)
+        self.written += 1
+
+    # E5
+    def prune(self, kept: set[str]) -> None:
+        # Pages that are no longer part of the site, e.g. fixtures already played
+        for root, _, files in os.walk(self.output, topdown=False):
+            for name in files:
+                fullpath: str = os.path.join(root, name)
+                if name == self.PAGE_NAME and fullpath not in kept:
+                    os.remove(fullpath)
+                    self.removed += 1
+            if root != self.output and not os.listdir(root):
+                os.rmdir(root)
+
+    # E5
+    def export(self, leagues: Iterable[str] | None = None) -> None:
+        # Without leagues the whole site is exported and the pages that disappeared are removed
+        kept: set[str] = set()
+        for path in self.paths(leagues=leagues):
+            # A page that failed to render keeps its previous export
+            fullpath: str = self.fullpath(path=path)
+            kept.add(fullpath)
+            content: bytes | None = self.render(path=path)
+            if content is None:
+                self.failed += 1
+                continue
+            self.write(fullpath=fullpath, content=content)
+
+        if leagues is None:
+            self.prune(kept=kept)
+        logging.info(msg=f"E5StaticExporter.export() : {self.summary()}")
+
+    # E5
+    def summary(self) -> str:
+        return f"{self.written} written, {self.unchanged} unchanged, {self.removed} removed, {self.failed} failed"
@@ -0,0 +1,75 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from Website.models import E5ScrapeReport
+from e5toolbox.scrapper.E5PageArchive import E5PageArchive
+from e5toolbox.scrapper.E5Pipeline import E5Pipeline
+
+
+# E5
+class E5ParseCommand(BaseCommand):
+    # Scrape commands that can record their pages, or replay them as a benchmark
+
+    def add_arguments(self, parser):
+        parser.add_argument('--benchmark', action='store_true',
+                            help="Replay the page archive, no browser nor network, and report the parse and upsert "
+                                 "throughput against the previous benchmark")
+        parser.add_argument('--record', action='store_true',
+                            help="Save every page scraped by this run to the page archive")
+        parser.add_argument('--archive', type=str, default=None,
+                            help="Page archive directory, defaults to E5_PAGE_ARCHIVE_DIR")
+        parser.add_argument('--full', action='store_true',
+                            help="Parse every active season, even those without new matches since their last parse, "
+                                 "e.g. after a parser fix")
+
+    # E5
+    @staticmethod
+    def get_pipeline(options: dict) -> E5Pipeline:
+        benchmark: bool = options.get('benchmark', False)
+        archive_mode: str | None = None
+        if benchmark:
+            archive_mode = E5PageArchive.MODE_REPLAY
+        elif options.get('record', False):
+            archive_mode = E5PageArchive.MODE_RECORD
+
+        # A benchmark parses the whole corpus, seasons without new matches are not skipped
+        return E5Pipeline.from_settings(full=benchmark or options.get('full', False), archive_mode=archive_mode,
+                                        archive_path=options.get('archive'))
+
+    # E5
+    def run_stage(self, options: dict, stage: str, **stage_options: Any) -> bool:
+        # Stage is the name of an E5Pipeline stage, called with stage_options
+        pipeline: E5Pipeline = self.get_pipeline(options=options)
+        success: bool = False
+        try:
+            success = getattr(pipeline, stage)(**stage_options)
+        finally:
+            report: E5ScrapeReport | None = pipeline.close(success=success)
+
+        if options.get('benchmark', False):
+            self.write_benchmark(report=report)
+        return success
+
+    # E5
+    def write_benchmark(self, report: E5ScrapeReport | None) -> None:
+        if report is None:
+            self.stdout.write("Benchmark : nothing was replayed")
+            return
+
+        previous_reports: list[E5ScrapeReport] = list(E5ScrapeReport.objects.filter(benchmark=True)
+                                                      .exclude(id=report.id).order_by('-started_at')[:20])
+        for name, stage in report.report.get("stages", {}).items():
+            rows_per_second: float = stage["rows_written"] / stage["wall_seconds"] if stage["wall_seconds"] else 0.0
+            line: str = (f"Benchmark {name} : {stage['pages']} pages, {stage['rows_parsed']} rows parsed, "
+                         f"{stage['rows_written']} rows written, {stage['queries']} queries in "
+                         f"{stage['wall_seconds']:.3f}s ({rows_per_second:.1f} rows/s)")
+
+            # Latest benchmark of the same stage
+            for previous_report in previous_reports:
+                previous: dict | None = previous_report.report.get("stages", {}).get(name)
+                if previous is not None:
+                    line += (f", previous : {previous['wall_seconds']:.3f}s on "
+                             f"{previous_report.started_at:%Y-%m-%d %H:%M}")
+                    break
+            self.stdout.write(line)
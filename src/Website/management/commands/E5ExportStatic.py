@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from Website.export import E5StaticExporter
+from Website.models import E5ScrapeRun
+
+
+# E5
+class Command(BaseCommand):
+    help = "Export Static Site"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', type=str, default=None,
+                            help="Directory of the exported pages, defaults to E5_STATIC_EXPORT_DIR")
+        parser.add_argument('--leagues', nargs='+', type=str, default=None,
+                            help="Only export the pages of these league slugs, and the pages listing every league")
+        parser.add_argument('--changed', action='store_true',
+                            help="Only export the pages of the leagues parsed since the latest scrape run started")
+
+    # E5
+    def handle(self, *args, **options):
+        exporter: E5StaticExporter = E5StaticExporter.from_settings(output=options.get('output'))
+
+        # Whole site unless told which leagues changed
+        leagues: list[str] | None = options.get('leagues')
+        if options.get('changed', False):
+            run: E5ScrapeRun | None = E5ScrapeRun.objects.order_by('-started_at').first()
+            leagues = exporter.changed_leagues(since=run.started_at) if run is not None else []
+
+        exporter.export(leagues=leagues)
+        self.stdout.write(f"Export Static Site : {exporter.summary()}")
@@ -1,376 +1,103 @@
 import datetime
 
-from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from Website.export import E5StaticExporter
+from Website.models import E5Season
+from e5toolbox.scrapper.E5JobQueue import E5JobQueue
+from e5toolbox.scrapper.E5PageArchive import E5PageArchive
+from e5toolbox.scrapper.E5Pipeline import E5Pipeline
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
+from e5toolbox.scrapper.E5Scheduler import E5Task
 
 
 # E5
 class Command(BaseCommand):
     help = "Get All"
 
+    def add_arguments(self, parser):
+        parser.add_argument('--families', nargs='+', type=str,
+                            help=f"Stats families to refresh, 'all' or some of : "
+                                 f"{', '.join(E5ScrapeGraph.family_names())}. Defaults to all of them, "
+                                 f"or to the families of the day with --scheduled")
+        parser.add_argument('--scheduled', action='store_true',
+                            help="Without --families, only refresh the families of the weekday schedule, "
+                                 "defaults to E5_FAMILY_SCHEDULE")
+        parser.add_argument('--parallelism', type=int, default=None,
+                            help="Number of steps running at once, defaults to E5_SCHEDULER_PARALLELISM")
+        parser.add_argument('--full', action='store_true',
+                            help="Parse every active season, even those without new matches since their last parse")
+        parser.add_argument('--resume', action='store_true',
+                            help="Continue the last unfinished run of the window, skipping the work it completed")
+        parser.add_argument('--max-seasons', type=int, default=None,
+                            help="Only scrape the seasons with the soonest fixtures, "
+                                 "defaults to E5_PRIORITY_MAX_SEASONS")
+        parser.add_argument('--horizon-hours', type=int, default=None,
+                            help="Only scrape the seasons with a fixture within these hours, "
+                                 "defaults to E5_PRIORITY_HORIZON_HOURS")
+        parser.add_argument('--record', action='store_true',
+                            help="Save every page scraped by this run to the page archive, "
+                                 "E5Parse* --benchmark replays it")
+        parser.add_argument('--enqueue', action='store_true',
+                            help="Run the core steps here, then queue a job per (family, active season) for "
+                                 "E5ScrapeWorker instead of scraping the families in this process")
+        parser.add_argument('--export', action='store_true',
+                            help="Export the static site pages of the leagues this run parsed, see E5ExportStatic")
+
     # E5
     def handle(self, *args, **options):
-        # Get Day of today
-        today = datetime.datetime.now().weekday()
-
-        ################################################### ALL DAYS ###################################################
-        # Get Leagues OK
-        call_command(command_name="E5Parser", str_error_context="Get Leagues")
-
-        # Get Seasons OK
-        call_command(command_name="E5Parser", str_error_context="Get Seasons")
-
-        # Get League Table Iframes OK
-        call_command(command_name="E5Parser", str_endpoint="/", str_error_context="Get League Table Iframes",
-                     int_iframe_length=1, str_save_message="League Table Iframe", str_class="E5LeagueTableIframe")
-
-        # Parse League Table Iframes
-        call_command(command_name="E5ParseLeagueTableIframes")
-
-        # Get Teams
-        call_command(command_name="E5Parser", str_error_context="Get Teams")
-
-        # Get Upcoming Fixtures
-        call_command(command_name="E5Parser", str_error_context="Get Upcoming Matches")
-
-        #################################################### MONDAY ####################################################
-        if today == 0:
-            # Get BTTS Iframes
-            call_command(command_name="E5Parser", str_endpoint="btts/", str_error_context="Get BTTS Iframes",
-                         int_iframe_length=5, str_save_message="BTTS Iframe", str_class="E5BttsIframes")
-
-            # Parse BTTS Iframes
-            call_command(command_name="E5ParseBttsIframes")
-
-            # Get Over 0.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-0-5-goals/",
-                         str_error_context="Get Over 0.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 0.5 Goals Iframe", str_class="E5Over05GoalsIframe")
-
-            # Parse Over 0.5 Goals Iframes
-            call_command(command_name="E5ParseOver05GoalsIframes")
-
-            # Get Over 1.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-1-5-goals/",
-                         str_error_context="Get Over 1.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 1.5 Goals Iframe", str_class="E5Over15GoalsIframe")
-
-            # Parse Over 1.5 Goals Iframes
-            call_command(command_name="E5ParseOver15GoalsIframes")
-
-            # Get Over 2.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-2-5-goals/",
-                         str_error_context="Get Over 2.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 2.5 Goals Iframe", str_class="E5Over25GoalsIframe")
-
-            # Parse Over 2.5 Goals Iframes
-            call_command(command_name="E5ParseOver25GoalsIframes")
-
-            # Get Average Team Goal Iframes
-            call_command(command_name="E5Parser", str_endpoint="amr/",
-                         str_error_context="Get Average Team Goal Iframes", int_iframe_length=1,
-                         str_save_message="Average Team Goal Iframe", str_class="E5AverageTeamGoalsIframe")
-
-            # Parse Average Team Goal Iframes
-            call_command(command_name="E5ParseAverageTeamGoalsIframes")
-
-        ################################################### TUESDAY ####################################################
-        elif today == 1:  # 17
-            # Get Corners Iframes
-            call_command(command_name="E5Parser", str_endpoint="corners/", str_error_context="Get Corners Iframes",
-                         int_iframe_length=9, str_save_message="Corners Iframe", str_class="E5CornersIframes")
-
-            # Parse Corners Iframes
-            call_command(command_name="E5ParseCornersIframes")
-
-            # Get Cards Iframes
-            call_command(command_name="E5Parser", str_endpoint="cards/", str_error_context="Get Cards Iframes",
-                         int_iframe_length=4, str_save_message="Cards Iframe", str_class="E5CardsIframes")
-
-            # Parse Cards Iframes
-            call_command(command_name="E5ParseCardsIframes")
-
-            # Get Half Time Full Time Iframes
-            call_command(command_name="E5Parser", str_endpoint="half-time-full-time/",
-                         str_error_context="Get Half Time Full Time Iframes", int_iframe_length=1,
-                         str_save_message="Half Time Full Time Iframe", str_class="E5HalfTimeFullTimeIframe")
-
-            # Parse Half Time Full Time Iframes
-            call_command(command_name="E5ParseHalfTimeFullTimeIframes")
-
-            # Get 1st 2nd Half Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="1st-2nd-half-goals/",
-                         str_error_context="Get 1st 2nd Half Goals Iframes", int_iframe_length=3,
-                         str_save_message="1st 2nd Half Goals Iframe", str_class="E51st2ndHalfGoalsIframe")
-
-            # Parse 1st 2nd Half Goals Iframes
-            call_command(command_name="E5Parse1st2ndHalfGoalsIframes")
-
-            # Get Average First Goal Time Iframes
-            call_command(command_name="E5Parser", str_endpoint="agt/",
-                         str_error_context="Get Average First Goal Time Iframes", int_iframe_length=1,
-                         str_save_message="Average First Goal Time Iframe", str_class="E5Average1stGoalTimeIframe")
-
-            # Parse Average First Goal Time Iframes
-            call_command(command_name="E5ParseAverageFirstGoalTimeIframes")
-
-            # Get Early Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="early/",
-                         str_error_context="Get Early Goals Iframes", int_iframe_length=1,
-                         str_save_message="Early Goals Iframe", str_class="E5EarlyGoalsIframe")
-
-            # Parse Early Goals Iframes
-            call_command(command_name="E5ParseEarlyGoalsIframes")
-
-        ################################################## WEDNESDAY ###################################################
-        elif today == 2:  # 10
-            # Get Over 3.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-3-5-goals/",
-                         str_error_context="Get Over 3.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 3.5 Goals Iframe", str_class="E5Over35GoalsIframe")
-
-            # Parse Over 3.5 Goals Iframes
-            call_command(command_name="E5ParseOver35GoalsIframes")
-
-            # Get Win Draw Loss Percentage Iframes
-            call_command(command_name="E5Parser", str_endpoint="wdl/",
-                         str_error_context="Get Win Draw Loss Percentage Iframes", int_iframe_length=1,
-                         str_save_message="Win Draw Loss Percentage Iframe", str_class="E5WinDrawLossPercentageIframe")
-
-            # Parse Win Draw Loss Percentage Iframes
-            call_command(command_name="E5ParseWinDrawLossPercentageIframes")
-
-            # Get Scored Both Halves Iframes
-            call_command(command_name="E5Parser", str_endpoint="sbh/",
-                         str_error_context="Get Scored Both Halves Iframes", int_iframe_length=2,
-                         str_save_message="Scored Both Halves Iframe", str_class="E5ScoredBothHalfIframes")
-
-            # Parse Scored Both Halves Iframes
-            call_command(command_name="E5ParseScoredBothHalvesIframes")
-
-            # Get Won Both Halves Iframes
-            call_command(command_name="E5Parser", str_endpoint="wbh/",
-                         str_error_context="Get Won Both Halves Iframes", int_iframe_length=2,
-                         str_save_message="Won Both Halves Iframe", str_class="E5WonBothHalfIframes")
-
-            # Parse Won Both Halves Iframes
-            call_command(command_name="E5ParseWonBothHalvesIframes")
-
-            # Get Rescued Points Iframes
-            call_command(command_name="E5Parser", str_endpoint="rescued-points/",
-                         str_error_context="Get Rescued Points Iframes", int_iframe_length=1,
-                         str_save_message="Rescued Points Iframe", str_class="E5RescuedPointsIframe")
-
-            # Parse Rescued Points Iframes
-            call_command(command_name="E5ParseRescuedPointsIframes")
-
-            # Get Clean Sheet Iframes
-            call_command(command_name="E5Parser", str_endpoint="clean-sheets/",
-                         str_error_context="Get Clean Sheet Iframes", int_iframe_length=2,
-                         str_save_message="Clean Sheet Iframe", str_class="E5CleanSheetIframe")
-
-            # Parse Clean Sheet Iframes
-            call_command(command_name="E5ParseCleanSheetsIframes")
-
-            # Get Won To Nil Iframes
-            call_command(command_name="E5Parser", str_endpoint="wtn/",
-                         str_error_context="Get Won To Nil Iframes", int_iframe_length=2,
-                         str_save_message="Won To Nil Iframe", str_class="E5WonToNilIframe")
-
-            # Parse Won To Nil Iframes
-            call_command(command_name="E5ParseWonToNilIframes")
-
-            # Get Win Loss Margin Iframes
-            call_command(command_name="E5Parser", str_endpoint="winloss/",
-                         str_error_context="Get Win Loss Margin Iframes", int_iframe_length=2,
-                         str_save_message="Win Loss Margin Iframe", str_class="E5WinLossMarginIframe")
-
-            # Parse Win Loss Margin Iframes
-            call_command(command_name="E5ParseWinLossMarginIframes")
-
-            # Get Scored First Iframes
-            call_command(command_name="E5Parser", str_endpoint="sf/",
-                         str_error_context="Get Scored First Iframes", int_iframe_length=2,
-                         str_save_message="Scored First Iframe", str_class="E5ScoredFirstIframe")
-
-            # Parse Scored First Iframes
-            call_command(command_name="E5ParseScoredFirstIframes")
-
-            # Get Late Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="late/",
-                         str_error_context="Get Late Goals Iframes", int_iframe_length=1,
-                         str_save_message="Late Goals Iframe", str_class="E5LateGoalsIframe")
-
-            # Parse Late Goals Iframes
-            call_command(command_name="E5ParseLateGoalsIframes")
-
-        ################################################### THURSDAY ###################################################
-        elif today == 3:
-            # Get BTTS Iframes
-            call_command(command_name="E5Parser", str_endpoint="btts/", str_error_context="Get BTTS Iframes",
-                         int_iframe_length=5, str_save_message="BTTS Iframe", str_class="E5BttsIframes")
-
-            # Parse BTTS Iframes
-            call_command(command_name="E5ParseBttsIframes")
-
-            # Get Over 0.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-0-5-goals/",
-                         str_error_context="Get Over 0.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 0.5 Goals Iframe", str_class="E5Over05GoalsIframe")
-
-            # Parse Over 0.5 Goals Iframes
-            call_command(command_name="E5ParseOver05GoalsIframes")
-
-            # Get Over 1.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-1-5-goals/",
-                         str_error_context="Get Over 1.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 1.5 Goals Iframe", str_class="E5Over15GoalsIframe")
-
-            # Parse Over 1.5 Goals Iframes
-            call_command(command_name="E5ParseOver15GoalsIframes")
-
-            # Get Over 2.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-2-5-goals/",
-                         str_error_context="Get Over 2.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 2.5 Goals Iframe", str_class="E5Over25GoalsIframe")
-
-            # Parse Over 2.5 Goals Iframes
-            call_command(command_name="E5ParseOver25GoalsIframes")
-
-            # Get Average Team Goal Iframes
-            call_command(command_name="E5Parser", str_endpoint="amr/",
-                         str_error_context="Get Average Team Goal Iframes", int_iframe_length=1,
-                         str_save_message="Average Team Goal Iframe", str_class="E5AverageTeamGoalsIframe")
-
-            # Parse Average Team Goal Iframes
-            call_command(command_name="E5ParseAverageTeamGoalsIframes")
-
-        #################################################### FRIDAY ####################################################
-        elif today == 4:
-            # Get Corners Iframes
-            call_command(command_name="E5Parser", str_endpoint="corners/", str_error_context="Get Corners Iframes",
-                         int_iframe_length=9, str_save_message="Corners Iframe", str_class="E5CornersIframes")
-
-            # Parse Corners Iframes
-            call_command(command_name="E5ParseCornersIframes")
-
-            # Get Cards Iframes
-            call_command(command_name="E5Parser", str_endpoint="cards/", str_error_context="Get Cards Iframes",
-                         int_iframe_length=4, str_save_message="Cards Iframe", str_class="E5CardsIframes")
-
-            # Parse Cards Iframes
-            call_command(command_name="E5ParseCardsIframes")
-
-            # Get Half Time Full Time Iframes
-            call_command(command_name="E5Parser", str_endpoint="half-time-full-time/",
-                         str_error_context="Get Half Time Full Time Iframes", int_iframe_length=1,
-                         str_save_message="Half Time Full Time Iframe", str_class="E5HalfTimeFullTimeIframe")
-
-            # Parse Half Time Full Time Iframes
-            call_command(command_name="E5ParseHalfTimeFullTimeIframes")
-
-            # Get 1st 2nd Half Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="1st-2nd-half-goals/",
-                         str_error_context="Get 1st 2nd Half Goals Iframes", int_iframe_length=3,
-                         str_save_message="1st 2nd Half Goals Iframe", str_class="E51st2ndHalfGoalsIframe")
-
-            # Parse 1st 2nd Half Goals Iframes
-            call_command(command_name="E5Parse1st2ndHalfGoalsIframes")
-
-            # Get Average First Goal Time Iframes
-            call_command(command_name="E5Parser", str_endpoint="agt/",
-                         str_error_context="Get Average First Goal Time Iframes", int_iframe_length=1,
-                         str_save_message="Average First Goal Time Iframe", str_class="E5Average1stGoalTimeIframe")
-
-            # Parse Average First Goal Time Iframes
-            call_command(command_name="E5ParseAverageFirstGoalTimeIframes")
-
-            # Get Early Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="early/",
-                         str_error_context="Get Early Goals Iframes", int_iframe_length=1,
-                         str_save_message="Early Goals Iframe", str_class="E5EarlyGoalsIframe")
-
-            # Parse Early Goals Iframes
-            call_command(command_name="E5ParseEarlyGoalsIframes")
-
-        ################################################### SATURDAY ###################################################
-        elif today == 5:
-            # Get Over 3.5 Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="over-3-5-goals/",
-                         str_error_context="Get Over 3.5 Goals Iframes", int_iframe_length=4,
-                         str_save_message="Over 3.5 Goals Iframe", str_class="E5Over35GoalsIframe")
-
-            # Parse Over 3.5 Goals Iframes
-            call_command(command_name="E5ParseOver35GoalsIframes")
-
-            # Get Win Draw Loss Percentage Iframes
-            call_command(command_name="E5Parser", str_endpoint="wdl/",
-                         str_error_context="Get Win Draw Loss Percentage Iframes", int_iframe_length=1,
-                         str_save_message="Win Draw Loss Percentage Iframe", str_class="E5WinDrawLossPercentageIframe")
-
-            # Parse Win Draw Loss Percentage Iframes
-            call_command(command_name="E5ParseWinDrawLossPercentageIframes")
-
-            # Get Scored Both Halves Iframes
-            call_command(command_name="E5Parser", str_endpoint="sbh/",
-                         str_error_context="Get Scored Both Halves Iframes", int_iframe_length=2,
-                         str_save_message="Scored Both Halves Iframe", str_class="E5ScoredBothHalfIframes")
-
-            # Parse Scored Both Halves Iframes
-            call_command(command_name="E5ParseScoredBothHalvesIframes")
-
-            # Get Won Both Halves Iframes
-            call_command(command_name="E5Parser", str_endpoint="wbh/",
-                         str_error_context="Get Won Both Halves Iframes", int_iframe_length=2,
-                         str_save_message="Won Both Halves Iframe", str_class="E5WonBothHalfIframes")
-
-            # Parse Won Both Halves Iframes
-            call_command(command_name="E5ParseWonBothHalvesIframes")
-
-            # Get Rescued Points Iframes
-            call_command(command_name="E5Parser", str_endpoint="rescued-points/",
-                         str_error_context="Get Rescued Points Iframes", int_iframe_length=1,
-                         str_save_message="Rescued Points Iframe", str_class="E5RescuedPointsIframe")
-
-            # Parse Rescued Points Iframes
-            call_command(command_name="E5ParseRescuedPointsIframes")
-
-            # Get Clean Sheet Iframes
-            call_command(command_name="E5Parser", str_endpoint="clean-sheets/",
-                         str_error_context="Get Clean Sheet Iframes", int_iframe_length=2,
-                         str_save_message="Clean Sheet Iframe", str_class="E5CleanSheetIframe")
-
-            # Parse Clean Sheet Iframes
-            call_command(command_name="E5ParseCleanSheetsIframes")
-
-            # Get Won To Nil Iframes
-            call_command(command_name="E5Parser", str_endpoint="wtn/",
-                         str_error_context="Get Won To Nil Iframes", int_iframe_length=2,
-                         str_save_message="Won To Nil Iframe", str_class="E5WonToNilIframe")
-
-            # Parse Won To Nil Iframes
-            call_command(command_name="E5ParseWonToNilIframes")
-
-            # Get Win Loss Margin Iframes
-            call_command(command_name="E5Parser", str_endpoint="winloss/",
-                         str_error_context="Get Win Loss Margin Iframes", int_iframe_length=2,
-                         str_save_message="Win Loss Margin Iframe", str_class="E5WinLossMarginIframe")
-
-            # Parse Win Loss Margin Iframes
-            call_command(command_name="E5ParseWinLossMarginIframes")
-
-            # Get Scored First Iframes
-            call_command(command_name="E5Parser", str_endpoint="sf/",
-                         str_error_context="Get Scored First Iframes", int_iframe_length=2,
-                         str_save_message="Scored First Iframe", str_class="E5ScoredFirstIframe")
-
-            # Parse Scored First Iframes
-            call_command(command_name="E5ParseScoredFirstIframes")
-
-            # Get Late Goals Iframes
-            call_command(command_name="E5Parser", str_endpoint="late/",
-                         str_error_context="Get Late Goals Iframes", int_iframe_length=1,
-                         str_save_message="Late Goals Iframe", str_class="E5LateGoalsIframe")
-
-            # Parse Late Goals Iframes
-            call_command(command_name="E5ParseLateGoalsIframes")
+        # Get families, seasons without new matches are skipped inside each family
+        families: list[str] | None = options.get('families')
+        if families is None and (options.get('scheduled', False) or settings.E5_FAMILY_SCHEDULE):
+            families = E5ScrapeGraph.scheduled_family_names(weekday=timezone.localdate().weekday())
+        elif families is None or "all" in families:
+            families = E5ScrapeGraph.family_names()
+
+        # Build the dependency graph
+        try:
+            tasks: list[E5Task] = E5ScrapeGraph.build(families=families)
+        except ValueError as ex:
+            raise CommandError(str(ex))
+        # Producer mode : the families are left to the workers claiming the queued jobs
+        enqueue: bool = options.get('enqueue', False)
+        if enqueue and options.get('export', False):
+            # The workers parse the families later on, there would be nothing new to export yet
+            raise CommandError("--export cannot be used with --enqueue, run E5ExportStatic once the workers are done")
+        if enqueue:
+            tasks = E5ScrapeGraph.core_tasks()
+
+        # Run every stage in this process, independent branches concurrently
+        pipeline: E5Pipeline = E5Pipeline.from_settings(parallelism=options.get('parallelism'),
+                                                        full=options.get('full', False),
+                                                        max_seasons=options.get('max_seasons'),
+                                                        horizon_hours=options.get('horizon_hours'),
+                                                        archive_mode=E5PageArchive.MODE_RECORD
+                                                        if options.get('record', False) else None)
+        seasons: list[E5Season] = []
+        started_at: datetime.datetime = timezone.now()
+        try:
+            pipeline.run(tasks=tasks, resume=options.get('resume', False))
+            # Queued in the run's season order and bounds, close() restores the default bounds
+            if enqueue:
+                seasons = pipeline.context.prioritizer.order_seasons(seasons=E5Season.objects.filter(active=True))
+        finally:
+            # An interrupted or partly failed run stays resumable
+            incomplete: list[str] = pipeline.incomplete(tasks=tasks)
+            pipeline.close(success=not incomplete)
+
+        if enqueue and not incomplete:
+            queue: E5JobQueue = E5JobQueue.from_settings()
+            jobs: int = sum(queue.enqueue(family=family, seasons=seasons) for family in families)
+            self.stdout.write(f"Get All queued {jobs} jobs, queue : {queue.counts()}")
+        elif incomplete:
+            self.stdout.write(f"Get All done, {len(incomplete)} steps did not complete : {', '.join(incomplete)}")
+        else:
+            self.stdout.write("Get All done Successfully")
+
+        # Only the pages of the leagues with new stats are rendered again
+        if options.get('export', False):
+            exporter: E5StaticExporter = E5StaticExporter.from_settings()
+            exporter.export(leagues=exporter.changed_leagues(since=started_at))
+            self.stdout.write(f"Export Static Site : {exporter.summary()}")
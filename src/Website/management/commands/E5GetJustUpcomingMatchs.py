@@ -1,8 +1,7 @@
-import datetime
-
-from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
+from e5toolbox.scrapper.E5Pipeline import E5Pipeline
+
 
 # E5
 class Command(BaseCommand):
@@ -11,5 +10,10 @@ class Command(BaseCommand):
     # E5
     def handle(self, *args, **options):
         # Get Upcoming Fixtures
-        call_command(command_name="E5Parser", str_error_context="Get Upcoming Matches")
-
+        pipeline: E5Pipeline = E5Pipeline.from_settings()
+        success: bool = False
+        try:
+            success = pipeline.get_upcoming_matches()
+        finally:
+            # Saves the telemetry report and quits the pooled browsers
+            pipeline.close(success=success)
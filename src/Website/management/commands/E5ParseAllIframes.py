@@ -1,84 +1,32 @@
-from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from Website.management.E5ParseCommand import E5ParseCommand
+from Website.models import E5ScrapeReport
+from e5toolbox.scrapper.E5Pipeline import E5Pipeline
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
+from e5toolbox.scrapper.E5Scheduler import E5Task
 
 
 # E5
-class Command(BaseCommand):
+class Command(E5ParseCommand):
     help = "Parse all iframes"
 
     # E5
     def handle(self, *args, **options):
-        # Get Leagues
-        call_command(command_name="E5Parser", str_error_context="Get Leagues")
-
-        # Get Seasons
-        call_command(command_name="E5Parser", str_error_context="Get Seasons")
-
-        # Get Teams
-        call_command(command_name="E5Parser", str_error_context="Get Teams")
-
-        # Parse League Table Iframes
-        call_command(command_name="E5ParseLeagueTableIframes")
-
-        # Parse BTTS Iframes
-        call_command(command_name="E5ParseBttsIframes")
-
-        # Parse Over 0.5 Goals Iframes
-        call_command(command_name="E5ParseOver05GoalsIframes")
-
-        # Parse Over 1.5 Goals Iframes
-        call_command(command_name="E5ParseOver15GoalsIframes")
-
-        # Parse Over 2.5 Goals Iframes
-        call_command(command_name="E5ParseOver25GoalsIframes")
-
-        # Parse Over 3.5 Goals Iframes
-        call_command(command_name="E5ParseOver35GoalsIframes")
-
-        # Parse Win Draw Loss Percentage Iframes
-        call_command(command_name="E5ParseWinDrawLossPercentageIframes")
-
-        # Parse Corners Iframes
-        call_command(command_name="E5ParseCornersIframes")
-
-        # Parse Cards Iframes
-        call_command(command_name="E5ParseCardsIframes")
-
-        # Parse Half Time Full Time Iframes
-        call_command(command_name="E5ParseHalfTimeFullTimeIframes")
-
-        # Parse Scored Both Halves Iframes
-        call_command(command_name="E5ParseScoredBothHalvesIframes")
-
-        # Parse Won Both Halves Iframes
-        call_command(command_name="E5ParseWonBothHalvesIframes")
-
-        # Parse 1st 2nd Half Goals Iframes
-        call_command(command_name="E5Parse1st2ndHalfGoalsIframes")
-
-        # Parse Rescued Points Iframes
-        call_command(command_name="E5ParseRescuedPointsIframes")
-
-        # Parse Clean Sheet Iframes
-        call_command(command_name="E5ParseCleanSheetsIframes")
-
-        # Parse Won To Nil Iframes
-        call_command(command_name="E5ParseWonToNilIframes")
-
-        # Parse Win Loss Margin Iframes
-        call_command(command_name="E5ParseWinLossMarginIframes")
-
-        # Parse Scored First Iframes
-        call_command(command_name="E5ParseScoredFirstIframes")
-
-        # Parse Average First Goal Time Iframes
-        call_command(command_name="E5ParseAverageFirstGoalTimeIframes")
-
-        # Parse Average Team Goal Iframes
-        call_command(command_name="E5ParseAverageTeamGoalsIframes")
-
-        # Parse Early Goals Iframes
-        call_command(command_name="E5ParseEarlyGoalsIframes")
-
-        # Parse Late Goals Iframes
-        call_command(command_name="E5ParseLateGoalsIframes")
+        # Get Leagues, Seasons and Teams, then parse the league tables and every stats family already discovered
+        tasks: list[E5Task] = [
+            E5Task(name="get_leagues", stage="get_leagues"),
+            E5Task(name="get_seasons", stage="get_seasons", requires=("get_leagues",)),
+            E5Task(name="get_teams", stage="get_teams", requires=("get_seasons",)),
+            E5Task(name="parse_league_table_iframes", stage="parse_league_tables", requires=("get_teams",)),
+        ]
+        for family in E5ScrapeGraph.FAMILIES:
+            tasks.append(E5Task(name=f"parse_{family.name}_iframes", stage="parse_iframes", options={"family": family},
+                                requires=("parse_league_table_iframes",), family=family.name))
+
+        pipeline: E5Pipeline = self.get_pipeline(options=options)
+        try:
+            pipeline.run(tasks=tasks)
+        finally:
+            report: E5ScrapeReport | None = pipeline.close(success=not pipeline.incomplete(tasks=tasks))
+
+        if options.get('benchmark', False):
+            self.write_benchmark(report=report)
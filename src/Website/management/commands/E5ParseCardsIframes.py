@@ -1,43 +1,13 @@
-from datetime import datetime
-from typing import ClassVar
-
-from django.core.management.base import BaseCommand
-
-from e5toolbox.scrapper.stats.get_cards import E5GetCards
+from Website.management.E5ParseCommand import E5ParseCommand
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
 
 
 # E5
-class Command(BaseCommand):
-    CONTEXT: ClassVar[str] = "E5ParseCardsIframes"
+class Command(E5ParseCommand):
     help = "Parse Active Season's Cards Iframes"
 
     def handle(self, *args, **options):
-        # Instantiate Scraper
-        scraper: E5GetCards = E5GetCards()
-
-        # Logging
-        scraper.log_info(message=f"{datetime.now()} : {self.CONTEXT} start -----")
-
-        # Init driver
-        scraper.init()
-        if not scraper.status.success:
-            scraper.log_warning(f"{self.CONTEXT} - {scraper.status.error_context} : {scraper.status.error_type} : "
-                                f"{scraper.status.exception}")
-
         # Parse Cards Iframes
-        if scraper.status.success:
-            scraper.parse_iframes()
-            if not scraper.status.success:
-                scraper.log_warning(f"{self.CONTEXT} - {scraper.status.error_context} : {scraper.status.error_type} : "
-                                    f"{scraper.status.exception}")
-
-        # Close driver
-        scraper.quit()
-        if not scraper.status.success:
-            scraper.log_warning(f"{self.CONTEXT} - {scraper.status.error_context} : {scraper.status.error_type} : "
-                                f"{scraper.status.exception}")
-
-        # Logging
-        scraper.log_info(message=f"{datetime.now()} : {self.CONTEXT} end -----")
+        self.run_stage(options=options, stage="parse_iframes", family=E5ScrapeGraph.family(name="cards"))
 
         self.stdout.write("Cards Iframes Parsed Successfully")
@@ -0,0 +1,88 @@
+import os
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from Website.models import E5ScrapeJob
+from e5toolbox.scrapper.E5JobQueue import E5JobQueue
+from e5toolbox.scrapper.E5Pipeline import E5Pipeline
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
+
+
+# E5
+class Command(BaseCommand):
+    help = "Claim and run the (stats family, season) jobs queued by E5GetAll --enqueue"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--worker-id', type=str, default=f"{socket.gethostname()}:{os.getpid()}",
+                            help="Name recorded on the claimed jobs, defaults to host:pid")
+        parser.add_argument('--poll-interval', type=int, default=None,
+                            help="Seconds to wait when the queue is empty, defaults to E5_WORKER_POLL_SECONDS")
+        parser.add_argument('--exit-when-empty', action='store_true',
+                            help="Stop once no job is left to claim instead of waiting for new ones")
+
+    # E5
+    @staticmethod
+    def keep_alive(queue: E5JobQueue, job: E5ScrapeJob, worker: str, stop: threading.Event) -> None:
+        # Renew the lease well before it expires, a worker that died stops renewing and its job is retaken
+        try:
+            while not stop.wait(timeout=max(queue.lease_seconds // 3, 1)):
+                if not queue.heartbeat(job=job, worker=worker):
+                    return
+        finally:
+            connection.close()
+
+    # E5
+    def run_job(self, pipeline: E5Pipeline, queue: E5JobQueue, job: E5ScrapeJob, worker: str) -> bool:
+        stop: threading.Event = threading.Event()
+        heartbeat: threading.Thread = threading.Thread(target=self.keep_alive, args=(queue, job, worker, stop),
+                                                       daemon=True)
+        heartbeat.start()
+        try:
+            # The worker outlives many jobs, teams inserted since by a producer or another worker must be resolved
+            pipeline.context.resolver.invalidate(season=job.season)
+            success: bool = pipeline.run_unit(family=E5ScrapeGraph.family(name=job.family), season_id=job.season_id)
+            error: str = "" if success else "Scraping errors, see the scrapper logs"
+        except Exception as ex:
+            success, error = False, f"{type(ex).__name__} : {ex}"
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if success:
+            queue.complete(job=job, worker=worker)
+        else:
+            queue.fail(job=job, worker=worker, error=error)
+        return success
+
+    # E5
+    def handle(self, *args, **options):
+        worker: str = options['worker_id']
+        poll_interval: int = options.get('poll_interval') or getattr(settings, "E5_WORKER_POLL_SECONDS", 10)
+        queue: E5JobQueue = E5JobQueue.from_settings()
+        pipeline: E5Pipeline = E5Pipeline.from_settings(parallelism=1)
+
+        done: int = 0
+        failed: int = 0
+        try:
+            while True:
+                job: E5ScrapeJob | None = queue.claim(worker=worker)
+                if job is None:
+                    if options.get('exit_when_empty', False):
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                self.stdout.write(f"{worker} : {job.family} - {job.season} (attempt {job.attempts})")
+                if self.run_job(pipeline=pipeline, queue=queue, job=job, worker=worker):
+                    done += 1
+                else:
+                    failed += 1
+        finally:
+            pipeline.close()
+
+        self.stdout.write(f"{worker} done, {done} jobs completed, {failed} failed, queue : {queue.counts()}")
@@ -0,0 +1,139 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:14
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+# Every per team table is written by a single scrapper, keep the most recent row of each team
+def delete_duplicated_team_rows(apps, schema_editor):
+    for model_name in (
+            'e51st2ndhalfgoalsstats',
+            'e5average1stgoaltimestats',
+            'e5averageteamgoalsstats',
+            'e5bttsstats',
+            'e5cardsstats',
+            'e5cleansheetstats',
+            'e5earlygoalsstats',
+            'e5halftimefulltimestats',
+            'e5lategoalsstats',
+            'e5matchcornerstats',
+            'e5over05goalsstats',
+            'e5over15goalsstats',
+            'e5over25goalsstats',
+            'e5over35goalsstats',
+            'e5rescuedpointsstats',
+            'e5scoredbothhalfstats',
+            'e5scoredfirststats',
+            'e5teamcornerstats',
+            'e5teamranking',
+            'e5windrawlosspercentagestats',
+            'e5winlossmarginstats',
+            'e5wonbothhalfstats',
+            'e5wontonilstats'):
+        model = apps.get_model('Website', model_name)
+        duplicates = model.objects.values('team').annotate(rows=Count('id'), last_id=Max('id')).filter(rows__gt=1)
+        for duplicate in duplicates:
+            model.objects.filter(team=duplicate['team']).exclude(id=duplicate['last_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0037_e5matchcornerstats_date_updated_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicated_team_rows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='e51st2ndhalfgoalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e51st2ndhalfgoalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5average1stgoaltimestats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5average1stgoaltimestats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5averageteamgoalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5averageteamgoalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5bttsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5bttsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5cardsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5cardsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5cleansheetstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5cleansheetstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5earlygoalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5earlygoalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5halftimefulltimestats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5halftimefulltimestats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5lategoalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5lategoalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5matchcornerstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5matchcornerstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over05goalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5over05goalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over15goalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5over15goalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over25goalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5over25goalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over35goalsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5over35goalsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5rescuedpointsstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5rescuedpointsstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5scoredbothhalfstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5scoredbothhalfstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5scoredfirststats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5scoredfirststats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5teamcornerstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5teamcornerstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5teamranking',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5teamranking_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5windrawlosspercentagestats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5windrawlosspercentagestats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5winlossmarginstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5winlossmarginstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5wonbothhalfstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5wonbothhalfstats_unique_team'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5wontonilstats',
+            constraint=models.UniqueConstraint(fields=('team',), name='e5wontonilstats_unique_team'),
+        ),
+    ]
@@ -0,0 +1,188 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:16
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def repoint_related_rows(model, duplicate_ids, kept_id):
+    # Rows pointing at a duplicate move to the kept row, e.g. a duplicated team's stats, rankings and fixtures, unless
+    # the kept row already has one they would collide with on a unique constraint, those go with the duplicate
+    for relation in model._meta.related_objects:
+        if not (relation.one_to_many or relation.one_to_one):
+            continue
+        related_model, field = relation.related_model, relation.field
+        unique_sets = [constraint.fields for constraint in related_model._meta.total_unique_constraints
+                       if field.name in constraint.fields]
+        if field.unique:
+            unique_sets.append((field.name,))
+
+        for row in related_model.objects.filter(**{f"{field.attname}__in": duplicate_ids}):
+            collides = any(related_model.objects.filter(**{
+                related_model._meta.get_field(name).attname:
+                    kept_id if name == field.name else getattr(row, related_model._meta.get_field(name).attname)
+                for name in unique_set}).exists() for unique_set in unique_sets)
+            if not collides:
+                related_model.objects.filter(pk=row.pk).update(**{field.attname: kept_id})
+
+
+def delete_duplicated_rows(model, fields, keep):
+    duplicates = model.objects.values(*fields).annotate(rows=Count('id'), kept_id=keep('id')).filter(rows__gt=1)
+    for duplicate in duplicates:
+        duplicated = (model.objects.filter(**{field: duplicate[field] for field in fields})
+                      .exclude(id=duplicate['kept_id']))
+        repoint_related_rows(model=model, duplicate_ids=list(duplicated.values_list('id', flat=True)),
+                             kept_id=duplicate['kept_id'])
+        duplicated.delete()
+
+
+# Seasons and teams are only created when missing, the first row is the one every lookup already returned. Their
+# duplicates hand their teams, iframes, stats and fixtures over to it, seasons first so their teams are deduplicated
+# next. Fixtures and iframes are rewritten by the scrappers, keep the most recent row.
+def delete_duplicated_lookup_rows(apps, schema_editor):
+    delete_duplicated_rows(model=apps.get_model('Website', 'e5season'), fields=('league', 'name'), keep=Min)
+    delete_duplicated_rows(model=apps.get_model('Website', 'e5team'), fields=('season', 'name'), keep=Min)
+    delete_duplicated_rows(model=apps.get_model('Website', 'e5fixture'),
+                           fields=('home_team', 'away_team', 'date', 'kickoff_time'), keep=Max)
+    for model_name in (
+            'e51st2ndhalfgoalsiframe',
+            'e5average1stgoaltimeiframe',
+            'e5averageteamgoalsiframe',
+            'e5bttsiframes',
+            'e5cardsiframes',
+            'e5cleansheetiframe',
+            'e5cornersiframes',
+            'e5earlygoalsiframe',
+            'e5halftimefulltimeiframe',
+            'e5lategoalsiframe',
+            'e5leaguetableiframe',
+            'e5over05goalsiframe',
+            'e5over15goalsiframe',
+            'e5over25goalsiframe',
+            'e5over35goalsiframe',
+            'e5rescuedpointsiframe',
+            'e5scoredbothhalfiframes',
+            'e5scoredfirstiframe',
+            'e5windrawlosspercentageiframe',
+            'e5winlossmarginiframe',
+            'e5wonbothhalfiframes',
+            'e5wontoniliframe'):
+        delete_duplicated_rows(model=apps.get_model('Website', model_name), fields=('season',), keep=Max)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0038_stats_unique_team'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicated_lookup_rows, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='e5fixture',
+            index=models.Index(fields=['date'], name='e5fixture_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='e5season',
+            index=models.Index(fields=['active'], name='e5season_active_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='e51st2ndhalfgoalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e51st2ndhalfgoalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5average1stgoaltimeiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5average1stgoaltimeiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5averageteamgoalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5averageteamgoalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5bttsiframes',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5bttsiframes_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5cardsiframes',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5cardsiframes_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5cleansheetiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5cleansheetiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5cornersiframes',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5cornersiframes_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5earlygoalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5earlygoalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5fixture',
+            constraint=models.UniqueConstraint(fields=('home_team', 'away_team', 'date', 'kickoff_time'), name='e5fixture_unique_match'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5halftimefulltimeiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5halftimefulltimeiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5lategoalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5lategoalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5leaguetableiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5leaguetableiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over05goalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5over05goalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over15goalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5over15goalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over25goalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5over25goalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5over35goalsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5over35goalsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5rescuedpointsiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5rescuedpointsiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5scoredbothhalfiframes',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5scoredbothhalfiframes_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5scoredfirstiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5scoredfirstiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5season',
+            constraint=models.UniqueConstraint(fields=('league', 'name'), name='e5season_unique_league_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5team',
+            constraint=models.UniqueConstraint(fields=('season', 'name'), name='e5team_unique_season_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5windrawlosspercentageiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5windrawlosspercentageiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5winlossmarginiframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5winlossmarginiframe_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5wonbothhalfiframes',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5wonbothhalfiframes_unique_season'),
+        ),
+        migrations.AddConstraint(
+            model_name='e5wontoniliframe',
+            constraint=models.UniqueConstraint(fields=('season',), name='e5wontoniliframe_unique_season'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0039_lookup_indexes_and_uniqueness'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='E5SeasonFreshness',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('family', models.CharField(max_length=50)),
+                ('matches_played', models.IntegerField()),
+                ('date_updated', models.DateTimeField(auto_now=True)),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='Website.e5season')),
+            ],
+            options={
+                'verbose_name': 'Season Freshness',
+                'verbose_name_plural': 'Seasons Freshness',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='e5seasonfreshness',
+            constraint=models.UniqueConstraint(fields=('season', 'family'), name='e5seasonfreshness_unique_family'),
+        ),
+    ]
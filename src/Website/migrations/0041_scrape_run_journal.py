@@ -0,0 +1,48 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0040_e5seasonfreshness'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='E5ScrapeRun',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('status', models.CharField(default='running', max_length=20)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Scrape Run',
+                'verbose_name_plural': 'Scrape Runs',
+                'indexes': [models.Index(fields=['status', 'started_at'], name='e5scraperun_status_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='E5ScrapeJournal',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('stage', models.CharField(max_length=100)),
+                ('slot', models.IntegerField(blank=True, null=True)),
+                ('content_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('date_added', models.DateTimeField(auto_now_add=True)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='Website.e5scraperun')),
+                ('season', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='Website.e5season')),
+            ],
+            options={
+                'verbose_name': 'Scrape Journal',
+                'verbose_name_plural': 'Scrape Journal',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='e5scrapejournal',
+            constraint=models.UniqueConstraint(fields=('run', 'stage', 'season', 'slot'), name='e5scrapejournal_unique_unit'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0041_scrape_run_journal'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='E5ScrapeJob',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('family', models.CharField(max_length=50)),
+                ('status', models.CharField(default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('worker', models.CharField(blank=True, default='', max_length=100)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('date_added', models.DateTimeField(auto_now_add=True)),
+                ('date_updated', models.DateTimeField(auto_now=True)),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='Website.e5season')),
+            ],
+            options={
+                'verbose_name': 'Scrape Job',
+                'verbose_name_plural': 'Scrape Jobs',
+                'indexes': [models.Index(fields=['status', 'lease_expires_at'], name='e5scrapejob_claim_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='e5scrapejob',
+            constraint=models.UniqueConstraint(fields=('family', 'season'), name='e5scrapejob_unique_unit'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0042_e5scrapejob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='E5ScrapeReport',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('started_at', models.DateTimeField()),
+                ('wall_seconds', models.FloatField(default=0)),
+                ('pages', models.IntegerField(default=0)),
+                ('bytes', models.BigIntegerField(default=0)),
+                ('fetch_latency_p50_ms', models.FloatField(default=0)),
+                ('fetch_latency_p90_ms', models.FloatField(default=0)),
+                ('rows_parsed', models.IntegerField(default=0)),
+                ('rows_skipped', models.IntegerField(default=0)),
+                ('rows_written', models.IntegerField(default=0)),
+                ('queries', models.IntegerField(default=0)),
+                ('pages_per_minute', models.FloatField(default=0)),
+                ('report', models.JSONField(default=dict)),
+                ('date_added', models.DateTimeField(auto_now_add=True)),
+                ('run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='Website.e5scraperun')),
+            ],
+            options={
+                'verbose_name': 'Scrape Report',
+                'verbose_name_plural': 'Scrape Reports',
+                'indexes': [models.Index(fields=['started_at'], name='e5scrapereport_started_idx')],
+            },
+        ),
+    ]
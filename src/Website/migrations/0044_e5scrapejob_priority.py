@@ -0,0 +1,18 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0043_e5scrapereport'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='e5scrapejob',
+            name='priority',
+            field=models.IntegerField(default=0),
+        ),
+    ]
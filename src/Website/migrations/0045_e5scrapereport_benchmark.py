@@ -0,0 +1,22 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Website', '0044_e5scrapejob_priority'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='e5scrapereport',
+            name='benchmark',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='e5scrapereport',
+            index=models.Index(fields=['benchmark', 'started_at'], name='e5scrapereport_benchmark_idx'),
+        ),
+    ]
@@ -47,6 +47,8 @@ class E5Season(models.Model):
     class Meta:
         verbose_name = "Season"
         verbose_name_plural = "Seasons"
+        constraints = [models.UniqueConstraint(fields=['league', 'name'], name='e5season_unique_league_name')]
+        indexes = [models.Index(fields=['active'], name='e5season_active_idx')]
 
     # E5
     def __str__(self):
@@ -78,6 +80,7 @@ class E5Team(models.Model):
     class Meta:
         verbose_name = "Team"
         verbose_name_plural = "Teams"
+        constraints = [models.UniqueConstraint(fields=['season', 'name'], name='e5team_unique_season_name')]
 
     # E5
     def __str__(self):
@@ -109,6 +112,9 @@ class E5Fixture(models.Model):
     class Meta:
         verbose_name = "Fixture"
         verbose_name_plural = "Fixtures"
+        constraints = [models.UniqueConstraint(fields=['home_team', 'away_team', 'date', 'kickoff_time'],
+                                               name='e5fixture_unique_match')]
+        indexes = [models.Index(fields=['date'], name='e5fixture_date_idx')]
 
     # E5
     def __str__(self):
@@ -134,6 +140,7 @@ class E5LeagueTableIframe(models.Model):
     class Meta:
         verbose_name = "League Table Iframe"
         verbose_name_plural = "League Tables Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5leaguetableiframe_unique_season')]
 
     # E5
     @classmethod
@@ -171,6 +178,7 @@ class E5BttsIframes(models.Model):
     class Meta:
         verbose_name = "BTTS Iframe"
         verbose_name_plural = "BTTS Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5bttsiframes_unique_season')]
 
     # E5
     @classmethod
@@ -213,6 +221,7 @@ class E5Over05GoalsIframe(models.Model):
     class Meta:
         verbose_name = "Over 0.5 Goals Iframe"
         verbose_name_plural = "Over 0.5 Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5over05goalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -254,6 +263,7 @@ class E5Over15GoalsIframe(models.Model):
     class Meta:
         verbose_name = "Over 1.5 Goals Iframe"
         verbose_name_plural = "Over 1.5 Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5over15goalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -294,6 +304,7 @@ class E5Over25GoalsIframe(models.Model):
     class Meta:
         verbose_name = "Over 2.5 Goals Iframe"
         verbose_name_plural = "Over 2.5 Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5over25goalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -334,6 +345,7 @@ class E5Over35GoalsIframe(models.Model):
     class Meta:
         verbose_name = "Over 3.5 Goals Iframe"
         verbose_name_plural = "Over 3.5 Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5over35goalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -380,6 +392,7 @@ class E5CornersIframes(models.Model):
     class Meta:
         verbose_name = "Corners Iframe"
         verbose_name_plural = "Corners Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5cornersiframes_unique_season')]
 
     # E5
     @classmethod
@@ -428,6 +441,7 @@ class E5CardsIframes(models.Model):
     class Meta:
         verbose_name = "Cards Iframe"
         verbose_name_plural = "Cards Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5cardsiframes_unique_season')]
 
     # E5
     @classmethod
@@ -466,6 +480,7 @@ class E5WinDrawLossPercentageIframe(models.Model):
     class Meta:
         verbose_name = "Win Draw Loss Percentage Iframe"
         verbose_name_plural = "Win Draw Loss Percentage Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5windrawlosspercentageiframe_unique_season')]
 
     # E5
     @classmethod
@@ -500,6 +515,7 @@ class E5HalfTimeFullTimeIframe(models.Model):
     class Meta:
         verbose_name = "Half Time Full Time Iframe"
         verbose_name_plural = "Half Time Full Time Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5halftimefulltimeiframe_unique_season')]
 
     # E5
     @classmethod
@@ -535,6 +551,7 @@ class E5ScoredBothHalfIframes(models.Model):
     class Meta:
         verbose_name = "Scored Both Half Iframe"
         verbose_name_plural = "Scored Both Half Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5scoredbothhalfiframes_unique_season')]
 
     # E5
     @classmethod
@@ -571,6 +588,7 @@ class E5WonBothHalfIframes(models.Model):
     class Meta:
         verbose_name = "Won Both Half Iframe"
         verbose_name_plural = "Won Both Half Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5wonbothhalfiframes_unique_season')]
 
     # E5
     @classmethod
@@ -608,6 +626,7 @@ class E51st2ndHalfGoalsIframe(models.Model):
     class Meta:
         verbose_name = "1st 2nd Half Goals Iframe"
         verbose_name_plural = "1st 2nd Half Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e51st2ndhalfgoalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -645,6 +664,7 @@ class E5RescuedPointsIframe(models.Model):
     class Meta:
         verbose_name = "Rescued Points Iframe"
         verbose_name_plural = "Rescued Points Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5rescuedpointsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -680,6 +700,7 @@ class E5CleanSheetIframe(models.Model):
     class Meta:
         verbose_name = "Clean Sheet Iframe"
         verbose_name_plural = "Clean Sheet Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5cleansheetiframe_unique_season')]
 
     # E5
     @classmethod
@@ -716,6 +737,7 @@ class E5WonToNilIframe(models.Model):
     class Meta:
         verbose_name = "Won To Nil Iframe"
         verbose_name_plural = "Won To Nil Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5wontoniliframe_unique_season')]
 
     # E5
     @classmethod
@@ -752,6 +774,7 @@ class E5WinLossMarginIframe(models.Model):
     class Meta:
         verbose_name = "Win Loss Margin Iframe"
         verbose_name_plural = "Win Loss Margin Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5winlossmarginiframe_unique_season')]
 
     # E5
     @classmethod
@@ -788,6 +811,7 @@ class E5ScoredFirstIframe(models.Model):
     class Meta:
         verbose_name = "Scored First Iframe"
         verbose_name_plural = "Scored First Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5scoredfirstiframe_unique_season')]
 
     # E5
     @classmethod
@@ -823,6 +847,7 @@ class E5Average1stGoalTimeIframe(models.Model):
     class Meta:
         verbose_name = "Average 1st Goal Time Iframe"
         verbose_name_plural = "Average 1st Goal Time Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5average1stgoaltimeiframe_unique_season')]
 
     # E5
     @classmethod
@@ -857,6 +882,7 @@ class E5AverageTeamGoalsIframe(models.Model):
     class Meta:
         verbose_name = "Average Team Goals Iframe"
         verbose_name_plural = "Average Team Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5averageteamgoalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -891,6 +917,7 @@ class E5EarlyGoalsIframe(models.Model):
     class Meta:
         verbose_name = "Early Goals Iframe"
         verbose_name_plural = "Early Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5earlygoalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -925,6 +952,7 @@ class E5LateGoalsIframe(models.Model):
     class Meta:
         verbose_name = "Late Goals Iframe"
         verbose_name_plural = "Late Goals Iframes"
+        constraints = [models.UniqueConstraint(fields=['season'], name='e5lategoalsiframe_unique_season')]
 
     # E5
     @classmethod
@@ -968,6 +996,7 @@ class E5TeamRanking(models.Model):
     class Meta:
         verbose_name = "Team Ranking"
         verbose_name_plural = "Team Rankings"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5teamranking_unique_team')]
 
     # E5
     def __str__(self):
@@ -1023,6 +1052,7 @@ class E5BttsStats(models.Model):
     class Meta:
         verbose_name = "BTTS Stats"
         verbose_name_plural = "BTTS Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5bttsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1072,6 +1102,7 @@ class E5Over05GoalsStats(models.Model):
     class Meta:
         verbose_name = "Over 0.5 Goals Stats"
         verbose_name_plural = "Over 0.5 Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5over05goalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1121,6 +1152,7 @@ class E5Over15GoalsStats(models.Model):
     class Meta:
         verbose_name = "Over 1.5 Goals Stats"
         verbose_name_plural = "Over 1.5 Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5over15goalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1170,6 +1202,7 @@ class E5Over25GoalsStats(models.Model):
     class Meta:
         verbose_name = "Over 2.5 Goals Stats"
         verbose_name_plural = "Over 2.5 Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5over25goalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1219,6 +1252,7 @@ class E5Over35GoalsStats(models.Model):
     class Meta:
         verbose_name = "Over 3.5 Goals Stats"
         verbose_name_plural = "Over 3.5 Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5over35goalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1253,6 +1287,7 @@ class E5WinDrawLossPercentageStats(models.Model):
     class Meta:
         verbose_name = "Win Draw Loss Percentage Stats"
         verbose_name_plural = "Win Draw Loss Percentage Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5windrawlosspercentagestats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1314,6 +1349,7 @@ class E5TeamCornerStats(models.Model):
     class Meta:
         verbose_name = "Team Corner Stats"
         verbose_name_plural = "Team Corner Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5teamcornerstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1357,6 +1393,7 @@ class E5MatchCornerStats(models.Model):
     class Meta:
         verbose_name = "Match Corner Stats"
         verbose_name_plural = "Match Corner Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5matchcornerstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1405,6 +1442,7 @@ class E5CardsStats(models.Model):
     class Meta:
         verbose_name = "Cards Stats"
         verbose_name_plural = "Cards Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5cardsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1447,6 +1485,7 @@ class E5HalfTimeFullTimeStats(models.Model):
     class Meta:
         verbose_name = "Half Time Full Time Stats"
         verbose_name_plural = "Half Time Full Time Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5halftimefulltimestats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1484,6 +1523,7 @@ class E5ScoredBothHalfStats(models.Model):
     class Meta:
         verbose_name = "Scored Both Halves Stats"
         verbose_name_plural = "Scored Both Halves Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5scoredbothhalfstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1521,6 +1561,7 @@ class E5WonBothHalfStats(models.Model):
     class Meta:
         verbose_name = "Won Both Halves Stats"
         verbose_name_plural = "Won Both Halves Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5wonbothhalfstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1588,6 +1629,7 @@ class E51st2ndHalfGoalsStats(models.Model):
     class Meta:
         verbose_name = "1st 2nd Half Goals Stats"
         verbose_name_plural = "1st 2nd Half Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e51st2ndhalfgoalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1625,6 +1667,7 @@ class E5RescuedPointsStats(models.Model):
     class Meta:
         verbose_name = "Rescued Points Stats"
         verbose_name_plural = "Rescued Points Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5rescuedpointsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1662,6 +1705,7 @@ class E5CleanSheetStats(models.Model):
     class Meta:
         verbose_name = "Clean Sheet Stats"
         verbose_name_plural = "Clean Sheet Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5cleansheetstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1699,6 +1743,7 @@ class E5WonToNilStats(models.Model):
     class Meta:
         verbose_name = "Won To Nil Stats"
         verbose_name_plural = "Won To Nil Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5wontonilstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1743,6 +1788,7 @@ class E5WinLossMarginStats(models.Model):
     class Meta:
         verbose_name = "Win Loss Margin Stats"
         verbose_name_plural = "Win Loss Margin Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5winlossmarginstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1780,6 +1826,7 @@ class E5ScoredFirstStats(models.Model):
     class Meta:
         verbose_name = "Scored First Stats"
         verbose_name_plural = "Scored First Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5scoredfirststats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1808,6 +1855,7 @@ class E5Average1stGoalTimeStats(models.Model):
     class Meta:
         verbose_name = "Average 1st Goal Time Stats"
         verbose_name_plural = "Average 1st Goal Time Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5average1stgoaltimestats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1836,6 +1884,7 @@ class E5AverageTeamGoalsStats(models.Model):
     class Meta:
         verbose_name = "Average Team Goals Stats"
         verbose_name_plural = "Average Team Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5averageteamgoalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1870,6 +1919,7 @@ class E5EarlyGoalsStats(models.Model):
     class Meta:
         verbose_name = "Early Goals Stats"
         verbose_name_plural = "Early Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5earlygoalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1904,6 +1954,7 @@ class E5LateGoalsStats(models.Model):
     class Meta:
         verbose_name = "Late Goals Stats"
         verbose_name_plural = "Late Goals Stats"
+        constraints = [models.UniqueConstraint(fields=['team'], name='e5lategoalsstats_unique_team')]
 
     # E5
     def __str__(self):
@@ -1912,3 +1963,166 @@ class E5LateGoalsStats(models.Model):
     # E5
     def exists(self) -> bool:
         return E5LateGoalsStats.objects.filter(team=self.team).exists()
+
+
+################################################## FRESHNESS ###########################################################
+# E5
+class E5SeasonFreshness(models.Model):
+    id = models.AutoField(primary_key=True)
+    season = models.ForeignKey(E5Season, on_delete=models.CASCADE)
+    family = models.CharField(max_length=50)
+    matches_played = models.IntegerField()
+    date_updated = models.DateTimeField(auto_now=True)
+
+    objects = models.Manager()
+
+    # E5
+    class Meta:
+        verbose_name = "Season Freshness"
+        verbose_name_plural = "Seasons Freshness"
+        constraints = [models.UniqueConstraint(fields=['season', 'family'], name='e5seasonfreshness_unique_family')]
+
+    # E5
+    def __str__(self):
+        return f"{self.family} - {self.season} : {self.matches_played} matches played"
+
+
+################################################# RUN JOURNAL ##########################################################
+# E5
+class E5ScrapeRun(models.Model):
+    STATUS_RUNNING = "running"
+    STATUS_FINISHED = "finished"
+    STATUS_FAILED = "failed"
+
+    id = models.AutoField(primary_key=True)
+    status = models.CharField(max_length=20, default=STATUS_RUNNING)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = models.Manager()
+
+    # E5
+    class Meta:
+        verbose_name = "Scrape Run"
+        verbose_name_plural = "Scrape Runs"
+        indexes = [models.Index(fields=['status', 'started_at'], name='e5scraperun_status_idx')]
+
+    # E5
+    def __str__(self):
+        return f"Run {self.id} - {self.started_at} : {self.status}"
+
+
+# E5
+class E5ScrapeJournal(models.Model):
+    id = models.AutoField(primary_key=True)
+    run = models.ForeignKey(E5ScrapeRun, on_delete=models.CASCADE)
+    stage = models.CharField(max_length=100)
+    season = models.ForeignKey(E5Season, on_delete=models.CASCADE, null=True, blank=True)
+    slot = models.IntegerField(null=True, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    date_added = models.DateTimeField(auto_now_add=True)
+
+    objects = models.Manager()
+
+    # E5
+    class Meta:
+        verbose_name = "Scrape Journal"
+        verbose_name_plural = "Scrape Journal"
+        constraints = [models.UniqueConstraint(fields=['run', 'stage', 'season', 'slot'],
+                                               name='e5scrapejournal_unique_unit')]
+
+    # E5
+    def __str__(self):
+        return f"Run {self.run_id} - {self.stage} - season:{self.season_id} slot:{self.slot}"
+
+
+################################################## JOB QUEUE ###########################################################
+# E5
+class E5ScrapeJob(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    id = models.AutoField(primary_key=True)
+    family = models.CharField(max_length=50)
+    season = models.ForeignKey(E5Season, on_delete=models.CASCADE)
+    status = models.CharField(max_length=20, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    # Rank of the season by next kickoff when it was queued, lower is claimed first
+    priority = models.IntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True, default="")
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    date_added = models.DateTimeField(auto_now_add=True)
+    date_updated = models.DateTimeField(auto_now=True)
+
+    objects = models.Manager()
+
+    # E5
+    class Meta:
+        verbose_name = "Scrape Job"
+        verbose_name_plural = "Scrape Jobs"
+        constraints = [models.UniqueConstraint(fields=['family', 'season'], name='e5scrapejob_unique_unit')]
+        indexes = [models.Index(fields=['status', 'lease_expires_at'], name='e5scrapejob_claim_idx')]
+
+    # E5
+    def __str__(self):
+        return f"{self.family} - {self.season} : {self.status} ({self.attempts} attempts)"
+
+
+################################################## TELEMETRY ###########################################################
+# E5
+class E5ScrapeReport(models.Model):
+    id = models.AutoField(primary_key=True)
+    run = models.ForeignKey(E5ScrapeRun, on_delete=models.SET_NULL, null=True, blank=True)
+    # Replay of a recorded page archive, only comparable with other benchmarks
+    benchmark = models.BooleanField(default=False)
+    started_at = models.DateTimeField()
+    wall_seconds = models.FloatField(default=0)
+    pages = models.IntegerField(default=0)
+    bytes = models.BigIntegerField(default=0)
+    fetch_latency_p50_ms = models.FloatField(default=0)
+    fetch_latency_p90_ms = models.FloatField(default=0)
+    rows_parsed = models.IntegerField(default=0)
+    rows_skipped = models.IntegerField(default=0)
+    rows_written = models.IntegerField(default=0)
+    queries = models.IntegerField(default=0)
+    pages_per_minute = models.FloatField(default=0)
+    # Per stage and per season breakdown, same content as the json report
+    report = models.JSONField(default=dict)
+    date_added = models.DateTimeField(auto_now_add=True)
+
+    objects = models.Manager()
+
+    # E5
+    class Meta:
+        verbose_name = "Scrape Report"
+        verbose_name_plural = "Scrape Reports"
+        indexes = [models.Index(fields=['started_at'], name='e5scrapereport_started_idx'),
+                   models.Index(fields=['benchmark', 'started_at'], name='e5scrapereport_benchmark_idx')]
+
+    # E5
+    def __str__(self):
+        return f"{self.started_at:%Y-%m-%d %H:%M} : {self.pages} pages in {self.wall_seconds:.0f}s"
+
+
+################################################## PAGE CACHE ##########################################################
+# E5
+class E5DataVersion(models.Model):
+    # Single row, bumped by the scrape pipeline every time a stage commits, cached pages of an older version are stale
+    id = models.AutoField(primary_key=True)
+    version = models.BigIntegerField(default=0)
+    date_updated = models.DateTimeField(auto_now=True)
+
+    objects = models.Manager()
+
+    # E5
+    class Meta:
+        verbose_name = "Data Version"
+        verbose_name_plural = "Data Versions"
+
+    # E5
+    def __str__(self):
+        return f"v{self.version} ({self.date_updated:%Y-%m-%d %H:%M})"
@@ -0,0 +1,73 @@
+import dataclasses
+import threading
+from typing import ClassVar, Optional
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import Http404, HttpRequest
+
+from .cache import E5PageCache
+from .models import E5League, E5Season
+
+
+# E5
+@dataclasses.dataclass
+class E5Navigation:
+    SHARED: ClassVar[Optional["E5Navigation"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    # Data version the leagues were loaded at, None until the first load or after an invalidation
+    version: int | None = None
+    leagues: list[E5League] = dataclasses.field(default_factory=list)
+    leagues_by_slug: dict[str, E5League] = dataclasses.field(default_factory=dict)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5Navigation":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls()
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def invalidate(self) -> None:
+        with self.lock:
+            self.version = None
+
+    # E5
+    def load(self, request: HttpRequest) -> None:
+        # Cached pages already read the data version of the request, scrapes in other processes bump it
+        version: int | None = getattr(request, "data_version", None)
+        if version is None:
+            version = request.data_version = E5PageCache.version()
+
+        with self.lock:
+            if self.version == version:
+                return
+            self.leagues = list(E5League.objects.all().order_by('name'))
+            self.leagues_by_slug = {league.slug: league for league in self.leagues if league.slug}
+            self.version = version
+
+    # E5
+    def get_leagues(self, request: HttpRequest) -> list[E5League]:
+        self.load(request=request)
+        return self.leagues
+
+    # E5
+    def get_league(self, request: HttpRequest, slug: str) -> E5League:
+        self.load(request=request)
+        league: E5League | None = self.leagues_by_slug.get(slug)
+        if league is None:
+            raise Http404(f"No league {slug}")
+        return league
+
+
+# E5
+@receiver(signal=[post_save, post_delete], sender=E5League)
+@receiver(signal=[post_save, post_delete], sender=E5Season)
+def invalidate_navigation(sender, **kwargs) -> None:
+    # Edits made by this process, e.g. from the admin
+    E5Navigation.shared().invalidate()
@@ -0,0 +1,90 @@
+import dataclasses
+from typing import Any, ClassVar, Iterable
+
+from django.db import models
+
+from .models import (E5Over05GoalsStats, E5Over15GoalsStats, E5Over25GoalsStats, E5Over35GoalsStats, E5TeamCornerStats,
+                     E5MatchCornerStats, E5CardsStats, E5BttsStats, E5WinDrawLossPercentageStats,
+                     E5HalfTimeFullTimeStats, E5ScoredBothHalfStats, E5WonBothHalfStats, E51st2ndHalfGoalsStats,
+                     E5RescuedPointsStats, E5CleanSheetStats, E5WonToNilStats, E5WinLossMarginStats,
+                     E5ScoredFirstStats, E5Average1stGoalTimeStats, E5AverageTeamGoalsStats, E5EarlyGoalsStats,
+                     E5LateGoalsStats)
+
+
+# E5
+@dataclasses.dataclass
+class E5TeamStats:
+    # Every stats family of a team, None when the family was never parsed for it
+    team_id: int
+    btts: E5BttsStats | None = None
+    over_05_goals: E5Over05GoalsStats | None = None
+    over_15_goals: E5Over15GoalsStats | None = None
+    over_25_goals: E5Over25GoalsStats | None = None
+    over_35_goals: E5Over35GoalsStats | None = None
+    wdl_percent: E5WinDrawLossPercentageStats | None = None
+    cards: E5CardsStats | None = None
+    team_corners: E5TeamCornerStats | None = None
+    match_corners: E5MatchCornerStats | None = None
+    ht_ft: E5HalfTimeFullTimeStats | None = None
+    sbh: E5ScoredBothHalfStats | None = None
+    wbh: E5WonBothHalfStats | None = None
+    fh_sh_goals: E51st2ndHalfGoalsStats | None = None
+    rescued_points: E5RescuedPointsStats | None = None
+    clean_sheets: E5CleanSheetStats | None = None
+    wtn: E5WonToNilStats | None = None
+    wl_margin: E5WinLossMarginStats | None = None
+    scored_first: E5ScoredFirstStats | None = None
+    avg_1st_gt: E5Average1stGoalTimeStats | None = None
+    avg_team_goals: E5AverageTeamGoalsStats | None = None
+    early_goals: E5EarlyGoalsStats | None = None
+    late_goals: E5LateGoalsStats | None = None
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def context(self, prefix: str) -> dict[str, Any]:
+        # Template names, e.g. ht_btts_stats for the home team's btts
+        # A missing family renders as an empty row, template filters fail on lookups through None
+        return {f"{prefix}_{name}_stats": getattr(self, name) or model(team_id=self.team_id)
+                for name, model in E5StatsLoader.MODELS.items()}
+
+
+# E5
+@dataclasses.dataclass
+class E5StatsLoader:
+    # E5TeamStats field of every stats model
+    MODELS: ClassVar[dict[str, type[models.Model]]] = {
+        "btts": E5BttsStats,
+        "over_05_goals": E5Over05GoalsStats,
+        "over_15_goals": E5Over15GoalsStats,
+        "over_25_goals": E5Over25GoalsStats,
+        "over_35_goals": E5Over35GoalsStats,
+        "wdl_percent": E5WinDrawLossPercentageStats,
+        "cards": E5CardsStats,
+        "team_corners": E5TeamCornerStats,
+        "match_corners": E5MatchCornerStats,
+        "ht_ft": E5HalfTimeFullTimeStats,
+        "sbh": E5ScoredBothHalfStats,
+        "wbh": E5WonBothHalfStats,
+        "fh_sh_goals": E51st2ndHalfGoalsStats,
+        "rescued_points": E5RescuedPointsStats,
+        "clean_sheets": E5CleanSheetStats,
+        "wtn": E5WonToNilStats,
+        "wl_margin": E5WinLossMarginStats,
+        "scored_first": E5ScoredFirstStats,
+        "avg_1st_gt": E5Average1stGoalTimeStats,
+        "avg_team_goals": E5AverageTeamGoalsStats,
+        "early_goals": E5EarlyGoalsStats,
+        "late_goals": E5LateGoalsStats,
+    }
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def load(cls, team_ids: Iterable[int]) -> dict[int, E5TeamStats]:
+        # One query per stats model whatever the number of teams, missing rows leave the family empty
+        team_ids = list(team_ids)
+        bundles: dict[int, E5TeamStats] = {team_id: E5TeamStats(team_id=team_id) for team_id in team_ids}
+        for name, model in cls.MODELS.items():
+            for stats in model.objects.filter(team__in=team_ids):
+                setattr(bundles[stats.team_id], name, stats)
+        return bundles
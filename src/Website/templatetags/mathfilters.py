@@ -4,31 +4,33 @@ register = template.Library()
 
 
 # E5
-def average(value1: any, value2: any) -> float:
+def average(value1: any, value2: any) -> float | str:
     # Remove % from values
     value1 = str(value1).replace("%", "")
     value2 = str(value2).replace("%", "")
 
-    # Convert to float
-    value1 = float(value1)
-    value2 = float(value2)
-
-    # Return value
-    return round(((value1 + value2) / 2), 2)
+    # Convert to float, stats a team has no row for render empty
+    try:
+        value1 = float(value1)
+        value2 = float(value2)
+        return round(((value1 + value2) / 2), 2)
+    except (ValueError, ZeroDivisionError):
+        return ""
 
 
 # E5
-def get_percentage(value1: any, value2: any) -> float:
+def get_percentage(value1: any, value2: any) -> float | str:
     # Remove % from values
     value1 = str(value1).replace("%", "")
     value2 = str(value2).replace("%", "")
 
-    # Convert to float
-    value1 = float(value1)
-    value2 = float(value2)
-
-    # Return value
-    return round(((value1 / value2) * 100), 2)
+    # Convert to float, stats a team has no row for render empty
+    try:
+        value1 = float(value1)
+        value2 = float(value2)
+        return round(((value1 / value2) * 100), 2)
+    except (ValueError, ZeroDivisionError):
+        return ""
 
 
 register.filter("average", average)
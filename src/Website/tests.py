@@ -1,3 +1,1639 @@
-from django.test import TestCase
+import datetime
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import ClassVar
+from unittest import mock
+
+from bs4 import BeautifulSoup
+from django.core import checks
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.migrations.executor import MigrationExecutor
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from django.utils.text import slugify
+
+from Website.cache import E5PageCache
+from Website.checks import check_query_paths_are_indexed
+from Website.export import E5StaticExporter
+from Website.management.commands.E5ScrapeWorker import Command as E5ScrapeWorker
+from Website.models import (E5CornersIframes, E5DataVersion, E5Fixture, E5League, E5MatchCornerStats, E5ScrapeJob,
+                            E5ScrapeReport, E5Season, E5SeasonFreshness, E5Team, E5TeamCornerStats, E5TeamRanking)
+from Website.navigation import E5Navigation
+from Website.stats import E5StatsLoader, E5TeamStats
+from e5toolbox.base.E5CookieStore import E5CookieStore
+from e5toolbox.scrapper.E5AsyncFetcher import E5AsyncFetcher
+from e5toolbox.scrapper.E5FreshnessTracker import E5FreshnessTracker
+from e5toolbox.scrapper.E5HttpFetcher import E5HttpFetcher
+from e5toolbox.scrapper.E5JobQueue import E5JobQueue
+from e5toolbox.scrapper.E5PageArchive import E5PageArchive
+from e5toolbox.scrapper.E5Pipeline import E5Pipeline, E5RunContext
+from e5toolbox.scrapper.E5RunJournal import E5RunJournal
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry, E5StageTelemetry
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
+from e5toolbox.scrapper.E5Scheduler import E5Scheduler, E5Task
+from e5toolbox.scrapper.E5SeasonPrioritizer import E5SeasonPrioritizer
+from e5toolbox.scrapper.E5SeleniumWebdriver import E5SeleniumWebDriver, E5SeleniumWebdriverError
+from e5toolbox.scrapper.E5StatsWriter import E5StatsWriter
+from e5toolbox.scrapper.E5TableParser import E5TableParser, E5TableRecord
+from e5toolbox.scrapper.E5TeamResolver import E5TeamResolver
+from e5toolbox.scrapper.E5WebDriverPool import E5WebDriverPool
+from e5toolbox.scrapper.stats.get_corners import E5GetCorners
+
+
+####################################################### TEST DATA ######################################################
+# E5
+def create_season(league: str, name: str = "2026", active: bool = True, teams: tuple[str, ...] = ()) -> E5Season:
+    league_obj, _ = E5League.objects.get_or_create(name=league, defaults={'url': f"https://example.com/{league}",
+                                                                          'slug': slugify(league)})
+    season: E5Season = E5Season.objects.create(name=name, league=league_obj, active=active,
+                                               url=f"https://example.com/{league}/{name}")
+    for team in teams:
+        E5Team.objects.create(name=team, season=season, url=f"https://example.com/{league}/{name}/{team}",
+                              slug=slugify(team))
+    return season
+
+
+# E5
+class E5ScrapeTestCase(TestCase):
+    # Process wide state of a scrape run, each test starts a new one
+    SINGLETONS: tuple[type, ...] = (E5TeamResolver, E5FreshnessTracker, E5RunJournal, E5RunTelemetry,
+                                    E5SeasonPrioritizer, E5PageArchive, E5HttpFetcher, E5WebDriverPool)
+
+    # E5
+    def setUp(self):
+        for singleton in self.SINGLETONS:
+            singleton.SHARED = None
+
+    # E5
+    def tearDown(self):
+        for singleton in self.SINGLETONS:
+            singleton.SHARED = None
+
+    # E5
+    @staticmethod
+    def serve_pages(scraper, pages: dict[str, BeautifulSoup]) -> None:
+        # Pages come from memory instead of http or a browser, missing ones fail like an unreachable url
+        def get(url: str, error_context: str) -> None:
+            if url not in pages:
+                scraper.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_URL_FAILED,
+                                  error_context=error_context, exception=f"{url} unreachable")
+                return
+            scraper.soup, scraper.page_hash = pages[url], url
+
+        scraper.get = get
+        scraper.prefetch_iframes = lambda iframes: {}
+
+
+# E5
+class E5WebsiteTestCase(TestCase):
+    # Page cache and navigation are process wide, each test starts with empty ones
+
+    # E5
+    def setUp(self):
+        E5PageCache.SHARED = E5Navigation.SHARED = None
+        caches["default"].clear()
+
+    # E5
+    def tearDown(self):
+        E5PageCache.SHARED = E5Navigation.SHARED = None
+        caches["default"].clear()
+
+
+##################################################### WEBDRIVER POOL ###################################################
+# E5
+class E5FakeDriver:
+    # Stands for a browser, the pool only checks it is alive and quits it
+    current_url: str = "about:blank"
+
+    # E5
+    def implicitly_wait(self, seconds: float) -> None:
+        pass
+
+    # E5
+    def quit(self) -> None:
+        pass
+
+
+# E5
+@mock.patch.object(E5WebDriverPool, "start_driver", staticmethod(E5FakeDriver))
+class E5WebDriverPoolTests(SimpleTestCase):
+
+    # E5
+    def tearDown(self):
+        E5WebDriverPool.SHARED = None
+
+    # E5
+    @override_settings(E5_WEBDRIVER_POOL_SIZE=0)
+    def test_default_size_is_the_cpu_count(self):
+        with mock.patch("os.cpu_count", return_value=6):
+            self.assertEqual(E5WebDriverPool.shared().size, 6)
+
+    # E5
+    @override_settings(E5_WEBDRIVER_POOL_SIZE=0)
+    def test_run_context_sizes_the_pool_to_its_parallelism(self):
+        context: E5RunContext = E5RunContext.from_settings(parallelism=5)
+        self.assertEqual(context.drivers.size, 5)
+
+    # E5
+    @override_settings(E5_WEBDRIVER_POOL_SIZE=2)
+    def test_explicit_size_wins_over_parallelism(self):
+        context: E5RunContext = E5RunContext.from_settings(parallelism=5)
+        self.assertEqual(context.drivers.size, 2)
+
+    # E5
+    def test_borrow_waits_once_every_browser_is_lent(self):
+        pool: E5WebDriverPool = E5WebDriverPool(size=2, borrow_timeout=0.1)
+        first, second = pool.borrow(), pool.borrow()
+        with self.assertRaises(TimeoutError):
+            pool.borrow()
+
+        # Giving one back unblocks a waiting borrower with the same browser
+        borrowed: list = []
+        waiter: threading.Thread = threading.Thread(target=lambda: borrowed.append(pool.borrow()))
+        pool.borrow_timeout = 5.0
+        waiter.start()
+        pool.give_back(driver=first)
+        waiter.join(timeout=5.0)
+        self.assertEqual(borrowed, [first])
+        self.assertEqual(pool.started, 2)
+        pool.give_back(driver=second)
+
+    # E5
+    def test_shrinking_stops_browsers_as_they_come_back(self):
+        pool: E5WebDriverPool = E5WebDriverPool(size=3)
+        drivers: list = [pool.borrow() for _ in range(3)]
+        pool.resize(size=1)
+        for driver in drivers:
+            pool.give_back(driver=driver)
+        self.assertEqual(pool.started, 1)
+        self.assertEqual(len(pool.idle), 1)
+
+    # E5
+    def test_scrapers_of_a_run_reuse_the_same_browser(self):
+        drivers: list = []
+        for _ in range(3):
+            scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+            scraper.init()
+            scraper.borrow_driver(error_context="test")
+            drivers.append(scraper.driver)
+            scraper.quit()
+
+        # quit() gives the browser back, only closing the pool stops it
+        self.assertEqual(len(set(map(id, drivers))), 1)
+        with mock.patch.object(E5FakeDriver, "quit") as quit_driver:
+            E5WebDriverPool.shared().close()
+        quit_driver.assert_called_once()
+
+
+###################################################### HTTP FETCHER ####################################################
+# E5
+class E5HttpFirstFetchTests(E5ScrapeTestCase):
+    SHEET_URL: ClassVar[str] = "https://docs.google.com/spreadsheets/d/e/sheet/pubhtml"
+    SHEET: ClassVar[str] = '<table class="waffle no-grid"><tr><td>Lens</td></tr></table>'
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.session: mock.Mock = mock.Mock()
+        E5HttpFetcher.SHARED = E5HttpFetcher(session=self.session)
+        self.scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+        self.scraper.init()
+
+    # E5
+    def respond(self, html: str) -> None:
+        self.session.get.return_value = mock.Mock(text=html, content=html.encode())
+
+    # E5
+    def browser(self, html: str):
+        # Stands for get_only(), the borrowed browser then holds the page
+        def get_only(url: str, error_context: str) -> None:
+            self.scraper.driver = mock.Mock(page_source=html)
+        return mock.patch.object(self.scraper, "get_only", side_effect=get_only)
+
+    # E5
+    def test_published_sheets_are_fetched_without_a_browser(self):
+        self.respond(html=self.SHEET)
+        with self.browser(html="") as get_only, E5RunTelemetry.shared().stage(name="test"):
+            self.scraper.get(url=self.SHEET_URL, error_context="test")
+
+        get_only.assert_not_called()
+        self.assertTrue(self.scraper.status.success)
+        self.assertEqual(self.scraper.soup.select_one("td").text, "Lens")
+        self.assertEqual(E5RunTelemetry.shared().stages["test"].pages, 1)
+
+    # E5
+    def test_a_sheet_without_its_table_is_rendered_by_the_browser(self):
+        self.respond(html="<html>Sign in</html>")
+        with self.browser(html=self.SHEET) as get_only:
+            self.scraper.get(url=self.SHEET_URL, error_context="test")
+
+        get_only.assert_called_once_with(url=self.SHEET_URL, error_context="test")
+        self.assertEqual(self.scraper.soup.select_one("td").text, "Lens")
+
+    # E5
+    def test_http_errors_fall_back_to_the_browser(self):
+        self.session.get.side_effect = ConnectionError("unreachable")
+        with self.browser(html=self.SHEET) as get_only, self.assertLogs(level="WARNING"):
+            self.scraper.get(url=self.SHEET_URL, error_context="test")
+
+        get_only.assert_called_once()
+        self.assertEqual(self.scraper.soup.select_one("td").text, "Lens")
+
+    # E5
+    def test_other_pages_always_use_the_browser(self):
+        with self.browser(html="<p>Ligue 1</p>") as get_only:
+            self.scraper.get(url="https://www.thestatsdontlie.com/football/", error_context="test")
+
+        get_only.assert_called_once()
+        self.session.get.assert_not_called()
+
+
+##################################################### ASYNC FETCHER ####################################################
+# E5
+class E5FakeFetcher:
+    # Stands for E5HttpFetcher, counts the pages fetched at once
+
+    # E5
+    def __init__(self, failing: tuple[str, ...] = ()):
+        self.failing: tuple[str, ...] = failing
+        self.lock: threading.Lock = threading.Lock()
+        self.active: int = 0
+        self.max_active: int = 0
+
+    # E5
+    def fetch(self, url: str) -> str:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.05)
+            if url in self.failing:
+                raise ConnectionError(f"{url} unreachable")
+            E5RunTelemetry.shared().page(size=len(url), latency=0.05)
+            return f"<p>{url}</p>"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+# E5
+class E5AsyncFetcherTests(E5ScrapeTestCase):
+
+    # E5
+    def test_pages_are_fetched_concurrently_within_the_limit(self):
+        fetcher: E5FakeFetcher = E5FakeFetcher(failing=("https://example.com/3",))
+        jobs: list[tuple[int, str]] = [(key, f"https://example.com/{key}") for key in range(8)]
+        with self.assertLogs(level="WARNING"):
+            pages: dict = E5AsyncFetcher(concurrency=3, fetcher=fetcher).fetch_all(jobs=jobs)
+
+        self.assertEqual(fetcher.max_active, 3)
+        # Failed pages are left out for the sequential path
+        self.assertEqual(sorted(pages), [0, 1, 2, 4, 5, 6, 7])
+        self.assertEqual(pages[5], "<p>https://example.com/5</p>")
+
+    # E5
+    def test_pages_count_for_the_stage_that_prefetched_them(self):
+        with E5RunTelemetry.shared().stage(name="prefetch"):
+            E5AsyncFetcher(fetcher=E5FakeFetcher()).fetch_all(jobs=[(key, f"https://example.com/{key}")
+                                                                     for key in range(4)])
+        self.assertEqual(E5RunTelemetry.shared().stages["prefetch"].pages, 4)
+
+    # E5
+    @mock.patch.object(E5GetCorners, "STATIC_TABLE_HOSTS", ("example.com",))
+    def test_prefetched_sheets_are_then_read_from_memory(self):
+        iframe: E5CornersIframes = corners_iframe(season=create_season(league="Ligue 1"))
+        session: mock.Mock = mock.Mock()
+        session.get.side_effect = lambda url, timeout: mock.Mock(text=str(sheet(sheet_row(
+            teams=("Lens", "Lille", "Lens"), groups=((10, 1, 1.5),) * 3))), content=b"")
+        E5HttpFetcher.SHARED = E5HttpFetcher(session=session)
+
+        scraper: E5GetCorners = E5GetCorners()
+        scraper.init()
+        self.assertEqual(len(scraper.prefetch_iframes(iframes=[iframe])), len(E5GetCorners.TABLE_SPECS))
+        scraper.get(url=iframe.team_corners_for_1h_url, error_context="test")
+        self.assertTrue(scraper.status.success)
+        self.assertEqual(session.get.call_count, len(E5GetCorners.TABLE_SPECS))
+
+
+###################################################### PREDICTIONS #####################################################
+# E5
+class E5PredictionsDriver(E5FakeDriver):
+    # Stands for a browser on the predictions pages, their tables show up some time after the page is opened
+
+    # E5
+    def __init__(self, tables_after: float = 0.0, login_required: bool = False, rejected: bool = False):
+        self.tables_after: float = tables_after
+        self.login_required: bool = login_required
+        # Neither the saved cookies nor the credentials get past the login form
+        self.rejected: bool = rejected
+        self.tables_at: float = 0.0
+        self.cookies: list[dict] = []
+        self.logins: int = 0
+        self.page_source: str = "<h1>Saturday 18th October</h1>"
+
+    # E5
+    def get(self, url: str) -> None:
+        self.tables_at = time.monotonic() + self.tables_after
+
+    # E5
+    def refresh(self) -> None:
+        pass
+
+    # E5
+    def find_elements(self, by: str, value: str) -> list:
+        if value == "user_login":
+            return [value] if self.login_required and (self.rejected or not self.cookies) else []
+        loaded: bool = time.monotonic() >= self.tables_at
+        if value == E5SeleniumWebDriver.PREDICTIONS_TABLE_SELECTOR:
+            return ["upcoming", "matches"] if loaded else []
+        return [value] if loaded else []
+
+    # E5
+    def find_element(self, by: str, value: str) -> mock.Mock:
+        def click() -> None:
+            self.logins += 1
+            self.cookies.append({"name": "session", "value": "logged"})
+        return mock.Mock(click=click)
+
+    # E5
+    def execute_cdp_cmd(self, cmd: str, cookie: dict) -> None:
+        self.cookies.append(cookie)
+
+    # E5
+    def get_cookies(self) -> list[dict]:
+        return list(self.cookies)
+
+
+# E5
+class E5PredictionsPageTests(E5ScrapeTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.cookies: E5CookieStore = E5CookieStore(fullpath=os.path.join(self.directory.name, "cookies.json"))
+        patcher = mock.patch.object(E5SeleniumWebDriver, "SESSION_COOKIES", self.cookies)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+
+    # E5
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    # E5
+    def load(self, driver: E5PredictionsDriver) -> str | None:
+        # The pool lends this browser
+        E5WebDriverPool.SHARED = E5WebDriverPool(size=1)
+        with mock.patch.object(E5WebDriverPool, "start_driver", staticmethod(lambda: driver)):
+            return self.scraper.load_predictions_page(endpoint="saturday/", error_context="test")
+
+    # E5
+    @mock.patch.object(E5SeleniumWebDriver, "PREDICTIONS_TIMEOUT", 5)
+    def test_the_page_is_read_once_its_tables_show_up(self):
+        start: float = time.monotonic()
+        with self.assertNoLogs(level="WARNING"):
+            page_source: str | None = self.load(driver=E5PredictionsDriver(tables_after=0.2))
+        self.assertEqual(page_source, "<h1>Saturday 18th October</h1>")
+        self.assertLess(time.monotonic() - start, 3)
+
+    # E5
+    @mock.patch.object(E5SeleniumWebDriver, "PREDICTIONS_TIMEOUT", 0.2)
+    def test_a_page_that_never_loads_is_still_read_after_the_timeout(self):
+        with self.assertLogs(level="WARNING") as logs:
+            page_source: str | None = self.load(driver=E5PredictionsDriver(tables_after=3600))
+        self.assertEqual(page_source, "<h1>Saturday 18th October</h1>")
+        self.assertIn("not fully loaded", logs.output[0])
+        # The browser goes back to the pool either way
+        self.assertEqual(len(E5WebDriverPool.shared().idle), 1)
+
+    # E5
+    @override_settings(E5_PREDICTIONS_USER="user", E5_PREDICTIONS_PASSWORD="password")
+    def test_the_saved_session_spares_the_next_logins(self):
+        first: E5PredictionsDriver = E5PredictionsDriver(login_required=True)
+        self.load(driver=first)
+        self.assertEqual(first.logins, 1)
+
+        # Another browser, even of another process, starts with the saved cookies
+        E5SeleniumWebDriver.SESSION_COOKIES = E5CookieStore(fullpath=self.cookies.fullpath)
+        second: E5PredictionsDriver = E5PredictionsDriver(login_required=True)
+        self.assertEqual(self.load(driver=second), "<h1>Saturday 18th October</h1>")
+        self.assertEqual(second.logins, 0)
+        self.assertEqual(second.cookies, [{"name": "session", "value": "logged"}])
+
+    # E5
+    @override_settings(E5_PREDICTIONS_USER="", E5_PREDICTIONS_PASSWORD="")
+    def test_a_login_without_credentials_is_reported(self):
+        driver: E5PredictionsDriver = E5PredictionsDriver(login_required=True)
+        with self.assertLogs(level="WARNING") as logs:
+            self.load(driver=driver)
+        self.assertIn("E5_PREDICTIONS_USER", logs.output[0])
+        self.assertEqual((driver.logins, self.cookies.load()), (0, []))
+
+    # E5
+    @mock.patch.object(E5SeleniumWebDriver, "PREDICTIONS_TIMEOUT", 0.2)
+    @override_settings(E5_PREDICTIONS_USER="user", E5_PREDICTIONS_PASSWORD="password")
+    def test_a_rejected_session_is_dropped_even_when_the_login_fails(self):
+        self.cookies.save(cookies=[{"name": "session", "value": "revoked"}])
+        driver: E5PredictionsDriver = E5PredictionsDriver(login_required=True, rejected=True)
+        with self.assertLogs(level="WARNING") as logs:
+            self.load(driver=driver)
+
+        self.assertIn("login failed", logs.output[0])
+        # The saved session was tried first
+        self.assertEqual(driver.cookies[0], {"name": "session", "value": "revoked"})
+        self.assertFalse(os.path.exists(self.cookies.fullpath))
+        self.assertEqual(E5CookieStore(fullpath=self.cookies.fullpath).load(), [])
+
+    # E5
+    def test_expired_cookies_and_sessions_are_dropped(self):
+        self.cookies.save(cookies=[{"name": "session", "value": "logged"},
+                                   {"name": "old", "value": "gone", "expiry": time.time() - 1}])
+        self.assertEqual(E5CookieStore(fullpath=self.cookies.fullpath).load(), [{"name": "session", "value": "logged"}])
+        self.assertEqual(E5CookieStore(fullpath=self.cookies.fullpath, ttl=-1).load(), [])
+
+
+##################################################### TABLE PARSER #####################################################
+# E5
+def sheet_row(teams: tuple[str, str, str], groups: tuple[tuple[str, ...], ...]) -> str:
+    # One row of a home / away / overall sheet, each side is its rank, its team link then its columns
+    cells: list[str] = []
+    for team, group in zip(teams, groups):
+        cells.extend(["<td>1</td>", f'<td><a target="_blank" href="#">{team}</a></td>',
+                      *[f"<td>{value}</td>" for value in group]])
+    return f"<tr>{''.join(cells)}</tr>"
+
+
+# E5
+def sheet(*rows: str) -> BeautifulSoup:
+    return BeautifulSoup(f'<table class="waffle no-grid"><tr><td>Team</td><td>MP</td></tr>{"".join(rows)}</table>',
+                         "html.parser")
+
+
+# E5
+class E5TableParserTests(SimpleTestCase):
+
+    # E5
+    def test_every_section_reads_its_own_team_and_columns(self):
+        soup: BeautifulSoup = sheet(sheet_row(teams=("Lens", "Lille", "Lyon"),
+                                              groups=(("10", "21", "2.1"), ("9", "17", "1.89"), ("19", "40", "2.11"))))
+        match_corners_1h = next(spec for spec in E5GetCorners.TABLE_SPECS if spec.url_field == "match_corners_1h_url")
+        records: list[E5TableRecord] = E5TableParser.parse(soup=soup, spec=match_corners_1h)
+
+        self.assertEqual([record.team_name for record in records], ["Lens", "Lille", "Lyon"])
+        self.assertEqual(records[1].values, {"away_matches_played": 9, "away_corners_1h": 17,
+                                             "away_corners_1h_average": 1.89})
+        # The overall side of a match corners sheet is match corner stats too
+        self.assertEqual(records[2].model, E5MatchCornerStats)
+        self.assertEqual(records[2].values, {"overall_matches_played": 19, "overall_corners_1h": 40,
+                                             "overall_corners_1h_average": 2.11})
+
+    # E5
+    def test_rows_that_do_not_convert_are_skipped(self):
+        soup: BeautifulSoup = sheet(sheet_row(teams=("Lens", "Lille", "Lyon"),
+                                              groups=(("10", "21", "2.1"), ("9", "-", "1.89"), ("19", "40", "2.11"))),
+                                    sheet_row(teams=("Nice", "Nantes", "Metz"),
+                                              groups=(("10", "12", "1.2"), ("9", "8", "0.89"), ("19", "20", "1.05"))))
+        records: list[E5TableRecord] = E5TableParser.parse(soup=soup, spec=E5GetCorners.TABLE_SPECS[0])
+        self.assertEqual([record.team_name for record in records], ["Nice", "Nantes", "Metz"])
+
+    # E5
+    def test_missing_table_is_not_an_empty_table(self):
+        self.assertIsNone(E5TableParser.parse(soup=BeautifulSoup("<p>Quota exceeded</p>", "html.parser"),
+                                              spec=E5GetCorners.TABLE_SPECS[0]))
+        self.assertEqual(E5TableParser.parse(soup=sheet(), spec=E5GetCorners.TABLE_SPECS[0]), [])
+
+
+##################################################### TEAM RESOLVER ####################################################
+# E5
+class E5TeamResolverTests(TestCase):
+
+    # E5
+    def setUp(self):
+        self.season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        self.other: E5Season = create_season(league="Ligue 2", teams=("Lens",))
+        self.resolver: E5TeamResolver = E5TeamResolver()
+
+    # E5
+    def test_a_season_is_loaded_once(self):
+        with self.assertNumQueries(1):
+            lens: E5Team = self.resolver.resolve(season=self.season, name="Lens")
+            lille: E5Team = self.resolver.resolve(season=self.season, name="Lille")
+        self.assertEqual((lens.season_id, lille.name), (self.season.id, "Lille"))
+        self.assertNotEqual(self.resolver.resolve(season=self.other, name="Lens"), lens)
+
+    # E5
+    def test_unknown_names_are_reported_once(self):
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertIsNone(self.resolver.resolve(season=self.season, name="Metz"))
+            self.assertIsNone(self.resolver.resolve(season=self.season, name="Metz"))
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(self.resolver.miss_count(), 1)
+
+    # E5
+    def test_invalidated_season_sees_new_teams(self):
+        self.assertIsNone(self.resolver.resolve(season=self.season, name="Metz"))
+        E5Team.objects.create(name="Metz", season=self.season, url="https://example.com/metz")
+        self.resolver.invalidate(season=self.season)
+        self.assertEqual(self.resolver.resolve(season=self.season, name="Metz").name, "Metz")
+        self.assertEqual(self.resolver.miss_count(), 0)
+
+
+###################################################### STATS WRITER ####################################################
+# E5
+class E5StatsWriterTests(TestCase):
+
+    # E5
+    def setUp(self):
+        season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        self.lens, self.lille = E5Team.objects.filter(season=season).order_by('name')
+
+    # E5
+    def test_rows_are_inserted_then_updated_in_place(self):
+        E5StatsWriter.upsert(model=E5TeamCornerStats, rows={
+            self.lens.id: {"home_matches_played": 10, "home_corners_for_1h": 21},
+            self.lille.id: {"home_matches_played": 9, "home_corners_for_1h": 17}})
+        first_id: int = E5TeamCornerStats.objects.get(team=self.lens).id
+
+        E5StatsWriter.upsert(model=E5TeamCornerStats, rows={self.lens.id: {"home_matches_played": 11,
+                                                                           "home_corners_for_1h": 24}})
+        lens: E5TeamCornerStats = E5TeamCornerStats.objects.get(team=self.lens)
+        self.assertEqual((lens.id, lens.home_matches_played, lens.home_corners_for_1h), (first_id, 11, 24))
+        self.assertEqual(E5TeamCornerStats.objects.count(), 2)
+
+    # E5
+    def test_columns_a_page_does_not_carry_are_left_untouched(self):
+        E5StatsWriter.upsert(model=E5TeamCornerStats, rows={self.lens.id: {"home_corners_for_1h": 21}})
+        E5StatsWriter.upsert(model=E5TeamCornerStats, rows={self.lens.id: {"away_corners_for_1h": 12},
+                                                            self.lille.id: {"home_corners_for_1h": 17,
+                                                                            "away_corners_for_1h": 8}})
+        lens: E5TeamCornerStats = E5TeamCornerStats.objects.get(team=self.lens)
+        self.assertEqual((lens.home_corners_for_1h, lens.away_corners_for_1h), (21, 12))
+
+    # E5
+    def test_merge_keeps_every_section_of_a_team(self):
+        rows: dict = {}
+        E5StatsWriter.merge(rows=rows, team_id=self.lens.id, values={"home_corners_for_1h": 21})
+        E5StatsWriter.merge(rows=rows, team_id=self.lens.id, values={"away_corners_for_1h": 12})
+        self.assertEqual(rows, {self.lens.id: {"home_corners_for_1h": 21, "away_corners_for_1h": 12}})
+
+
+################################################### SEASON STATS ROWS ##################################################
+# E5
+def corners_iframe(season: E5Season) -> E5CornersIframes:
+    return E5CornersIframes.objects.create(season=season, **{
+        spec.url_field: f"https://example.com/{season.id}/{spec.url_field}" for spec in E5GetCorners.TABLE_SPECS})
+
+
+# E5
+def corners_pages(iframe: E5CornersIframes, played: int = 10) -> dict[str, BeautifulSoup]:
+    # Lens and Lille on every side of every corners sheet, the count column is the page's slot
+    return {getattr(iframe, spec.url_field): sheet(
+        sheet_row(teams=("Lens", "Lille", "Lens"), groups=((played, slot, 1.5),) * 3),
+        sheet_row(teams=("Lille", "Lens", "Lille"), groups=((played, slot, 0.5),) * 3))
+        for slot, spec in enumerate(E5GetCorners.TABLE_SPECS)}
+
+
+# E5
+class E5SeasonStatsRowsTests(E5ScrapeTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        self.iframe: E5CornersIframes = corners_iframe(season=self.season)
+        self.scraper: E5GetCorners = E5GetCorners()
+        self.scraper.init()
+
+    # E5
+    def test_every_page_of_a_season_is_written_in_one_row_per_team(self):
+        self.serve_pages(scraper=self.scraper, pages=corners_pages(iframe=self.iframe))
+        with mock.patch.object(E5StatsWriter, "upsert", wraps=E5StatsWriter.upsert) as upsert:
+            self.scraper.parse_iframes()
+
+        # One write per stats model of the season, whatever the number of pages
+        self.assertEqual(upsert.call_count, 2)
+        lens: E5TeamCornerStats = E5TeamCornerStats.objects.get(team__name="Lens")
+        self.assertEqual((lens.home_corners_for_1h, lens.away_corners_for_2h, lens.overall_corners_against_ft),
+                         (0, 1, 5))
+        lille: E5MatchCornerStats = E5MatchCornerStats.objects.get(team__name="Lille")
+        self.assertEqual((lille.home_corners_1h_average, lille.overall_corners_ft), (0.5, 8))
+        self.assertEqual(E5TeamCornerStats.objects.count(), 2)
+
+    # E5
+    def test_a_failed_page_keeps_the_rest_of_the_season(self):
+        pages: dict[str, BeautifulSoup] = corners_pages(iframe=self.iframe)
+        del pages[self.iframe.match_corners_ft_url]
+        self.serve_pages(scraper=self.scraper, pages=pages)
+        with self.assertLogs(level="WARNING"):
+            self.scraper.parse_iframes()
+
+        lens: E5MatchCornerStats = E5MatchCornerStats.objects.get(team__name="Lens")
+        self.assertEqual((lens.overall_corners_2h, lens.overall_corners_ft), (7, None))
+
+
+#################################################### LOOKUP MIGRATION ##################################################
+# E5
+class E5LookupUniquenessMigrationTests(TransactionTestCase):
+    BEFORE: ClassVar[list[tuple[str, str]]] = [("Website", "0038_stats_unique_team")]
+    AFTER: ClassVar[list[tuple[str, str]]] = [("Website", "0039_lookup_indexes_and_uniqueness")]
+
+    # E5
+    def migrate(self, targets: list[tuple[str, str]]):
+        executor: MigrationExecutor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    # E5
+    def tearDown(self):
+        self.migrate(targets=MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    # E5
+    def test_duplicates_hand_their_rows_over_before_being_deleted(self):
+        apps = self.migrate(targets=self.BEFORE)
+        league_model, season_model, team_model = (apps.get_model("Website", name)
+                                                  for name in ("E5League", "E5Season", "E5Team"))
+        corners_model, match_corners_model = (apps.get_model("Website", name)
+                                              for name in ("E5TeamCornerStats", "E5MatchCornerStats"))
+        league = league_model.objects.create(name="Ligue 1", url="https://example.com/l1")
+        season, season_copy = (season_model.objects.create(name="2026", league=league, url="https://example.com/s",
+                                                           active=True) for _ in range(2))
+        lens = team_model.objects.create(name="Lens", season=season, url="https://example.com/lens")
+        lens_copy = team_model.objects.create(name="Lens", season=season_copy, url="https://example.com/lens")
+        lille_copy = team_model.objects.create(name="Lille", season=season_copy, url="https://example.com/lille")
+        corners_model.objects.create(team=lens, home_corners_for_1h=1)
+        corners_model.objects.create(team=lens_copy, home_corners_for_1h=2)
+        corners_model.objects.create(team=lille_copy, home_corners_for_1h=3)
+        match_corners_model.objects.create(team=lens_copy, home_corners_1h=4)
+
+        apps = self.migrate(targets=self.AFTER)
+        team_model, corners_model = apps.get_model("Website", "E5Team"), apps.get_model("Website", "E5TeamCornerStats")
+        self.assertEqual(apps.get_model("Website", "E5Season").objects.count(), 1)
+        self.assertEqual(sorted(team_model.objects.filter(season_id=season.id).values_list('name', flat=True)),
+                         ["Lens", "Lille"])
+        # The kept team keeps its own stats, the ones only the duplicates had follow them
+        self.assertEqual(corners_model.objects.get(team_id=lens.id).home_corners_for_1h, 1)
+        self.assertEqual(corners_model.objects.get(team__name="Lille").home_corners_for_1h, 3)
+        self.assertEqual(apps.get_model("Website", "E5MatchCornerStats").objects.get().team_id, lens.id)
+
+
+##################################################### QUERY PATHS CHECK ################################################
+# E5
+class E5QueryPathsCheckTests(SimpleTestCase):
+
+    # E5
+    def test_every_query_path_is_indexed(self):
+        self.assertEqual(check_query_paths_are_indexed(), [])
+
+    # E5
+    def test_unindexed_lookups_fail_the_regular_checks(self):
+        self.assertIn(check_query_paths_are_indexed, checks.registry.registry.get_checks())
+
+
+####################################################### SCHEDULER ######################################################
+# E5
+class E5SchedulerTests(SimpleTestCase):
+
+    # E5
+    def setUp(self):
+        self.ran: list[str] = []
+        self.failing: set[str] = set()
+
+    # E5
+    def runner(self, task: E5Task) -> None:
+        self.ran.append(task.name)
+        if task.name in self.failing:
+            raise RuntimeError(f"{task.name} failed")
+
+    # E5
+    def test_tasks_run_after_their_requirements(self):
+        tasks: list[E5Task] = [E5Task(name="parse", stage="parse", requires=("iframes", "table")),
+                               E5Task(name="iframes", stage="iframes", requires=("table",)),
+                               E5Task(name="table", stage="table")]
+        statuses: dict[str, str] = E5Scheduler(runner=self.runner).run(tasks=tasks)
+        self.assertEqual(self.ran, ["table", "iframes", "parse"])
+        self.assertEqual(set(statuses.values()), {E5Scheduler.STATUS_SUCCESS})
+
+    # E5
+    def test_unknown_and_duplicated_tasks_are_rejected_before_running(self):
+        with self.assertRaisesRegex(ValueError, "unknown tasks"):
+            E5Scheduler(runner=self.runner).run(tasks=[E5Task(name="parse", stage="parse", requires=("table",))])
+        with self.assertRaisesRegex(ValueError, "duplicated task"):
+            E5Scheduler(runner=self.runner).run(tasks=[E5Task(name="table", stage="table")] * 2)
+        self.assertEqual(self.ran, [])
+
+    # E5
+    def test_cycles_are_reported(self):
+        tasks: list[E5Task] = [E5Task(name="table", stage="table"),
+                               E5Task(name="a", stage="a", requires=("b", "table")),
+                               E5Task(name="b", stage="b", requires=("a",))]
+        with self.assertRaisesRegex(ValueError, r"dependency cycle between \['a', 'b'\]"):
+            E5Scheduler(runner=self.runner).run(tasks=tasks)
+        self.assertEqual(self.ran, ["table"])
+
+    # E5
+    def test_a_failure_skips_everything_depending_on_it(self):
+        # Dependents listed first, the whole chain is skipped in one go rather than read as a cycle
+        self.failing = {"table"}
+        tasks: list[E5Task] = [E5Task(name="parse", stage="parse", requires=("iframes",)),
+                               E5Task(name="iframes", stage="iframes", requires=("table",)),
+                               E5Task(name="table", stage="table"),
+                               E5Task(name="fixtures", stage="fixtures")]
+        with self.assertLogs(level="WARNING"):
+            statuses: dict[str, str] = E5Scheduler(runner=self.runner).run(tasks=tasks)
+        self.assertEqual(statuses, {"table": E5Scheduler.STATUS_FAILED, "iframes": E5Scheduler.STATUS_SKIPPED,
+                                    "parse": E5Scheduler.STATUS_SKIPPED, "fixtures": E5Scheduler.STATUS_SUCCESS})
+        self.assertEqual(sorted(self.ran), ["fixtures", "table"])
+
+    # E5
+    def test_parallelism_caps_the_tasks_running_at_once(self):
+        lock: threading.Lock = threading.Lock()
+        running: list[int] = [0, 0]
+
+        def runner(task: E5Task) -> None:
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        tasks: list[E5Task] = [E5Task(name=f"parse_{index}", stage="parse") for index in range(8)]
+        statuses: dict[str, str] = E5Scheduler(runner=runner, parallelism=3).run(tasks=tasks)
+        self.assertEqual(len(statuses), 8)
+        self.assertEqual(running[1], 3)
+
+
+####################################################### FRESHNESS ######################################################
+# E5
+class E5FreshnessTrackerTests(E5ScrapeTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        self.iframe: E5CornersIframes = corners_iframe(season=self.season)
+        for ranking, team in enumerate(E5Team.objects.filter(season=self.season), start=1):
+            E5TeamRanking.objects.create(team=team, ranking=ranking, matches_played=10, matches_won=5, matches_drawn=5,
+                                         matches_lost=0, goals_scored=10, goals_conceded=5, goals_difference=5,
+                                         points=20)
+
+    # E5
+    def parse(self, played: int) -> None:
+        scraper: E5GetCorners = E5GetCorners()
+        scraper.init()
+        self.serve_pages(scraper=scraper, pages=corners_pages(iframe=self.iframe, played=played))
+        scraper.parse_iframes()
+
+    # E5
+    def stale(self) -> list[E5CornersIframes]:
+        return E5FreshnessTracker.shared().stale_iframes(iframes=E5CornersIframes.objects.all())
+
+    # E5
+    def test_seasons_without_new_matches_are_skipped(self):
+        self.parse(played=10)
+        self.assertEqual(E5SeasonFreshness.objects.get(season=self.season, family="corners").matches_played, 20)
+        self.assertEqual(self.stale(), [])
+
+        E5TeamRanking.objects.filter(team__name="Lens").update(matches_played=11)
+        self.assertEqual(self.stale(), [self.iframe])
+
+    # E5
+    def test_pages_behind_the_league_table_are_parsed_again(self):
+        # The published sheet is not updated yet, what it showed is recorded rather than the league table's count
+        self.parse(played=9)
+        self.assertEqual(E5SeasonFreshness.objects.get(season=self.season, family="corners").matches_played, 18)
+        self.assertEqual(self.stale(), [self.iframe])
+
+    # E5
+    def test_a_failed_league_table_forces_the_parse(self):
+        self.parse(played=10)
+        E5FreshnessTracker.shared().league_table_failed(season_id=self.season.id)
+        self.assertEqual(self.stale(), [self.iframe])
+        E5FreshnessTracker.shared().league_table_saved(season_id=self.season.id)
+        self.assertEqual(self.stale(), [])
+
+    # E5
+    def test_home_and_away_count_when_a_family_has_no_overall_column(self):
+        rows: dict[int, dict] = {1: {"home_matches_played": 5, "away_matches_played": 4}, 2: {"home_win_percent": 50}}
+        self.assertEqual(E5FreshnessTracker.parsed_matches_played(rows=[rows]), 9)
+        self.assertIsNone(E5FreshnessTracker.parsed_matches_played(rows=[{2: {"home_win_percent": 50}}]))
+
+    # E5
+    def test_parse_commands_only_parse_every_season_with_full(self):
+        enabled: list[bool] = []
+        with mock.patch.object(E5Pipeline, "parse_iframes",
+                               side_effect=lambda family: enabled.append(E5FreshnessTracker.shared().enabled)):
+            call_command("E5ParseCornersIframes", stdout=io.StringIO())
+            call_command("E5ParseCornersIframes", "--full", stdout=io.StringIO())
+        self.assertEqual(enabled, [True, False])
+        # Closing the run skips unchanged seasons again
+        self.assertTrue(E5FreshnessTracker.shared().enabled)
+
+
+######################################################## PIPELINE ######################################################
+# E5
+class E5PipelineTests(E5ScrapeTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.pipeline: E5Pipeline = E5Pipeline(context=E5RunContext.from_settings())
+        self.tasks: list[E5Task] = E5ScrapeGraph.build(families=["corners"])
+
+    # E5
+    def test_a_stage_that_did_not_succeed_fails_its_task(self):
+        stages: dict[str, bool] = {"get_leagues": True, "get_seasons": True, "get_iframes": True,
+                                   "parse_league_tables": False, "get_teams": True, "get_upcoming_matches": True,
+                                   "parse_iframes": True}
+        with mock.patch.multiple(E5Pipeline, **{stage: mock.Mock(return_value=success)
+                                                for stage, success in stages.items()}):
+            with self.assertLogs(level="WARNING"), self.captureOnCommitCallbacks(execute=True):
+                statuses: dict[str, str] = self.pipeline.run(tasks=self.tasks)
+
+        self.assertEqual(statuses["parse_league_table_iframes"], E5Scheduler.STATUS_FAILED)
+        self.assertEqual({statuses[name] for name in ("get_teams", "get_upcoming_matches", "get_corners_iframes",
+                                                      "parse_corners_iframes")}, {E5Scheduler.STATUS_SKIPPED})
+        # Failed and skipped steps are left for a resumed run
+        self.assertEqual(self.pipeline.incomplete(tasks=self.tasks),
+                         ["parse_league_table_iframes", "get_teams", "get_upcoming_matches", "get_corners_iframes",
+                          "parse_corners_iframes"])
+
+    # E5
+    def test_the_page_cache_is_bumped_only_by_stages_that_wrote_rows(self):
+        season: E5Season = create_season(league="Test League", active=False)
+        scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+        page: str = '<div class="textwidget custom-html-widget"><p>Test League</p><p>Season {}</p></div>'
+
+        # The season is already saved as the page describes it
+        E5Season.objects.filter(id=season.id).update(url=season.league.url)
+        self.serve_pages(scraper=scraper, pages={season.league.url: BeautifulSoup(page.format(2026), "html.parser")})
+        self.pipeline.run_scraper(scraper=scraper, context="Get Seasons",
+                                  action=lambda: scraper.get_seasons(error_context="Get Seasons"))
+        self.assertEqual(E5PageCache.version(), 0)
+
+        # A new season is
+        self.serve_pages(scraper=scraper, pages={season.league.url: BeautifulSoup(page.format(2027), "html.parser")})
+        self.pipeline.run_scraper(scraper=scraper, context="Get Seasons",
+                                  action=lambda: scraper.get_seasons(error_context="Get Seasons"))
+        self.assertEqual(E5PageCache.version(), 1)
+        self.assertEqual(E5RunTelemetry.shared().written(name="Get Seasons"), 1)
+
+    # E5
+    def test_every_scrape_command_closes_its_run(self):
+        with mock.patch.object(E5Pipeline, "get_upcoming_matches", side_effect=RuntimeError("browser crashed")), \
+                mock.patch.object(E5Pipeline, "close") as close:
+            with self.assertRaises(RuntimeError):
+                call_command("E5GetJustUpcomingMatchs")
+        close.assert_called_once_with(success=False)
+
+    # E5
+    def test_the_family_schedule_covers_every_family_over_the_week(self):
+        scheduled: list[str] = [name for weekday in range(7)
+                                for name in E5ScrapeGraph.scheduled_family_names(weekday=weekday)]
+        # Every family twice a week, the first three days and the next three rotate the same groups
+        self.assertEqual(sorted(scheduled), sorted(E5ScrapeGraph.family_names() * 2))
+        self.assertEqual(E5ScrapeGraph.scheduled_family_names(weekday=6), [])
+
+    # E5
+    @override_settings(E5_FAMILY_SCHEDULE=True)
+    def test_get_all_only_runs_the_families_of_the_day_when_scheduled(self):
+        with mock.patch.object(E5Pipeline, "run") as run, mock.patch.object(E5Pipeline, "close"), \
+                mock.patch.object(timezone, "localdate", return_value=datetime.date(2026, 10, 13)):
+            call_command("E5GetAll", stdout=io.StringIO())
+            call_command("E5GetAll", "--families", "btts", stdout=io.StringIO())
+
+        # Tuesday, then the families given on the command line win over the schedule
+        ran: list[set[str]] = [{task.name for task in call.kwargs["tasks"] if task.name.startswith("parse_")}
+                               for call in run.call_args_list]
+        self.assertEqual(ran[0], {"parse_league_table_iframes", "parse_corners_iframes", "parse_cards_iframes",
+                                  "parse_half_time_full_time_iframes", "parse_1st_2nd_half_goals_iframes",
+                                  "parse_average_first_goal_time_iframes", "parse_early_goals_iframes"})
+        self.assertEqual(ran[1], {"parse_league_table_iframes", "parse_btts_iframes"})
+
+
+######################################################### JOURNAL ######################################################
+# E5
+class E5RunJournalTests(E5ScrapeTestCase):
+
+    # E5
+    def run_pipeline(self, stages: dict[str, bool], resume: bool = False) -> list[str]:
+        # Names of the steps that actually ran
+        ran: list[str] = []
+        pipeline: E5Pipeline = E5Pipeline(context=E5RunContext.from_settings())
+        tasks: list[E5Task] = E5ScrapeGraph.core_tasks()
+
+        def stage(name: str):
+            return lambda self, **options: ran.append(name) or stages.get(name, True)
+
+        with mock.patch.multiple(E5Pipeline, **{task.stage: stage(name=task.stage) for task in tasks}), \
+                self.assertLogs(level="INFO"), self.captureOnCommitCallbacks(execute=True):
+            pipeline.run(tasks=tasks, resume=resume)
+        pipeline.context.journal.finish(success=not pipeline.incomplete(tasks=tasks))
+        return ran
+
+    # E5
+    def test_a_resumed_run_only_does_what_the_interrupted_one_did_not(self):
+        self.assertEqual(self.run_pipeline(stages={"get_teams": False}),
+                         ["get_leagues", "get_seasons", "get_iframes", "parse_league_tables", "get_teams"])
+        self.assertEqual(self.run_pipeline(stages={}, resume=True), ["get_teams", "get_upcoming_matches"])
+
+        # A finished run is not resumed, everything runs again
+        self.assertEqual(len(self.run_pipeline(stages={}, resume=True)), 6)
+
+    # E5
+    def test_saved_seasons_are_not_parsed_again_on_resume(self):
+        season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        iframe: E5CornersIframes = corners_iframe(season=season)
+        E5RunJournal.shared().start()
+        scraper: E5GetCorners = E5GetCorners()
+        scraper.init()
+        self.serve_pages(scraper=scraper, pages=corners_pages(iframe=iframe))
+        with self.captureOnCommitCallbacks(execute=True):
+            scraper.parse_iframes()
+        self.assertTrue(E5RunJournal.shared().is_season_done(iframe=iframe, slots=len(E5GetCorners.TABLE_SPECS)))
+
+        # The same run picked up again by another process
+        E5RunJournal.SHARED = None
+        E5RunJournal.shared().start(resume=True)
+        scraper = E5GetCorners()
+        scraper.init()
+        # Any page it asked for would fail
+        self.serve_pages(scraper=scraper, pages={})
+        with self.assertNoLogs(level="WARNING"):
+            scraper.parse_iframes()
+
+
+######################################################## JOB QUEUE #####################################################
+# E5
+class E5JobQueueTests(TestCase):
+
+    # E5
+    def setUp(self):
+        self.seasons: list[E5Season] = [create_season(league=f"League {index}") for index in range(3)]
+        self.queue: E5JobQueue = E5JobQueue(lease_seconds=60, max_attempts=2)
+        self.queue.enqueue(family="corners", seasons=reversed(self.seasons))
+
+    # E5
+    def expire(self, job: E5ScrapeJob) -> None:
+        E5ScrapeJob.objects.filter(id=job.id).update(lease_expires_at=timezone.now() - datetime.timedelta(seconds=1))
+
+    # E5
+    def test_jobs_are_claimed_once_in_priority_order(self):
+        claimed: list[E5ScrapeJob] = [self.queue.claim(worker=f"worker-{index}") for index in range(4)]
+        self.assertEqual([job.season for job in claimed[:3]], list(reversed(self.seasons)))
+        self.assertIsNone(claimed[3])
+        self.assertEqual(self.queue.counts(), {E5ScrapeJob.STATUS_RUNNING: 3})
+
+    # E5
+    def test_an_expired_lease_is_taken_over(self):
+        job: E5ScrapeJob = self.queue.claim(worker="worker-0")
+        self.expire(job=job)
+        taken_over: E5ScrapeJob = self.queue.claim(worker="worker-1")
+        self.assertEqual((taken_over.id, taken_over.attempts), (job.id, 2))
+
+        # The first worker lost it and cannot report on it anymore
+        self.assertFalse(self.queue.heartbeat(job=job, worker="worker-0"))
+        self.assertFalse(self.queue.complete(job=job, worker="worker-0"))
+        self.assertTrue(self.queue.complete(job=taken_over, worker="worker-1"))
+
+    # E5
+    def test_failed_jobs_are_retried_then_given_up(self):
+        job: E5ScrapeJob = self.queue.claim(worker="worker-0")
+        self.queue.fail(job=job, worker="worker-0", error="timeout")
+        self.assertEqual(E5ScrapeJob.objects.get(id=job.id).status, E5ScrapeJob.STATUS_PENDING)
+
+        job = self.queue.claim(worker="worker-0")
+        self.queue.fail(job=job, worker="worker-0", error="timeout")
+        self.assertEqual(E5ScrapeJob.objects.get(id=job.id).status, E5ScrapeJob.STATUS_FAILED)
+
+        # Enqueuing again gives it a new set of attempts
+        self.queue.enqueue(family="corners", seasons=[job.season])
+        self.assertEqual(E5ScrapeJob.objects.get(id=job.id).status, E5ScrapeJob.STATUS_PENDING)
+
+    # E5
+    def test_a_worker_dying_on_the_last_attempt_fails_the_job(self):
+        job: E5ScrapeJob = self.queue.claim(worker="worker-0")
+        self.expire(job=job)
+        job = self.queue.claim(worker="worker-1")
+        self.expire(job=job)
+
+        # The next claim gives it up and moves on to another job
+        self.assertNotEqual(self.queue.claim(worker="worker-2").id, job.id)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.last_error), (E5ScrapeJob.STATUS_FAILED, "Lease expired"))
+
+    # E5
+    def test_claims_only_lock_the_job_row(self):
+        # SQLite has no row locks, check the claim PostgreSQL would run
+        select_for_update = QuerySet.select_for_update
+        with mock.patch.object(E5JobQueue, "can_skip_locked", return_value=True), \
+                mock.patch.object(QuerySet, "select_for_update", autospec=True,
+                                  side_effect=select_for_update) as lock:
+            job: E5ScrapeJob = self.queue.claim(worker="worker-0")
+        lock.assert_called_once_with(mock.ANY, skip_locked=True, of=('self',))
+        self.assertEqual((job.season, job.status), (self.seasons[2], E5ScrapeJob.STATUS_RUNNING))
+
+    # E5
+    def test_a_worker_resolves_the_teams_inserted_since_its_previous_job(self):
+        # A previous job of this worker loaded the season before a producer inserted the team
+        resolver: E5TeamResolver = E5TeamResolver()
+        with self.assertLogs(level="WARNING"):
+            resolver.resolve(season=self.seasons[2], name="Lens")
+        E5Team.objects.create(name="Lens", season=self.seasons[2], url="https://example.com/lens", slug="lens")
+
+        pipeline: mock.Mock = mock.Mock(context=mock.Mock(resolver=resolver))
+        pipeline.run_unit.side_effect = lambda family, season_id: resolver.resolve(
+            season=self.seasons[2], name="Lens") is not None
+        job: E5ScrapeJob = self.queue.claim(worker="worker-0")
+        self.assertTrue(E5ScrapeWorker().run_job(pipeline=pipeline, queue=self.queue, job=job, worker="worker-0"))
+
+
+####################################################### TELEMETRY ######################################################
+# E5
+class E5RunTelemetryTests(TestCase):
+
+    # E5
+    def setUp(self):
+        self.telemetry: E5RunTelemetry = E5RunTelemetry()
+
+    # E5
+    def test_counters_go_to_the_stage_of_their_thread(self):
+        with self.telemetry.stage(name="corners"):
+            self.telemetry.page(size=100, latency=0.2)
+            E5League.objects.count()
+
+            # A worker thread of the stage attaches itself to it
+            def fetch() -> None:
+                with self.telemetry.attached(name="corners"):
+                    self.telemetry.page(size=50, latency=0.1)
+            worker: threading.Thread = threading.Thread(target=fetch)
+            worker.start()
+            worker.join()
+        self.telemetry.rows(parsed=3)
+
+        corners: E5StageTelemetry = self.telemetry.stages["corners"]
+        self.assertEqual((corners.pages, corners.bytes, corners.queries), (2, 150, 1))
+        self.assertEqual(self.telemetry.stages[E5RunTelemetry.NO_STAGE].rows_parsed, 3)
+
+    # E5
+    def test_latency_percentiles_are_nearest_rank(self):
+        latencies: list[float] = [index / 1000 for index in range(1, 101)]
+        self.assertEqual(E5StageTelemetry.percentiles(latencies=latencies),
+                         {"p50": 51.0, "p90": 91.0, "p99": 100.0, "max": 100.0})
+        self.assertEqual(E5StageTelemetry.percentiles(latencies=[])["p90"], 0.0)
+
+    # E5
+    def test_finish_saves_the_report_row_and_json(self):
+        self.assertIsNone(self.telemetry.finish())
+
+        with self.telemetry.stage(name="corners"):
+            self.telemetry.page(size=100, latency=0.2)
+            self.telemetry.rows(parsed=2, skipped=1, written=2)
+        with tempfile.TemporaryDirectory() as report_dir, override_settings(E5_TELEMETRY_DIR=report_dir):
+            report: E5ScrapeReport = self.telemetry.finish()
+            (name,) = os.listdir(report_dir)
+            with open(os.path.join(report_dir, name)) as file:
+                saved: dict = json.load(file)
+
+        self.assertEqual((report.pages, report.rows_written, report.benchmark), (1, 2, False))
+        self.assertEqual(saved["stages"]["corners"]["rows_skipped"], 1)
+        self.assertEqual(saved, report.report)
+
+
+###################################################### PRIORITIZER #####################################################
+# E5
+def create_fixture(season: E5Season, days: int, kickoff_time: str = "15:00") -> E5Fixture:
+    home_team, away_team = E5Team.objects.filter(season=season).order_by('id')[:2]
+    return E5Fixture.objects.create(home_team=home_team, away_team=away_team, kickoff_time=kickoff_time,
+                                    date=datetime.date.today() + datetime.timedelta(days=days),
+                                    slug=f"{home_team.slug}-{away_team.slug}-{days}-{kickoff_time.replace(':', '')}")
+
+
+# E5
+class E5SeasonPrioritizerTests(TestCase):
+
+    # E5
+    def setUp(self):
+        self.later, self.idle, self.sooner, self.tonight = (
+            create_season(league=league, teams=("Home", "Away")) for league in ("Later", "Idle", "Sooner", "Tonight"))
+        create_fixture(season=self.later, days=5)
+        create_fixture(season=self.sooner, days=2, kickoff_time="21:00")
+        create_fixture(season=self.sooner, days=2, kickoff_time="13:30")
+        create_fixture(season=self.tonight, days=2, kickoff_time="TBC")
+        create_fixture(season=self.idle, days=-1)
+
+    # E5
+    def test_seasons_playing_soonest_come_first(self):
+        # A kickoff time that cannot be read counts from the start of its day
+        seasons: list[E5Season] = [self.later, self.idle, self.sooner, self.tonight]
+        self.assertEqual(E5SeasonPrioritizer().order_seasons(seasons=seasons),
+                         [self.tonight, self.sooner, self.later, self.idle])
+
+    # E5
+    def test_limit_and_horizon_drop_the_other_seasons(self):
+        seasons: list[E5Season] = [self.later, self.idle, self.sooner, self.tonight]
+        self.assertEqual(E5SeasonPrioritizer(limit=2).order_seasons(seasons=seasons), [self.tonight, self.sooner])
+        self.assertEqual(E5SeasonPrioritizer(horizon_hours=4 * 24).order_seasons(seasons=seasons),
+                         [self.tonight, self.sooner])
+
+    # E5
+    def test_iframes_follow_their_season(self):
+        iframes: list[E5CornersIframes] = [corners_iframe(season=season) for season in (self.later, self.sooner)]
+        self.assertEqual(E5SeasonPrioritizer().order_iframes(iframes=iframes), list(reversed(iframes)))
+
+
+###################################################### PAGE ARCHIVE ####################################################
+# E5
+class E5PageArchiveTests(E5ScrapeTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.archive: E5PageArchive = E5PageArchive.shared()
+
+    # E5
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    # E5
+    def test_pages_are_only_saved_when_recording(self):
+        self.archive.configure(mode=E5PageArchive.MODE_OFF, path=self.directory.name)
+        self.archive.record(url="https://example.com/a", body="<p>a</p>")
+        self.assertIsNone(self.archive.load(url="https://example.com/a"))
+
+        self.archive.configure(mode=E5PageArchive.MODE_RECORD, path=self.directory.name)
+        self.assertEqual(self.archive.record(url="https://example.com/a", body="<p>a</p>")[0], True)
+        self.assertEqual(self.archive.load(url="https://example.com/a"), "<p>a</p>")
+        with self.assertRaises(ValueError):
+            self.archive.configure(mode="rewind")
+
+    # E5
+    def test_a_replayed_parse_reads_the_archive_only(self):
+        season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        iframe: E5CornersIframes = corners_iframe(season=season)
+        self.archive.configure(mode=E5PageArchive.MODE_RECORD, path=self.directory.name)
+        for url, soup in corners_pages(iframe=iframe).items():
+            self.archive.record(url=url, body=str(soup))
+
+        self.archive.configure(mode=E5PageArchive.MODE_REPLAY, path=self.directory.name)
+        scraper: E5GetCorners = E5GetCorners()
+        scraper.init()
+        with mock.patch.object(E5HttpFetcher, "fetch", side_effect=AssertionError("network")), \
+                mock.patch.object(E5WebDriverPool, "borrow", side_effect=AssertionError("browser")):
+            scraper.parse_iframes()
+        self.assertEqual(E5MatchCornerStats.objects.get(team__name="Lens").overall_corners_ft, 8)
+
+        # Pages missing from the archive fail like unreachable ones
+        scraper.get(url="https://example.com/missing", error_context="test")
+        self.assertEqual(scraper.status.error_type, E5SeleniumWebdriverError.ERROR_TYPE_GET_URL_FAILED)
+
+
+###################################################### STATS LOADER ####################################################
+# E5
+@override_settings(E5_PAGE_CACHE=False)
+class E5StatsLoaderTests(E5WebsiteTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille", "Metz"))
+        self.lens, self.lille, self.metz = E5Team.objects.filter(season=self.season).order_by('name')
+        E5TeamCornerStats.objects.create(team=self.lens, home_corners_for_1h=21)
+        E5MatchCornerStats.objects.create(team=self.lille, home_corners_1h=17)
+
+    # E5
+    def test_one_query_per_stats_model_whatever_the_number_of_teams(self):
+        with self.assertNumQueries(len(E5StatsLoader.MODELS)):
+            stats: dict[int, E5TeamStats] = E5StatsLoader.load(team_ids=[self.lens.id, self.lille.id, self.metz.id])
+        self.assertEqual(stats[self.lens.id].team_corners.home_corners_for_1h, 21)
+        self.assertIsNone(stats[self.lens.id].match_corners)
+
+        # Families never parsed render as empty rows
+        context: dict = stats[self.metz.id].context(prefix="ht")
+        self.assertEqual(len(context), len(E5StatsLoader.MODELS))
+        self.assertIsNone(context["ht_btts_stats"].pk)
+
+    # E5
+    def test_fixture_details_renders_both_teams_stats(self):
+        fixture: E5Fixture = create_fixture(season=self.season, days=1)
+        response = self.client.get(f"/fixture/{fixture.slug}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["ht_team_corners_stats"].home_corners_for_1h, 21)
+        self.assertEqual(response.context["at_match_corners_stats"].home_corners_1h, 17)
+        self.assertEqual(self.client.get("/fixture/does-not-exist").status_code, 404)
+
+
+######################################################## FIXTURES ######################################################
+# E5
+@override_settings(E5_PAGE_CACHE=False)
+class E5FixturesPageTests(E5WebsiteTestCase):
+
+    # E5
+    def test_upcoming_fixtures_are_grouped_by_date_then_league(self):
+        ligue_1, ligue_2 = (create_season(league=league, teams=("Home", "Away")) for league in ("Ligue 1", "Ligue 2"))
+        played: E5Fixture = create_fixture(season=ligue_1, days=-1)
+        late, early = create_fixture(season=ligue_2, days=1, kickoff_time="21:00"), create_fixture(
+            season=ligue_2, days=1, kickoff_time="13:00")
+        first: E5Fixture = create_fixture(season=ligue_1, days=1)
+        later: E5Fixture = create_fixture(season=ligue_1, days=3)
+
+        # The data version its validators come from, then fixtures with their teams, seasons and leagues at once
+        with self.assertNumQueries(2):
+            response = self.client.get("/fixtures")
+        fixture_days: dict = response.context["fixture_days"]
+        tomorrow: datetime.date = datetime.date.today() + datetime.timedelta(days=1)
+        self.assertEqual(list(fixture_days), [tomorrow, tomorrow + datetime.timedelta(days=2)])
+        self.assertEqual({league.name: fixtures for league, fixtures in fixture_days[tomorrow].items()},
+                         {"Ligue 1": [first], "Ligue 2": [early, late]})
+        self.assertNotContains(response, played.slug)
+        self.assertContains(response, later.slug)
+
+
+####################################################### PAGE CACHE #####################################################
+# E5
+class E5PageCacheTests(E5WebsiteTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.page_cache: E5PageCache = E5PageCache(wait_seconds=5.0)
+        self.renders: list[str] = []
+
+    # E5
+    def render(self, content: str = "page"):
+        # Counts the renders, content tells which one answered
+        def render() -> HttpResponse:
+            self.renders.append(content)
+            return HttpResponse(content=content)
+        return render
+
+    # E5
+    def test_a_page_is_rendered_once_per_token(self):
+        for token in ("1", "1", "2"):
+            response: HttpResponse = self.page_cache.get_or_render(path="/", token=token, render=self.render(token))
+            self.assertEqual(response.content, token.encode())
+        self.assertEqual(self.renders, ["1", "2"])
+
+    # E5
+    def test_the_stale_copy_is_served_while_another_request_rebuilds_the_page(self):
+        self.page_cache.get_or_render(path="/", token="1", render=self.render("old"))
+        self.page_cache.cache().add(E5PageCache.lock_key(path="/", token="2"), True)
+
+        response: HttpResponse = self.page_cache.get_or_render(path="/", token="2", render=self.render("new"))
+        self.assertEqual(response.content, b"old")
+        self.assertEqual(self.renders, ["old"])
+
+    # E5
+    def test_a_page_never_built_waits_for_the_request_building_it(self):
+        started, release = threading.Event(), threading.Event()
+
+        def render() -> HttpResponse:
+            started.set()
+            release.wait(timeout=5)
+            return self.render("built")()
+
+        builder: threading.Thread = threading.Thread(
+            target=lambda: self.page_cache.get_or_render(path="/", token="1", render=render))
+        builder.start()
+        started.wait(timeout=5)
+        threading.Timer(interval=0.2, function=release.set).start()
+        response: HttpResponse = self.page_cache.get_or_render(path="/", token="1", render=self.render("twice"))
+        builder.join()
+
+        self.assertEqual(response.content, b"built")
+        self.assertEqual(self.renders, ["built"])
+
+    # E5
+    def test_waiting_requests_stop_once_the_page_turned_out_not_cacheable(self):
+        started: threading.Event = threading.Event()
+
+        def render() -> HttpResponse:
+            started.set()
+            time.sleep(0.3)
+            return HttpResponse(status=404)
+
+        builder: threading.Thread = threading.Thread(
+            target=lambda: self.page_cache.get_or_render(path="/missing", token="1", render=render))
+        builder.start()
+        started.wait(timeout=5)
+        start: float = time.monotonic()
+        response: HttpResponse = self.page_cache.get_or_render(
+            path="/missing", token="1", render=lambda: HttpResponse(status=404))
+        builder.join()
+
+        # Rendered as soon as the builder let go of its lock, not once wait_seconds ran out
+        self.assertEqual(response.status_code, 404)
+        self.assertLess(time.monotonic() - start, 2)
+
+    # E5
+    def test_a_waiting_request_renders_the_page_itself_past_the_wait(self):
+        self.page_cache.wait_seconds = 0.1
+        self.page_cache.cache().add(E5PageCache.lock_key(path="/", token="1"), True)
+
+        response: HttpResponse = self.page_cache.get_or_render(path="/", token="1", render=self.render("late"))
+        self.assertEqual(response.content, b"late")
+        # Pages that failed are never cached
+        self.page_cache.get_or_render(path="/404", token="1", render=lambda: HttpResponse(status=404))
+        self.assertIsNone(self.page_cache.cache().get(E5PageCache.key(path="/404")))
+
+
+####################################################### NAVIGATION #####################################################
+# E5
+class E5NavigationTests(E5WebsiteTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.navigation: E5Navigation = E5Navigation.shared()
+        create_season(league="Ligue 1")
+        self.navigation.invalidate()
+
+    # E5
+    @staticmethod
+    def request():
+        return RequestFactory().get("/")
+
+    # E5
+    def test_leagues_are_loaded_once_per_data_version(self):
+        with self.assertNumQueries(2):
+            self.assertEqual([league.name for league in self.navigation.get_leagues(request=self.request())],
+                             ["Ligue 1"])
+        # Only the data version is read again, not at all when the page cache already did
+        with self.assertNumQueries(1):
+            self.navigation.get_league(request=self.request(), slug="ligue-1")
+        request = self.request()
+        request.data_version = E5PageCache.version()
+        with self.assertNumQueries(0):
+            self.navigation.get_league(request=request, slug="ligue-1")
+
+    # E5
+    def test_a_bumped_version_reloads_the_leagues_saved_by_other_processes(self):
+        self.navigation.get_leagues(request=self.request())
+        # bulk_create sends no signal, like a scrape running in another process
+        E5League.objects.bulk_create([E5League(name="Ligue 2", url="https://example.com/Ligue 2", slug="ligue-2")])
+        with self.assertRaises(Http404):
+            self.navigation.get_league(request=self.request(), slug="ligue-2")
+
+        E5PageCache.bump()
+        self.assertEqual(self.navigation.get_league(request=self.request(), slug="ligue-2").name, "Ligue 2")
+
+    # E5
+    def test_leagues_saved_by_this_process_invalidate_the_navigation(self):
+        self.navigation.get_leagues(request=self.request())
+        create_season(league="Ligue 2")
+        self.assertEqual([league.name for league in self.navigation.get_leagues(request=self.request())],
+                         ["Ligue 1", "Ligue 2"])
+
+    # E5
+    @override_settings(E5_PAGE_CACHE=False)
+    def test_unknown_leagues_are_not_found(self):
+        with self.assertRaises(Http404):
+            self.navigation.get_league(request=self.request(), slug="ligue-3")
+        self.assertEqual(self.client.get("/league/ligue-3").status_code, 404)
+
+
+########################################################## API #########################################################
+# E5
+class E5ApiTests(E5WebsiteTestCase):
+
+    # E5
+    def test_leagues_are_paginated_on_their_id(self):
+        for league in ("Ligue 1", "Ligue 2", "National"):
+            create_season(league=league)
+
+        first: dict = self.client.get("/api/v1/leagues?limit=2").json()
+        self.assertEqual((first["count"], [row["name"] for row in first["results"]]), (3, ["Ligue 1", "Ligue 2"]))
+        last: dict = self.client.get(f"/api/v1/leagues?limit=2&cursor={first['next_cursor']}").json()
+        self.assertEqual([row["name"] for row in last["results"]], ["National"])
+        self.assertIsNone(last["next_cursor"])
+
+    # E5
+    def test_fields_restrict_the_columns_and_keep_the_cursor(self):
+        create_season(league="Ligue 1")
+        rows: list[dict] = self.client.get("/api/v1/leagues?fields=slug").json()["results"]
+        self.assertEqual([set(row) for row in rows], [{"id", "slug"}])
+
+        for query in ("fields=slug,password", "limit=0", "limit=1001", "cursor=-1", "cursor=first"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/v1/leagues?{query}")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+
+    # E5
+    def test_league_stats_are_found_by_league_and_family(self):
+        season: E5Season = create_season(league="Ligue 1", teams=("Lens",))
+        E5TeamCornerStats.objects.create(team=E5Team.objects.get(season=season), home_corners_for_1h=21)
+
+        rows: list[dict] = self.client.get("/api/v1/league/ligue-1/team_corners").json()["results"]
+        self.assertEqual([(row["team__name"], row["home_corners_for_1h"]) for row in rows], [("Lens", 21)])
+        self.assertEqual(self.client.get("/api/v1/league/ligue-1/penalties").status_code, 404)
+        self.assertEqual(self.client.get("/api/v1/league/ligue-3/team_corners").status_code, 404)
+
+    # E5
+    def test_a_team_of_several_seasons_is_the_one_of_its_active_season(self):
+        previous: E5Season = create_season(league="Ligue 1", name="2025", active=False, teams=("Lens",))
+        latest: E5Season = create_season(league="Ligue 1", name="2026", active=False, teams=("Lens",))
+        team: dict = self.client.get("/api/v1/team/ligue-1/lens?families=team_corners").json()["team"]
+        self.assertEqual(team["season_id"], latest.id)
+
+        E5Season.objects.filter(id=previous.id).update(active=True)
+        team = self.client.get("/api/v1/team/ligue-1/lens?families=team_corners").json()["team"]
+        self.assertEqual(team["season_id"], previous.id)
+
+        self.assertEqual(self.client.get("/api/v1/team/ligue-1/lens?families=penalties").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/team/ligue-1/metz").status_code, 404)
+
+    # E5
+    def test_an_unchanged_payload_is_not_sent_again(self):
+        create_season(league="Ligue 1", teams=("Lens",))
+        for url in ("/api/v1/leagues", "/api/v1/team/ligue-1/lens"):
+            with self.subTest(url=url):
+                etag: str = self.client.get(url)["ETag"]
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+
+
+###################################################### STATIC EXPORT ###################################################
+# E5
+@override_settings(E5_PAGE_CACHE=False)
+class E5StaticExporterTests(E5WebsiteTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        self.output: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.exporter: E5StaticExporter = E5StaticExporter(output=self.output.name)
+        self.pages: dict[str, bytes | None] = {"/": b"index", "/leagues": b"leagues"}
+
+    # E5
+    def tearDown(self):
+        self.output.cleanup()
+        super().tearDown()
+
+    # E5
+    def export(self, leagues: list[str] | None = None) -> E5StaticExporter:
+        # Pages come from self.pages, None for a page that fails to render
+        self.exporter = E5StaticExporter(output=self.output.name)
+        with mock.patch.object(E5StaticExporter, "paths", return_value=list(self.pages)), \
+                mock.patch.object(E5StaticExporter, "render", side_effect=lambda path: self.pages[path]):
+            self.exporter.export(leagues=leagues)
+        return self.exporter
+
+    # E5
+    def read(self, path: str) -> bytes:
+        with open(self.exporter.fullpath(path=path), "rb") as file:
+            return file.read()
+
+    # E5
+    def test_paths_cover_the_active_leagues_with_their_teams_and_upcoming_fixtures(self):
+        season: E5Season = create_season(league="Ligue 1", teams=("Lens", "Lille"))
+        create_season(league="Ligue 2", teams=("Metz",))
+        create_season(league="National", active=False, teams=("Sedan",))
+        fixture: E5Fixture = create_fixture(season=season, days=1)
+        played: E5Fixture = create_fixture(season=season, days=-1)
+
+        paths: list[str] = E5StaticExporter.paths(leagues=["ligue-1", "national"])
+        self.assertIn("/", paths)
+        self.assertIn("/league/ligue-1/corners", paths)
+        self.assertIn("/team/ligue-1/lens", paths)
+        self.assertIn(f"/fixture/{fixture.slug}", paths)
+        self.assertNotIn(f"/fixture/{played.slug}", paths)
+        self.assertFalse([path for path in paths if "ligue-2" in path or "national" in path or "/api/" in path])
+        self.assertIn("/team/ligue-2/metz", E5StaticExporter.paths())
+
+    # E5
+    def test_pages_are_rendered_by_their_view(self):
+        create_season(league="Ligue 1")
+        self.assertIn(b"Ligue 1", self.exporter.render(path="/leagues"))
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(self.exporter.render(path="/league/ligue-3"))
+
+    # E5
+    def test_only_changed_pages_are_written_again(self):
+        self.assertEqual(self.export().summary(), "2 written, 0 unchanged, 0 removed, 0 failed")
+        self.pages["/leagues"] = b"new leagues"
+        self.assertEqual(self.export().summary(), "1 written, 1 unchanged, 0 removed, 0 failed")
+        self.assertEqual(self.read(path="/leagues"), b"new leagues")
+        self.assertEqual(os.listdir(os.path.dirname(self.exporter.fullpath(path="/leagues"))), ["index.html"])
+
+    # E5
+    def test_a_page_that_failed_keeps_its_previous_export(self):
+        self.export()
+        self.pages["/leagues"] = None
+        self.assertEqual(self.export().summary(), "0 written, 1 unchanged, 0 removed, 1 failed")
+        self.assertEqual(self.read(path="/leagues"), b"leagues")
+
+    # E5
+    def test_only_a_full_export_removes_the_pages_gone_from_the_site(self):
+        self.export()
+        del self.pages["/leagues"]
+        self.assertEqual(self.export(leagues=["ligue-1"]).removed, 0)
+        self.assertEqual(self.export().removed, 1)
+        self.assertFalse(os.path.exists(os.path.dirname(self.exporter.fullpath(path="/leagues"))))
+        self.assertEqual(self.read(path="/"), b"index")
+
+    # E5
+    def test_changed_leagues_are_those_parsed_since_the_run_started(self):
+        started_at: datetime.datetime = timezone.now()
+        for league in ("Ligue 1", "Ligue 2"):
+            E5SeasonFreshness.objects.create(season=create_season(league=league), family="corners", matches_played=1)
+        E5SeasonFreshness.objects.filter(season__league__slug="ligue-2").update(
+            date_updated=started_at - datetime.timedelta(hours=1))
+        self.assertEqual(E5StaticExporter.changed_leagues(since=started_at), ["ligue-1"])
+
+        # New fixtures need their page even when the stats of their league did not change
+        create_fixture(season=create_season(league="National", teams=("Home", "Away")), days=1)
+        self.assertEqual(E5StaticExporter.changed_leagues(since=started_at), ["ligue-1", "national"])
+
+    # E5
+    def test_get_all_cannot_export_the_families_it_queues(self):
+        with self.assertRaisesMessage(CommandError, "--enqueue"):
+            call_command("E5GetAll", "--enqueue", "--export")
+
+
+################################################## CONDITIONAL REQUESTS ################################################
+# E5
+@override_settings(E5_PAGE_CACHE=True, E5_BUILD_ID="build-1")
+class E5ConditionalPageTests(E5WebsiteTestCase):
+
+    # E5
+    def setUp(self):
+        super().setUp()
+        create_season(league="Ligue 1")
+
+    # E5
+    def test_a_current_copy_is_not_sent_again(self):
+        response = self.client.get("/leagues")
+        self.assertEqual(response.status_code, 200)
+        not_modified = self.client.get("/leagues", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual((not_modified.status_code, not_modified.content), (304, b""))
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
+        # New stats change the validators
+        E5PageCache.bump()
+        self.assertEqual(self.client.get("/leagues", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 200)
+
+    # E5
+    def test_a_current_copy_is_not_rendered_again_once_evicted_from_the_cache(self):
+        etag: str = self.client.get("/leagues")["ETag"]
+        caches["default"].clear()
+        # Only the data version is read
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get("/leagues", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    # E5
+    @override_settings(E5_PAGE_CACHE=False)
+    def test_validators_do_not_depend_on_the_server_side_cache(self):
+        E5PageCache.SHARED = None
+        E5PageCache.bump()
+        response = self.client.get("/leagues")
+        self.assertTrue(response.has_header("Last-Modified"))
+        self.assertIn("max-age", response["Cache-Control"])
+        self.assertEqual(self.client.get("/leagues", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    # E5
+    def test_every_bump_moves_the_last_modified_date(self):
+        E5PageCache.bump()
+        E5DataVersion.objects.filter(id=E5PageCache.VERSION_ID).update(
+            date_updated=timezone.now() - datetime.timedelta(days=1))
+        modified: str = self.client.get("/leagues")["Last-Modified"]
+        E5PageCache.bump()
+        self.assertEqual(self.client.get("/leagues", HTTP_IF_MODIFIED_SINCE=modified).status_code, 200)
+
+    # E5
+    def test_a_deploy_changes_the_validators(self):
+        etag: str = self.client.get("/leagues")["ETag"]
+        with override_settings(E5_BUILD_ID="build-2"):
+            E5PageCache.SHARED = None
+            response = self.client.get("/leagues", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    # E5
+    def test_urls_that_do_not_render_a_page_are_never_not_modified(self):
+        etag: str = self.client.get("/leagues")["ETag"]
+        response = self.client.get("/league/ligue-3", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("ETag"))
+
+    # E5
+    def test_the_build_defaults_to_a_stamp_of_the_website_sources(self):
+        with override_settings(E5_BUILD_ID=""):
+            E5PageCache.SHARED = None
+            self.assertEqual(E5PageCache.shared().build, E5PageCache.source_stamp())
+        self.assertRegex(E5PageCache.source_stamp(), r"^[0-9a-f]{12}$")
 
-# Create your tests here.
@@ -1,6 +1,6 @@
 from django.urls import path
 
-from Website import views
+from Website import api, views
 
 urlpatterns = [
     path('', views.index, name="Website-index"),
@@ -35,4 +35,9 @@ urlpatterns = [
     path('teams', views.teams, name="Website-teams"),
     path('fixtures', views.fixtures, name="Website-fixtures"),
     path('fixture/<slug:fixture_slug>', views.fixture_details, name="Website-fixture_details"),
+    path('api/v1/', api.api_index, name="Website-api_index"),
+    path('api/v1/leagues', api.api_leagues, name="Website-api_leagues"),
+    path('api/v1/league/<slug:league_slug>/<slug:family>', api.api_league_stats, name="Website-api_league_stats"),
+    path('api/v1/team/<slug:league_slug>/<slug:team_slug>', api.api_team, name="Website-api_team"),
+    path('api/v1/fixtures', api.api_fixtures, name="Website-api_fixtures"),
 ]
@@ -0,0 +1,49 @@
+import dataclasses
+import os
+import threading
+import time
+
+from e5toolbox.base.E5File import E5File
+
+
+# E5
+@dataclasses.dataclass
+class E5CookieStore:
+    fullpath: str = ""
+    ttl: int = 7 * 24 * 3600
+    version: int = 0
+    cookies: list[dict] = dataclasses.field(default_factory=list)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    # ---------- LOAD -----------
+    def load(self) -> list[dict]:
+        with self.lock:
+            if not self.cookies and E5File.is_valid_path(isdir=False, path=self.fullpath):
+                success, _, data = E5File.load_json(fullpath=self.fullpath)
+                if success and isinstance(data, dict) and data.get("saved_at", 0) + self.ttl > time.time():
+                    self.cookies = data.get("cookies", [])
+            self.cookies = [cookie for cookie in self.cookies if not self.is_expired(cookie=cookie)]
+            return list(self.cookies)
+
+    # ---------- SAVE -----------
+    def save(self, cookies: list[dict]) -> (bool, str):
+        with self.lock:
+            self.cookies = list(cookies)
+            self.version += 1
+            return E5File.save_json(fullpath=self.fullpath, data={"saved_at": time.time(), "cookies": self.cookies})
+
+    # ---------- CLEAR -----------
+    def clear(self) -> None:
+        with self.lock:
+            self.cookies = []
+            self.version += 1
+            # The file too, load() would read the rejected cookies back otherwise
+            try:
+                os.remove(self.fullpath)
+            except FileNotFoundError:
+                pass
+
+    # ---------- CHECK -----------
+    @staticmethod
+    def is_expired(cookie: dict) -> bool:
+        return "expiry" in cookie and cookie["expiry"] <= time.time()
@@ -22,6 +22,21 @@ class E5File:
             message = ex
         return success, message, data
 
+    @classmethod
+    def save_json(cls, fullpath: str, data: any) -> (bool, str):
+        success = False
+        message = ""
+        try:
+            # Write next to the target then swap, readers never see a half written file
+            tmp_fullpath: str = f"{fullpath}.tmp"
+            with open(file=tmp_fullpath, mode="w", encoding="utf-8") as writer:
+                simplejson.dump(data, writer)
+            os.replace(tmp_fullpath, fullpath)
+            success = True
+        except Exception as ex:
+            message = ex
+        return success, message
+
     # ---------- CHECK -----------
     @classmethod
     def is_valid_path(cls, isdir: bool, path: str) -> bool:
@@ -0,0 +1,57 @@
+import dataclasses
+import logging
+from typing import Hashable, Iterable
+
+import trio
+from django.conf import settings
+
+from e5toolbox.scrapper.E5HttpFetcher import E5HttpFetcher
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+
+
+# E5
+@dataclasses.dataclass
+class E5AsyncFetcher:
+    concurrency: int = 8
+    fetcher: E5HttpFetcher = None
+
+    # E5
+    def __post_init__(self):
+        if self.fetcher is None:
+            self.fetcher = E5HttpFetcher.shared()
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def from_settings(cls) -> "E5AsyncFetcher":
+        return cls(concurrency=max(1, getattr(settings, "E5_FETCH_CONCURRENCY", 8)))
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def fetch_all(self, jobs: Iterable[tuple[Hashable, str]]) -> dict[Hashable, str]:
+        # Failed pages are left out, callers fall back to the sequential path for them
+        pages: dict[Hashable, str] = {}
+        trio.run(self.run_nursery, list(jobs), pages, E5RunTelemetry.shared().current())
+        return pages
+
+    # E5
+    async def run_nursery(self, jobs: list[tuple[Hashable, str]], pages: dict[Hashable, str], stage: str) -> None:
+        limiter: trio.CapacityLimiter = trio.CapacityLimiter(self.concurrency)
+        async with trio.open_nursery() as nursery:
+            for key, url in jobs:
+                nursery.start_soon(self.fetch_one, limiter, key, url, pages, stage)
+
+    # E5
+    async def fetch_one(self, limiter: trio.CapacityLimiter, key: Hashable, url: str,
+                        pages: dict[Hashable, str], stage: str) -> None:
+        try:
+            # requests is blocking, the limiter bounds the worker threads as well as the open connections
+            pages[key] = await trio.to_thread.run_sync(self.fetch_in_stage, url, stage, limiter=limiter)
+        except Exception as ex:
+            logging.warning(msg=f"E5AsyncFetcher.fetch_one() : {key} : {url} : {ex}")
+
+    # E5
+    def fetch_in_stage(self, url: str, stage: str) -> str:
+        # Pages fetched by the worker threads count for the stage that prefetched them
+        with E5RunTelemetry.shared().attached(name=stage):
+            return self.fetcher.fetch(url=url)
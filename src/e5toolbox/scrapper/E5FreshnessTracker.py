@@ -0,0 +1,112 @@
+import dataclasses
+import logging
+import threading
+from typing import Any, ClassVar, Iterable, Optional
+
+from django.db.models import Sum
+
+from Website.models import E5SeasonFreshness, E5TeamRanking
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
+
+
+# E5
+@dataclasses.dataclass
+class E5FreshnessTracker:
+    SHARED: ClassVar[Optional["E5FreshnessTracker"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    enabled: bool = True
+    # League table's matches_played of each (family, season) when its parse started, recorded when the family's own
+    # pages do not carry any
+    snapshots: dict[tuple[str, int], int] = dataclasses.field(default_factory=dict)
+    # Seasons whose league table could not be refreshed by this run, it cannot tell whether they have new matches
+    failed_league_tables: set[int] = dataclasses.field(default_factory=set)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def family_of(iframe) -> str:
+        return E5ScrapeGraph.family_of(model_class=type(iframe).__name__)
+
+    # E5
+    @staticmethod
+    def matches_played(season_ids: Iterable[int]) -> dict[int, int]:
+        # Sum of the league table's matches played, it only moves when a match of the season was played
+        return {row['team__season']: row['played']
+                for row in E5TeamRanking.objects.filter(team__season__in=list(season_ids))
+                .values('team__season').annotate(played=Sum('matches_played'))}
+
+    # E5
+    @staticmethod
+    def parsed_matches_played(rows: Iterable[dict[int, dict[str, Any]]]) -> int | None:
+        # Matches played as the family's own pages report them, summed over the teams like the league table's
+        played: dict[int, int] = {}
+        for model_rows in rows:
+            for team_id, values in model_rows.items():
+                team_played: int | None = values.get("overall_matches_played")
+                if team_played is None and None not in (values.get("home_matches_played"),
+                                                        values.get("away_matches_played")):
+                    team_played = values["home_matches_played"] + values["away_matches_played"]
+                if team_played is not None:
+                    played[team_id] = max(played.get(team_id, 0), team_played)
+        return sum(played.values()) if played else None
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5FreshnessTracker":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls()
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def stale_iframes(self, iframes: Iterable) -> list:
+        iframes = list(iframes)
+        if not iframes:
+            return iframes
+
+        family: str = self.family_of(iframe=iframes[0])
+        season_ids: list[int] = [iframe.season_id for iframe in iframes]
+        played: dict[int, int] = self.matches_played(season_ids=season_ids)
+        recorded: dict[int, int] = dict(E5SeasonFreshness.objects.filter(season__in=season_ids, family=family)
+                                        .values_list('season', 'matches_played'))
+
+        stale: list = []
+        for iframe in iframes:
+            season_played: int | None = played.get(iframe.season_id)
+            # Seasons without a current league table are always parsed, so are families whose pages lag behind it
+            if (not self.enabled or season_played is None or iframe.season_id in self.failed_league_tables
+                    or recorded.get(iframe.season_id) != season_played):
+                stale.append(iframe)
+                if season_played is not None:
+                    with self.lock:
+                        self.snapshots[(family, iframe.season_id)] = season_played
+
+        logging.info(msg=f"E5FreshnessTracker.stale_iframes() : {family} : {len(stale)}/{len(iframes)} seasons with "
+                         f"new matches")
+        return stale
+
+    # E5
+    def league_table_failed(self, season_id: int) -> None:
+        with self.lock:
+            self.failed_league_tables.add(season_id)
+
+    # E5
+    def league_table_saved(self, season_id: int) -> None:
+        with self.lock:
+            self.failed_league_tables.discard(season_id)
+
+    # E5
+    def record(self, iframe, matches_played: int | None = None) -> None:
+        # What the family's pages showed, a page still behind the league table is parsed again by the next run
+        family: str = self.family_of(iframe=iframe)
+        with self.lock:
+            season_played: int | None = self.snapshots.pop((family, iframe.season_id), None)
+        if matches_played is not None:
+            season_played = matches_played
+        if season_played is not None:
+            E5SeasonFreshness.objects.update_or_create(season_id=iframe.season_id, family=family,
+                                                       defaults={'matches_played': season_played})
@@ -0,0 +1,65 @@
+import atexit
+import dataclasses
+import threading
+import time
+from typing import ClassVar, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+
+
+# E5
+@dataclasses.dataclass
+class E5HttpFetcher:
+    SHARED: ClassVar[Optional["E5HttpFetcher"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    HEADERS: ClassVar[dict[str, str]] = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    pool_size: int = 10
+    timeout: float = 20.0
+    session: requests.Session = None
+
+    # E5
+    def __post_init__(self):
+        if self.session is None:
+            # Keep-alive connections are reused across every page of the run
+            adapter: HTTPAdapter = HTTPAdapter(
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size,
+                max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)))
+            self.session = requests.Session()
+            self.session.headers.update(self.HEADERS)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5HttpFetcher":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls(pool_size=max(1, getattr(settings, "E5_HTTP_POOL_SIZE", 10)),
+                                 timeout=getattr(settings, "E5_HTTP_TIMEOUT", 20.0))
+                atexit.register(cls.SHARED.close)
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def fetch(self, url: str) -> str:
+        start: float = time.perf_counter()
+        response: requests.Response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        E5RunTelemetry.shared().page(size=len(response.content), latency=time.perf_counter() - start)
+        return response.text
+
+    # E5
+    def close(self) -> None:
+        self.session.close()
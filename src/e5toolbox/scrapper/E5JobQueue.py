@@ -0,0 +1,130 @@
+import dataclasses
+import datetime
+import threading
+from typing import ClassVar, Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from Website.models import E5ScrapeJob, E5Season
+
+
+# E5
+@dataclasses.dataclass
+class E5JobQueue:
+    # Serialises claims inside a process when the database cannot skip locked rows
+    CLAIM_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    lease_seconds: int = 600
+    max_attempts: int = 3
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def can_skip_locked() -> bool:
+        return connection.features.has_select_for_update_skip_locked
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def from_settings(cls) -> "E5JobQueue":
+        return cls(lease_seconds=getattr(settings, "E5_JOB_LEASE_SECONDS", 600),
+                   max_attempts=getattr(settings, "E5_JOB_MAX_ATTEMPTS", 3))
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def lease_until(self) -> datetime.datetime:
+        return timezone.now() + datetime.timedelta(seconds=self.lease_seconds)
+
+    # E5
+    def claimable(self):
+        # Pending jobs, and running jobs whose worker stopped renewing its lease
+        return (E5ScrapeJob.objects
+                .filter(Q(status=E5ScrapeJob.STATUS_PENDING)
+                        | Q(status=E5ScrapeJob.STATUS_RUNNING, lease_expires_at__lt=timezone.now()),
+                        status__in=(E5ScrapeJob.STATUS_PENDING, E5ScrapeJob.STATUS_RUNNING),
+                        attempts__lt=self.max_attempts)
+                .order_by('priority', 'id'))
+
+    # E5
+    def enqueue(self, family: str, seasons: Iterable[E5Season]) -> int:
+        # One row per (family, season), enqueuing again resets a finished or failed unit
+        # Seasons come in priority order, workers claim them in the same order
+        jobs: list[E5ScrapeJob] = [E5ScrapeJob(family=family, season=season, status=E5ScrapeJob.STATUS_PENDING,
+                                               priority=priority, attempts=0, worker="", last_error="")
+                                   for priority, season in enumerate(seasons)]
+        E5ScrapeJob.objects.bulk_create(objs=jobs, update_conflicts=True, unique_fields=['family', 'season'],
+                                        update_fields=['status', 'priority', 'attempts', 'worker', 'last_error',
+                                                       'date_updated'])
+        return len(jobs)
+
+    # E5
+    def reap(self) -> int:
+        # Jobs whose worker died on their last attempt are given up instead of staying running forever
+        return (E5ScrapeJob.objects
+                .filter(status=E5ScrapeJob.STATUS_RUNNING, lease_expires_at__lt=timezone.now(),
+                        attempts__gte=self.max_attempts)
+                .update(status=E5ScrapeJob.STATUS_FAILED, lease_expires_at=None, last_error="Lease expired"))
+
+    # E5
+    def claim(self, worker: str) -> E5ScrapeJob | None:
+        self.reap()
+        if self.can_skip_locked():
+            # PostgreSQL : concurrent workers skip the rows another worker is claiming instead of waiting on them
+            # Only the job row is locked, locking its joined season would hide the other families of that season
+            with transaction.atomic():
+                job: E5ScrapeJob | None = (self.claimable().select_for_update(skip_locked=True, of=('self',))
+                                           .select_related('season').first())
+                if job is None:
+                    return None
+                self.take(job=job, worker=worker)
+                return job
+
+        # SQLite : the database is locked as a whole, claim with a compare and set on the job's lease
+        with self.CLAIM_LOCK:
+            for job in self.claimable().select_related('season')[:10]:
+                claimed: int = (E5ScrapeJob.objects
+                                .filter(id=job.id, status=job.status, attempts=job.attempts)
+                                .update(status=E5ScrapeJob.STATUS_RUNNING, worker=worker, attempts=F('attempts') + 1,
+                                        heartbeat_at=timezone.now(), lease_expires_at=self.lease_until()))
+                if claimed:
+                    job.refresh_from_db()
+                    return job
+        return None
+
+    # E5
+    def take(self, job: E5ScrapeJob, worker: str) -> None:
+        job.status = E5ScrapeJob.STATUS_RUNNING
+        job.worker = worker
+        job.attempts += 1
+        job.heartbeat_at = timezone.now()
+        job.lease_expires_at = self.lease_until()
+        job.save(update_fields=['status', 'worker', 'attempts', 'heartbeat_at', 'lease_expires_at', 'date_updated'])
+
+    # E5
+    def heartbeat(self, job: E5ScrapeJob, worker: str) -> bool:
+        # False once the lease was lost, another worker may have taken the job over
+        return bool(E5ScrapeJob.objects
+                    .filter(id=job.id, worker=worker, status=E5ScrapeJob.STATUS_RUNNING)
+                    .update(heartbeat_at=timezone.now(), lease_expires_at=self.lease_until()))
+
+    # E5
+    def complete(self, job: E5ScrapeJob, worker: str) -> bool:
+        return bool(E5ScrapeJob.objects
+                    .filter(id=job.id, worker=worker, status=E5ScrapeJob.STATUS_RUNNING)
+                    .update(status=E5ScrapeJob.STATUS_DONE, lease_expires_at=None, last_error=""))
+
+    # E5
+    def fail(self, job: E5ScrapeJob, worker: str, error: str) -> bool:
+        # Retried until max_attempts, then left failed until the next enqueue
+        status: str = E5ScrapeJob.STATUS_FAILED if job.attempts >= self.max_attempts else E5ScrapeJob.STATUS_PENDING
+        return bool(E5ScrapeJob.objects
+                    .filter(id=job.id, worker=worker, status=E5ScrapeJob.STATUS_RUNNING)
+                    .update(status=status, lease_expires_at=None, last_error=error[:2000]))
+
+    # E5
+    def counts(self) -> dict[str, int]:
+        return {row['status']: row['jobs'] for row in
+                E5ScrapeJob.objects.values('status').annotate(jobs=Count('id'))}
@@ -0,0 +1,82 @@
+import dataclasses
+import hashlib
+import os
+import threading
+from typing import ClassVar, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from e5toolbox.base.E5File import E5File
+
+
+# E5
+@dataclasses.dataclass
+class E5PageArchive:
+    SHARED: ClassVar[Optional["E5PageArchive"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    MODE_OFF: ClassVar[str] = "off"
+    # Every page served by E5SeleniumWebDriver.get() is saved
+    MODE_RECORD: ClassVar[str] = "record"
+    # E5SeleniumWebDriver.get() serves the saved pages, no browser and no network
+    MODE_REPLAY: ClassVar[str] = "replay"
+    MODES: ClassVar[tuple[str, ...]] = (MODE_OFF, MODE_RECORD, MODE_REPLAY)
+
+    mode: str = MODE_OFF
+    path: str = "page_archive"
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5PageArchive":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls(mode=getattr(settings, "E5_PAGE_ARCHIVE_MODE", cls.MODE_OFF),
+                                 path=str(getattr(settings, "E5_PAGE_ARCHIVE_DIR", "page_archive")))
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def configure(self, mode: str | None = None, path: str | None = None) -> None:
+        # None keeps the settings value
+        mode = mode or getattr(settings, "E5_PAGE_ARCHIVE_MODE", self.MODE_OFF)
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown page archive mode {mode}, expected one of {', '.join(self.MODES)}")
+        self.mode = mode
+        self.path = path or str(getattr(settings, "E5_PAGE_ARCHIVE_DIR", "page_archive"))
+
+    # E5
+    def recording(self) -> bool:
+        return self.mode == self.MODE_RECORD
+
+    # E5
+    def replaying(self) -> bool:
+        return self.mode == self.MODE_REPLAY
+
+    # E5
+    def fullpath(self, url: str) -> str:
+        # Pages are spread over sub directories, an archive holds a page per season and per stat page
+        key: str = self.key(url=url)
+        return os.path.join(self.path, key[:2], f"{key}.json")
+
+    # E5
+    def record(self, url: str, body: str) -> tuple[bool, str]:
+        if not self.recording():
+            return True, ""
+        fullpath: str = self.fullpath(url=url)
+        os.makedirs(os.path.dirname(fullpath), exist_ok=True)
+        return E5File.save_json(fullpath=fullpath, data={"url": url, "body": body,
+                                                         "fetched_at": timezone.now().isoformat()})
+
+    # E5
+    def load(self, url: str) -> str | None:
+        success, message, data = E5File.load_json(fullpath=self.fullpath(url=url))
+        if not success or data.get("url") != url:
+            return None
+        return data["body"]
@@ -0,0 +1,283 @@
+import dataclasses
+import datetime
+import logging
+from typing import Callable, ClassVar
+
+import django.apps
+from django.conf import settings
+
+from Website.cache import E5PageCache
+from Website.models import E5ScrapeReport
+
+from e5toolbox.scrapper.E5FreshnessTracker import E5FreshnessTracker
+from e5toolbox.scrapper.E5HttpFetcher import E5HttpFetcher
+from e5toolbox.scrapper.E5PageArchive import E5PageArchive
+from e5toolbox.scrapper.E5RunJournal import E5RunJournal
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph, E5StatsFamily
+from e5toolbox.scrapper.E5Scheduler import E5Scheduler, E5Task
+from e5toolbox.scrapper.E5SeasonPrioritizer import E5SeasonPrioritizer
+from e5toolbox.scrapper.E5SeleniumWebdriver import E5SeleniumWebDriver
+from e5toolbox.scrapper.E5TeamResolver import E5TeamResolver
+from e5toolbox.scrapper.E5WebDriverPool import E5WebDriverPool
+from e5toolbox.scrapper.stats.get_1st_2nd_half_goals import E5Get1st2ndHalfGoals
+from e5toolbox.scrapper.stats.get_average_first_goal_time import E5GetAverageFirstGoalTime
+from e5toolbox.scrapper.stats.get_average_team_goals import E5GetAverageTeamGoals
+from e5toolbox.scrapper.stats.get_btts import E5GetBTTS
+from e5toolbox.scrapper.stats.get_cards import E5GetCards
+from e5toolbox.scrapper.stats.get_clean_sheets import E5GetCleanSheets
+from e5toolbox.scrapper.stats.get_corners import E5GetCorners
+from e5toolbox.scrapper.stats.get_early_goals import E5GetEarlyGoals
+from e5toolbox.scrapper.stats.get_half_time_full_time import E5GetHalfTimeFullTime
+from e5toolbox.scrapper.stats.get_late_goals import E5GetLateGoals
+from e5toolbox.scrapper.stats.get_league_tables import E5GetLeagueTables
+from e5toolbox.scrapper.stats.get_over_05_goals import E5GetOver05Goals
+from e5toolbox.scrapper.stats.get_over_15_goals import E5GetOver15Goals
+from e5toolbox.scrapper.stats.get_over_25_goals import E5GetOver25Goals
+from e5toolbox.scrapper.stats.get_over_35_goals import E5GetOver35Goals
+from e5toolbox.scrapper.stats.get_rescued_points import E5GetRescuedPoints
+from e5toolbox.scrapper.stats.get_scored_both_halves import E5GetScoredBothHalves
+from e5toolbox.scrapper.stats.get_scored_first import E5GetScoredFirst
+from e5toolbox.scrapper.stats.get_win_draw_loss_percentage import E5GetWinDrawLossPercentage
+from e5toolbox.scrapper.stats.get_win_loss_margin import E5GetWinLossMargin
+from e5toolbox.scrapper.stats.get_won_both_halves import E5GetWonBothHalves
+from e5toolbox.scrapper.stats.get_won_to_nil import E5GetWonToNil
+
+
+# E5
+@dataclasses.dataclass
+class E5RunContext:
+    # Everything a run's stages share instead of rebuilding it stage after stage
+    drivers: E5WebDriverPool
+    fetcher: E5HttpFetcher
+    resolver: E5TeamResolver
+    freshness: E5FreshnessTracker
+    journal: E5RunJournal
+    telemetry: E5RunTelemetry
+    prioritizer: E5SeasonPrioritizer
+    archive: E5PageArchive
+    started_at: datetime.datetime = dataclasses.field(default_factory=datetime.datetime.now)
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def from_settings(cls, full: bool = False, max_seasons: int | None = None, horizon_hours: int | None = None,
+                      archive_mode: str | None = None, archive_path: str | None = None,
+                      parallelism: int | None = None) -> "E5RunContext":
+        context: E5RunContext = cls(drivers=E5WebDriverPool.shared(), fetcher=E5HttpFetcher.shared(),
+                                    resolver=E5TeamResolver.shared(), freshness=E5FreshnessTracker.shared(),
+                                    journal=E5RunJournal.shared(), telemetry=E5RunTelemetry.shared(),
+                                    prioritizer=E5SeasonPrioritizer.shared(), archive=E5PageArchive.shared())
+        # Without an explicit pool size, every step running at once gets a browser, a single step keeps the CPU count
+        if parallelism is not None and parallelism > 1 and not getattr(settings, "E5_WEBDRIVER_POOL_SIZE", 0):
+            context.drivers.resize(size=parallelism)
+        # Teams may have changed since a previous run of this process, the index is rebuilt on first use
+        context.resolver.invalidate()
+        context.freshness.enabled = not full
+        context.freshness.failed_league_tables.clear()
+        # A time boxed run only goes through the seasons playing soonest
+        context.prioritizer.limit = max_seasons if max_seasons is not None else getattr(
+            settings, "E5_PRIORITY_MAX_SEASONS", 0)
+        context.prioritizer.horizon_hours = horizon_hours if horizon_hours is not None else getattr(
+            settings, "E5_PRIORITY_HORIZON_HOURS", 0)
+        # Record the pages of a real run, or replay a recorded one
+        context.archive.configure(mode=archive_mode, path=archive_path)
+        context.telemetry.start()
+        return context
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def close(self, success: bool = True) -> E5ScrapeReport | None:
+        # The report is attached to the run before the journal lets go of it
+        report: E5ScrapeReport | None = self.telemetry.finish(run=self.journal.run, benchmark=self.archive.replaying())
+        self.journal.finish(success=success)
+        self.freshness.enabled = True
+        self.prioritizer.limit = getattr(settings, "E5_PRIORITY_MAX_SEASONS", 0)
+        self.prioritizer.horizon_hours = getattr(settings, "E5_PRIORITY_HORIZON_HOURS", 0)
+        self.archive.configure()
+        # Every stage borrowed its browser from the shared pool, quit them once at the end
+        self.drivers.close()
+        return report
+
+
+# E5
+@dataclasses.dataclass
+class E5Pipeline:
+    STATS_SCRAPERS: ClassVar[dict[str, type[E5SeleniumWebDriver]]] = {
+        "btts": E5GetBTTS,
+        "over_05_goals": E5GetOver05Goals,
+        "over_15_goals": E5GetOver15Goals,
+        "over_25_goals": E5GetOver25Goals,
+        "over_35_goals": E5GetOver35Goals,
+        "average_team_goals": E5GetAverageTeamGoals,
+        "corners": E5GetCorners,
+        "cards": E5GetCards,
+        "half_time_full_time": E5GetHalfTimeFullTime,
+        "1st_2nd_half_goals": E5Get1st2ndHalfGoals,
+        "average_first_goal_time": E5GetAverageFirstGoalTime,
+        "early_goals": E5GetEarlyGoals,
+        "win_draw_loss": E5GetWinDrawLossPercentage,
+        "scored_both_halves": E5GetScoredBothHalves,
+        "won_both_halves": E5GetWonBothHalves,
+        "rescued_points": E5GetRescuedPoints,
+        "clean_sheets": E5GetCleanSheets,
+        "won_to_nil": E5GetWonToNil,
+        "win_loss_margin": E5GetWinLossMargin,
+        "scored_first": E5GetScoredFirst,
+        "late_goals": E5GetLateGoals,
+    }
+
+    context: E5RunContext
+    parallelism: int = 1
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def get_class(class_str: str) -> type | None:
+        for models_class in django.apps.apps.get_models():
+            if models_class.__name__ == class_str:
+                return models_class
+        return None
+
+    # E5
+    @staticmethod
+    def run_scraper(scraper: E5SeleniumWebDriver, context: str, action: Callable[[], None]) -> bool:
+        # Timings, pages, rows and queries of the stage go to the run telemetry
+        telemetry: E5RunTelemetry = E5RunTelemetry.shared()
+        written: int = telemetry.written(name=context)
+        with telemetry.stage(name=context):
+            success: bool = E5Pipeline.run_stage(scraper=scraper, context=context, action=action)
+
+        # Rows the stage committed, even when it failed halfway, make the cached website pages stale
+        if telemetry.written(name=context) > written:
+            E5PageCache.shared().bump()
+        return success
+
+    # E5
+    @staticmethod
+    def run_stage(scraper: E5SeleniumWebDriver, context: str, action: Callable[[], None]) -> bool:
+        # Logging
+        scraper.log_info(message=f"{datetime.datetime.now()} : {context} start -----")
+
+        # Init driver
+        scraper.init()
+        if not scraper.status.success:
+            scraper.log_warning(f"{context} - {scraper.status.error_context} : {scraper.status.error_type} : "
+                                f"{scraper.status.exception}")
+
+        # Run stage
+        success: bool = scraper.status.success
+        if success:
+            action()
+            success = scraper.status.success
+            if not success:
+                scraper.log_warning(f"{context} - {scraper.status.error_context} : {scraper.status.error_type} : "
+                                    f"{scraper.status.exception}")
+
+        # Give the driver back
+        scraper.quit()
+        if not scraper.status.success:
+            scraper.log_warning(f"{context} - {scraper.status.error_context} : {scraper.status.error_type} : "
+                                f"{scraper.status.exception}")
+
+        # Logging
+        scraper.log_info(message=f"{datetime.datetime.now()} : {context} end -----")
+        return success
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def from_settings(cls, parallelism: int | None = None, full: bool = False, max_seasons: int | None = None,
+                      horizon_hours: int | None = None, archive_mode: str | None = None,
+                      archive_path: str | None = None) -> "E5Pipeline":
+        parallelism = parallelism or getattr(settings, "E5_SCHEDULER_PARALLELISM", 1)
+        return cls(context=E5RunContext.from_settings(full=full, max_seasons=max_seasons, horizon_hours=horizon_hours,
+                                                      archive_mode=archive_mode, archive_path=archive_path,
+                                                      parallelism=parallelism),
+                   parallelism=parallelism)
+
+    ###################################################### STAGES ######################################################
+    # E5
+    def get_leagues(self) -> bool:
+        scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+        return self.run_scraper(scraper=scraper, context="Get Leagues",
+                                action=lambda: scraper.get_leagues(error_context="Get Leagues"))
+
+    # E5
+    def get_seasons(self) -> bool:
+        scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+        return self.run_scraper(scraper=scraper, context="Get Seasons",
+                                action=lambda: scraper.get_seasons(error_context="Get Seasons"))
+
+    # E5
+    def get_teams(self) -> bool:
+        scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+        return self.run_scraper(scraper=scraper, context="Get Teams",
+                                action=lambda: scraper.get_teams(error_context="Get Teams"))
+
+    # E5
+    def get_upcoming_matches(self) -> bool:
+        scraper: E5SeleniumWebDriver = E5SeleniumWebDriver()
+        return self.run_scraper(scraper=scraper, context="Get Upcoming Matches",
+                                action=lambda: scraper.get_upcoming_matches(error_context="Get Upcoming Matches"))
+
+    # E5
+    def get_iframes(self, family: E5StatsFamily, season_ids: list[int] | None = None) -> bool:
+        scraper: E5SeleniumWebDriver = E5SeleniumWebDriver(season_ids=season_ids)
+        error_context: str = f"Get {family.label}s"
+        class_: type | None = self.get_class(class_str=family.model_class)
+
+        # Pages holding a single iframe and pages holding a tab per iframe are scraped differently
+        if family.iframe_length == 1:
+            action: Callable[[], None] = lambda: scraper.get_iframe(
+                endpoint=family.endpoint, error_context=error_context, save_message=family.label, class_=class_)
+        else:
+            action: Callable[[], None] = lambda: scraper.get_iframes(
+                endpoint=family.endpoint, error_context=error_context, iframe_length=family.iframe_length,
+                save_message=family.label, class_=class_)
+        return self.run_scraper(scraper=scraper, context=error_context, action=action)
+
+    # E5
+    def parse_league_tables(self) -> bool:
+        scraper: E5GetLeagueTables = E5GetLeagueTables()
+        return self.run_scraper(scraper=scraper, context=E5ScrapeGraph.LEAGUE_TABLE.parse_command,
+                                action=scraper.get_teams_ranking)
+
+    # E5
+    def parse_iframes(self, family: E5StatsFamily, season_ids: list[int] | None = None) -> bool:
+        scraper: E5SeleniumWebDriver = self.STATS_SCRAPERS[family.name](season_ids=season_ids)
+        return self.run_scraper(scraper=scraper, context=family.parse_command, action=scraper.parse_iframes)
+
+    # E5
+    def run_unit(self, family: E5StatsFamily, season_id: int) -> bool:
+        # A queued unit of work : discover then parse one family of one season
+        return (self.get_iframes(family=family, season_ids=[season_id])
+                and self.parse_iframes(family=family, season_ids=[season_id]))
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def run_task(self, task: E5Task) -> None:
+        # A resumed run skips the steps its previous attempt completed
+        if self.context.journal.is_done(stage=task.name):
+            logging.info(msg=f"E5Pipeline.run_task() : {task.name} already completed by run {self.context.journal.run}")
+            return
+
+        # The scheduler fails a task that raises and skips the tasks depending on it
+        if not getattr(self, task.stage)(**task.options):
+            raise RuntimeError(f"E5Pipeline.run_task() : {task.name} did not succeed")
+        self.context.journal.complete(stage=task.name)
+
+    # E5
+    def run(self, tasks: list[E5Task], resume: bool = False) -> dict[str, str]:
+        # Every stage runs in this process, against the same context, and is journaled under one run
+        self.context.journal.start(resume=resume)
+        return E5Scheduler(runner=self.run_task, parallelism=self.parallelism).run(tasks=tasks)
+
+    # E5
+    def incomplete(self, tasks: list[E5Task]) -> list[str]:
+        # Steps that failed, were skipped or ran into scraping errors, a resumed run does them again
+        return [task.name for task in tasks if not self.context.journal.is_done(stage=task.name)]
+
+    # E5
+    def close(self, success: bool = True) -> E5ScrapeReport | None:
+        return self.context.close(success=success)
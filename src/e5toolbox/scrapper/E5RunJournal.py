@@ -0,0 +1,108 @@
+import dataclasses
+import datetime
+import logging
+import threading
+from typing import ClassVar, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from Website.models import E5ScrapeJournal, E5ScrapeRun
+from e5toolbox.scrapper.E5ScrapeGraph import E5ScrapeGraph
+
+
+# E5
+@dataclasses.dataclass
+class E5RunJournal:
+    SHARED: ClassVar[Optional["E5RunJournal"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    run: E5ScrapeRun | None = None
+    # (stage, season id, slot) of every unit already completed by the run
+    done: set[tuple[str, int | None, int | None]] = dataclasses.field(default_factory=set)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def parse_stage(iframe) -> str:
+        # Same name as the family's parse step in E5ScrapeGraph
+        return f"parse_{E5ScrapeGraph.family_of(model_class=type(iframe).__name__)}_iframes"
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5RunJournal":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls()
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def start(self, resume: bool = False) -> E5ScrapeRun:
+        run: E5ScrapeRun | None = None
+        if resume:
+            # Pick up the latest run that did not finish within the window, its completed units are skipped
+            window: datetime.timedelta = datetime.timedelta(hours=getattr(settings, "E5_RESUME_WINDOW_HOURS", 24))
+            run = (E5ScrapeRun.objects.filter(status__in=(E5ScrapeRun.STATUS_RUNNING, E5ScrapeRun.STATUS_FAILED),
+                                              started_at__gte=timezone.now() - window)
+                   .order_by('-started_at').first())
+        if run is None:
+            run = E5ScrapeRun.objects.create()
+        else:
+            run.status = E5ScrapeRun.STATUS_RUNNING
+            run.save(update_fields=['status'])
+
+        with self.lock:
+            self.run = run
+            self.done = set(E5ScrapeJournal.objects.filter(run=run).values_list('stage', 'season', 'slot'))
+        logging.info(msg=f"E5RunJournal.start() : {run} : {len(self.done)} units already completed")
+        return run
+
+    # E5
+    def finish(self, success: bool) -> None:
+        with self.lock:
+            run: E5ScrapeRun | None = self.run
+            self.run = None
+            self.done = set()
+        if run is not None:
+            run.status = E5ScrapeRun.STATUS_FINISHED if success else E5ScrapeRun.STATUS_FAILED
+            run.finished_at = timezone.now()
+            run.save(update_fields=['status', 'finished_at'])
+
+    # E5
+    def is_done(self, stage: str, season_id: int | None = None, slot: int | None = None) -> bool:
+        with self.lock:
+            return self.run is not None and (stage, season_id, slot) in self.done
+
+    # E5
+    def complete(self, stage: str, season_id: int | None = None, slot: int | None = None,
+                 content_hash: str = "") -> None:
+        with self.lock:
+            run: E5ScrapeRun | None = self.run
+        if run is None:
+            return
+
+        E5ScrapeJournal.objects.update_or_create(run=run, stage=stage, season_id=season_id, slot=slot,
+                                                 defaults={'content_hash': content_hash})
+        # Inside a season's transaction the unit only counts once it is committed
+        transaction.on_commit(lambda: self.mark_done(unit=(stage, season_id, slot)))
+
+    # E5
+    def mark_done(self, unit: tuple[str, int | None, int | None]) -> None:
+        with self.lock:
+            self.done.add(unit)
+
+    # E5
+    def is_season_done(self, iframe, slots: int) -> bool:
+        # A season is done once every page of it was saved, they are journaled in the season's transaction
+        stage: str = self.parse_stage(iframe=iframe)
+        return all(self.is_done(stage=stage, season_id=iframe.season_id, slot=slot) for slot in range(slots))
+
+    # E5
+    def complete_season(self, iframe, page_hashes: dict[int, str]) -> None:
+        stage: str = self.parse_stage(iframe=iframe)
+        for slot, content_hash in page_hashes.items():
+            self.complete(stage=stage, season_id=iframe.season_id, slot=slot, content_hash=content_hash)
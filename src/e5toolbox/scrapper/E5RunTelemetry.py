@@ -0,0 +1,209 @@
+import contextlib
+import dataclasses
+import datetime
+import logging
+import os
+import threading
+import time
+from typing import Any, ClassVar, Iterator, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from Website.models import E5ScrapeReport, E5ScrapeRun
+from e5toolbox.base.E5File import E5File
+
+
+# E5
+@dataclasses.dataclass
+class E5StageTelemetry:
+    wall_seconds: float = 0.0
+    pages: int = 0
+    bytes: int = 0
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    rows_parsed: int = 0
+    rows_skipped: int = 0
+    rows_written: int = 0
+    queries: int = 0
+    # Wall time of every season the stage went through, by season name
+    seasons: dict[str, float] = dataclasses.field(default_factory=dict)
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def percentiles(latencies: list[float]) -> dict[str, float]:
+        # Nearest rank, in milliseconds
+        ordered: list[float] = sorted(latencies)
+        if not ordered:
+            return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+        rank: callable = lambda p: ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+        return {"p50": round(rank(0.50) * 1000, 1), "p90": round(rank(0.90) * 1000, 1),
+                "p99": round(rank(0.99) * 1000, 1), "max": round(ordered[-1] * 1000, 1)}
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def add(self, other: "E5StageTelemetry") -> None:
+        for field in ("wall_seconds", "pages", "bytes", "rows_parsed", "rows_skipped", "rows_written", "queries"):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self.latencies.extend(other.latencies)
+
+    # E5
+    def to_dict(self) -> dict[str, Any]:
+        return {"wall_seconds": round(self.wall_seconds, 3), "pages": self.pages, "bytes": self.bytes,
+                "fetch_latency_ms": self.percentiles(latencies=self.latencies), "rows_parsed": self.rows_parsed,
+                "rows_skipped": self.rows_skipped, "rows_written": self.rows_written, "queries": self.queries,
+                "seasons": {name: round(seconds, 3) for name, seconds in self.seasons.items()}}
+
+
+# E5
+@dataclasses.dataclass
+class E5RunTelemetry:
+    SHARED: ClassVar[Optional["E5RunTelemetry"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    # Work done outside of any stage, e.g. by a command calling a scraper directly
+    NO_STAGE: ClassVar[str] = "-"
+
+    started_at: datetime.datetime = dataclasses.field(default_factory=timezone.now)
+    started: float = dataclasses.field(default_factory=time.perf_counter)
+    stages: dict[str, E5StageTelemetry] = dataclasses.field(default_factory=dict)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    # Stage of the calling thread, stages of a run execute concurrently
+    local: threading.local = dataclasses.field(default_factory=threading.local)
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5RunTelemetry":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls()
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def start(self) -> None:
+        with self.lock:
+            self.started_at = timezone.now()
+            self.started = time.perf_counter()
+            self.stages = {}
+
+    # E5
+    def current(self) -> str:
+        return getattr(self.local, "stage", self.NO_STAGE)
+
+    # E5
+    def get_stage(self, name: str | None = None) -> E5StageTelemetry:
+        # Callers hold the lock
+        return self.stages.setdefault(name or self.current(), E5StageTelemetry())
+
+    # E5
+    @contextlib.contextmanager
+    def attached(self, name: str) -> Iterator[None]:
+        # Counters of this thread go to the given stage, e.g. pages fetched by the trio worker threads of a stage
+        previous: str = self.current()
+        self.local.stage = name
+        try:
+            yield
+        finally:
+            self.local.stage = previous
+
+    # E5
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start: float = time.perf_counter()
+        with self.attached(name=name), connection.execute_wrapper(self.count_query):
+            try:
+                yield
+            finally:
+                with self.lock:
+                    self.get_stage(name=name).wall_seconds += time.perf_counter() - start
+
+    # E5
+    @contextlib.contextmanager
+    def season(self, season) -> Iterator[None]:
+        # Named before taking the lock, naming a season queries its league and queries are counted under the lock
+        name: str = str(season)
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                seasons: dict[str, float] = self.get_stage().seasons
+                seasons[name] = seasons.get(name, 0.0) + time.perf_counter() - start
+
+    # E5
+    def count_query(self, execute, sql, params, many, context):
+        with self.lock:
+            self.get_stage().queries += 1
+        return execute(sql, params, many, context)
+
+    # E5
+    def page(self, size: int, latency: float) -> None:
+        with self.lock:
+            stage: E5StageTelemetry = self.get_stage()
+            stage.pages += 1
+            stage.bytes += size
+            stage.latencies.append(latency)
+
+    # E5
+    def rows(self, parsed: int = 0, skipped: int = 0, written: int = 0) -> None:
+        with self.lock:
+            stage: E5StageTelemetry = self.get_stage()
+            stage.rows_parsed += parsed
+            stage.rows_skipped += skipped
+            stage.rows_written += written
+
+    # E5
+    def written(self, name: str) -> int:
+        with self.lock:
+            return self.get_stage(name=name).rows_written
+
+    # E5
+    def report(self, run: E5ScrapeRun | None = None) -> dict[str, Any]:
+        with self.lock:
+            wall_seconds: float = time.perf_counter() - self.started
+            stages: dict[str, dict[str, Any]] = {name: stage.to_dict() for name, stage in self.stages.items()}
+            total: E5StageTelemetry = E5StageTelemetry()
+            for stage in self.stages.values():
+                total.add(other=stage)
+
+        totals: dict[str, Any] = total.to_dict()
+        totals.pop("seasons")
+        totals["wall_seconds"] = round(wall_seconds, 3)
+        totals["pages_per_minute"] = round(total.pages * 60 / wall_seconds, 2) if wall_seconds else 0.0
+        return {"run": run.id if run is not None else None, "started_at": self.started_at.isoformat(),
+                "finished_at": timezone.now().isoformat(), "totals": totals, "stages": stages}
+
+    # E5
+    def finish(self, run: E5ScrapeRun | None = None, benchmark: bool = False) -> E5ScrapeReport | None:
+        report: dict[str, Any] = self.report(run=run)
+        totals: dict[str, Any] = report["totals"]
+        if not totals["pages"] and not totals["queries"]:
+            return None
+
+        # Compare with the previous run of the same kind before this one is saved, benchmarks replay a fixed corpus
+        previous: E5ScrapeReport | None = (E5ScrapeReport.objects.filter(benchmark=benchmark)
+                                           .order_by('-started_at').first())
+        report["benchmark"] = benchmark
+        scrape_report: E5ScrapeReport = E5ScrapeReport.objects.create(
+            run=run, benchmark=benchmark, started_at=self.started_at, wall_seconds=totals["wall_seconds"],
+            pages=totals["pages"], bytes=totals["bytes"], fetch_latency_p50_ms=totals["fetch_latency_ms"]["p50"],
+            fetch_latency_p90_ms=totals["fetch_latency_ms"]["p90"], rows_parsed=totals["rows_parsed"],
+            rows_skipped=totals["rows_skipped"], rows_written=totals["rows_written"], queries=totals["queries"],
+            pages_per_minute=totals["pages_per_minute"], report=report)
+
+        # Json report next to the others
+        report_dir: str = str(getattr(settings, "E5_TELEMETRY_DIR", "telemetry"))
+        os.makedirs(report_dir, exist_ok=True)
+        fullpath: str = os.path.join(report_dir, f"{'benchmark' if benchmark else 'scrape'}_"
+                                                 f"{self.started_at:%Y%m%d_%H%M%S}_{scrape_report.id}.json")
+        success, message = E5File.save_json(fullpath=fullpath, data=report)
+        if not success:
+            logging.warning(msg=f"E5RunTelemetry.finish() : {fullpath} : {message}")
+
+        logging.info(msg=f"E5RunTelemetry.finish() : {totals['pages']} pages, {totals['rows_written']} rows written, "
+                         f"{totals['queries']} queries in {totals['wall_seconds']}s, "
+                         f"{totals['pages_per_minute']} pages/min (previous run : "
+                         f"{previous.pages_per_minute if previous is not None else '-'} pages/min)")
+        return scrape_report
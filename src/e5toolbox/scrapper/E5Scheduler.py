@@ -0,0 +1,122 @@
+import dataclasses
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, ClassVar
+
+from django.db import connections
+
+
+# E5
+@dataclasses.dataclass(frozen=True)
+class E5Task:
+    name: str
+    stage: str
+    options: dict[str, Any] = dataclasses.field(default_factory=dict)
+    requires: tuple[str, ...] = ()
+    family: str | None = None
+
+
+# E5
+@dataclasses.dataclass
+class E5Scheduler:
+    STATUS_SUCCESS: ClassVar[str] = "success"
+    STATUS_FAILED: ClassVar[str] = "failed"
+    STATUS_SKIPPED: ClassVar[str] = "skipped"
+
+    runner: Callable[[E5Task], None]
+    parallelism: int = 1
+    statuses: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def validate(tasks: list[E5Task]) -> None:
+        names: set[str] = set()
+        for task in tasks:
+            if task.name in names:
+                raise ValueError(f"E5Scheduler : duplicated task '{task.name}'")
+            names.add(task.name)
+
+        for task in tasks:
+            unknown: set[str] = set(task.requires) - names
+            if unknown:
+                raise ValueError(f"E5Scheduler : task '{task.name}' requires unknown tasks {sorted(unknown)}")
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def execute(self, task: E5Task) -> float:
+        started: float = time.perf_counter()
+        logging.info(msg=f"E5Scheduler : {task.name} start")
+        try:
+            self.runner(task)
+        finally:
+            # Connections are per thread, a worker releases its own before it picks up another task
+            if self.parallelism > 1:
+                connections.close_all()
+        return time.perf_counter() - started
+
+    # E5
+    def submit(self, executor: ThreadPoolExecutor | None, task: E5Task) -> Future:
+        if executor is not None:
+            return executor.submit(self.execute, task)
+
+        # Without parallelism every step runs inline, on the caller's thread and database connection
+        future: Future = Future()
+        try:
+            future.set_result(self.execute(task=task))
+        except Exception as ex:
+            future.set_exception(ex)
+        return future
+
+    # E5
+    def run(self, tasks: list[E5Task]) -> dict[str, str]:
+        self.validate(tasks=tasks)
+        pending: dict[str, E5Task] = {task.name: task for task in tasks}
+        running: dict[Future, E5Task] = {}
+        self.statuses = {}
+
+        executor: ThreadPoolExecutor | None = None
+        if self.parallelism > 1:
+            executor = ThreadPoolExecutor(max_workers=self.parallelism, thread_name_prefix="E5Scheduler")
+
+        try:
+            while pending or running:
+                # A task whose requirement did not succeed is skipped, along with everything depending on it
+                skipped: bool = True
+                while skipped:
+                    skipped = False
+                    for name, task in list(pending.items()):
+                        blocked: list[str] = [required for required in task.requires if self.statuses.get(required)
+                                              in (self.STATUS_FAILED, self.STATUS_SKIPPED)]
+                        if blocked:
+                            self.statuses[name] = self.STATUS_SKIPPED
+                            logging.warning(msg=f"E5Scheduler : {name} skipped, {', '.join(blocked)} did not succeed")
+                            del pending[name]
+                            skipped = True
+
+                # Start every task whose requirements all succeeded, the pool caps how many run at once
+                for name, task in list(pending.items()):
+                    if all(self.statuses.get(required) == self.STATUS_SUCCESS for required in task.requires):
+                        running[self.submit(executor=executor, task=task)] = task
+                        del pending[name]
+
+                if not running:
+                    if pending:
+                        raise ValueError(f"E5Scheduler : dependency cycle between {sorted(pending)}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        duration: float = future.result()
+                        self.statuses[task.name] = self.STATUS_SUCCESS
+                        logging.info(msg=f"E5Scheduler : {task.name} done in {duration:.1f}s")
+                    except Exception as ex:
+                        self.statuses[task.name] = self.STATUS_FAILED
+                        logging.warning(msg=f"E5Scheduler : {task.name} failed : {ex}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        return self.statuses
@@ -0,0 +1,143 @@
+import dataclasses
+from typing import ClassVar
+
+from e5toolbox.scrapper.E5Scheduler import E5Task
+
+
+# E5
+@dataclasses.dataclass(frozen=True)
+class E5StatsFamily:
+    name: str
+    endpoint: str
+    label: str
+    iframe_length: int
+    model_class: str
+    parse_command: str
+
+    # E5
+    def tasks(self, requires: tuple[str, ...]) -> list[E5Task]:
+        # Discover the family's iframes, then parse them
+        get_iframes: E5Task = E5Task(name=f"get_{self.name}_iframes", stage="get_iframes", options={"family": self},
+                                     requires=requires, family=self.name)
+        parse_iframes: E5Task = E5Task(name=f"parse_{self.name}_iframes", stage="parse_iframes",
+                                       options={"family": self}, requires=(get_iframes.name,), family=self.name)
+        return [get_iframes, parse_iframes]
+
+
+# E5
+class E5ScrapeGraph:
+    LEAGUE_TABLE: ClassVar[E5StatsFamily] = E5StatsFamily(
+        name="league_table", endpoint="/", label="League Table Iframe", iframe_length=1,
+        model_class="E5LeagueTableIframe", parse_command="E5ParseLeagueTableIframes")
+    FAMILIES: ClassVar[tuple[E5StatsFamily, ...]] = (
+        E5StatsFamily(name="btts", endpoint="btts/", label="BTTS Iframe", iframe_length=5,
+                      model_class="E5BttsIframes", parse_command="E5ParseBttsIframes"),
+        E5StatsFamily(name="over_05_goals", endpoint="over-0-5-goals/", label="Over 0.5 Goals Iframe",
+                      iframe_length=4, model_class="E5Over05GoalsIframe", parse_command="E5ParseOver05GoalsIframes"),
+        E5StatsFamily(name="over_15_goals", endpoint="over-1-5-goals/", label="Over 1.5 Goals Iframe",
+                      iframe_length=4, model_class="E5Over15GoalsIframe", parse_command="E5ParseOver15GoalsIframes"),
+        E5StatsFamily(name="over_25_goals", endpoint="over-2-5-goals/", label="Over 2.5 Goals Iframe",
+                      iframe_length=4, model_class="E5Over25GoalsIframe", parse_command="E5ParseOver25GoalsIframes"),
+        E5StatsFamily(name="over_35_goals", endpoint="over-3-5-goals/", label="Over 3.5 Goals Iframe",
+                      iframe_length=4, model_class="E5Over35GoalsIframe", parse_command="E5ParseOver35GoalsIframes"),
+        E5StatsFamily(name="average_team_goals", endpoint="amr/", label="Average Team Goal Iframe", iframe_length=1,
+                      model_class="E5AverageTeamGoalsIframe", parse_command="E5ParseAverageTeamGoalsIframes"),
+        E5StatsFamily(name="corners", endpoint="corners/", label="Corners Iframe", iframe_length=9,
+                      model_class="E5CornersIframes", parse_command="E5ParseCornersIframes"),
+        E5StatsFamily(name="cards", endpoint="cards/", label="Cards Iframe", iframe_length=4,
+                      model_class="E5CardsIframes", parse_command="E5ParseCardsIframes"),
+        E5StatsFamily(name="half_time_full_time", endpoint="half-time-full-time/", label="Half Time Full Time Iframe",
+                      iframe_length=1, model_class="E5HalfTimeFullTimeIframe",
+                      parse_command="E5ParseHalfTimeFullTimeIframes"),
+        E5StatsFamily(name="1st_2nd_half_goals", endpoint="1st-2nd-half-goals/", label="1st 2nd Half Goals Iframe",
+                      iframe_length=3, model_class="E51st2ndHalfGoalsIframe",
+                      parse_command="E5Parse1st2ndHalfGoalsIframes"),
+        E5StatsFamily(name="average_first_goal_time", endpoint="agt/", label="Average First Goal Time Iframe",
+                      iframe_length=1, model_class="E5Average1stGoalTimeIframe",
+                      parse_command="E5ParseAverageFirstGoalTimeIframes"),
+        E5StatsFamily(name="early_goals", endpoint="early/", label="Early Goals Iframe", iframe_length=1,
+                      model_class="E5EarlyGoalsIframe", parse_command="E5ParseEarlyGoalsIframes"),
+        E5StatsFamily(name="win_draw_loss", endpoint="wdl/", label="Win Draw Loss Percentage Iframe",
+                      iframe_length=1, model_class="E5WinDrawLossPercentageIframe",
+                      parse_command="E5ParseWinDrawLossPercentageIframes"),
+        E5StatsFamily(name="scored_both_halves", endpoint="sbh/", label="Scored Both Halves Iframe", iframe_length=2,
+                      model_class="E5ScoredBothHalfIframes", parse_command="E5ParseScoredBothHalvesIframes"),
+        E5StatsFamily(name="won_both_halves", endpoint="wbh/", label="Won Both Halves Iframe", iframe_length=2,
+                      model_class="E5WonBothHalfIframes", parse_command="E5ParseWonBothHalvesIframes"),
+        E5StatsFamily(name="rescued_points", endpoint="rescued-points/", label="Rescued Points Iframe",
+                      iframe_length=1, model_class="E5RescuedPointsIframe", parse_command="E5ParseRescuedPointsIframes"),
+        E5StatsFamily(name="clean_sheets", endpoint="clean-sheets/", label="Clean Sheet Iframe", iframe_length=2,
+                      model_class="E5CleanSheetIframe", parse_command="E5ParseCleanSheetsIframes"),
+        E5StatsFamily(name="won_to_nil", endpoint="wtn/", label="Won To Nil Iframe", iframe_length=2,
+                      model_class="E5WonToNilIframe", parse_command="E5ParseWonToNilIframes"),
+        E5StatsFamily(name="win_loss_margin", endpoint="winloss/", label="Win Loss Margin Iframe", iframe_length=2,
+                      model_class="E5WinLossMarginIframe", parse_command="E5ParseWinLossMarginIframes"),
+        E5StatsFamily(name="scored_first", endpoint="sf/", label="Scored First Iframe", iframe_length=2,
+                      model_class="E5ScoredFirstIframe", parse_command="E5ParseScoredFirstIframes"),
+        E5StatsFamily(name="late_goals", endpoint="late/", label="Late Goals Iframe", iframe_length=1,
+                      model_class="E5LateGoalsIframe", parse_command="E5ParseLateGoalsIframes"),
+    )
+    # Families of the opt-in weekday schedule, the same rotation as the original daily run : Monday and Thursday,
+    # Tuesday and Friday, Wednesday and Saturday, nothing but the core steps on Sunday
+    SCHEDULE: ClassVar[tuple[tuple[str, ...], ...]] = (
+        ("btts", "over_05_goals", "over_15_goals", "over_25_goals", "average_team_goals"),
+        ("corners", "cards", "half_time_full_time", "1st_2nd_half_goals", "average_first_goal_time", "early_goals"),
+        ("over_35_goals", "win_draw_loss", "scored_both_halves", "won_both_halves", "rescued_points", "clean_sheets",
+         "won_to_nil", "win_loss_margin", "scored_first", "late_goals"),
+    )
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def family_names(cls) -> list[str]:
+        return [family.name for family in cls.FAMILIES]
+
+    # E5
+    @classmethod
+    def scheduled_family_names(cls, weekday: int) -> list[str]:
+        # weekday : 0 is Monday, as datetime.date.weekday()
+        if weekday == 6:
+            return []
+        return list(cls.SCHEDULE[weekday % 3])
+
+    # E5
+    @classmethod
+    def family(cls, name: str) -> E5StatsFamily:
+        return next(family for family in (cls.LEAGUE_TABLE, *cls.FAMILIES) if family.name == name)
+
+    # E5
+    @classmethod
+    def family_of(cls, model_class: str) -> str:
+        # Name of the family whose iframes are stored in model_class, the model name itself for the others
+        return next((family.name for family in (cls.LEAGUE_TABLE, *cls.FAMILIES) if family.model_class == model_class),
+                    model_class)
+
+    # E5
+    @classmethod
+    def core_tasks(cls) -> list[E5Task]:
+        # Leagues -> Seasons -> League Table iframes -> rankings -> Teams, fixtures only need the teams
+        return [
+            E5Task(name="get_leagues", stage="get_leagues"),
+            E5Task(name="get_seasons", stage="get_seasons", requires=("get_leagues",)),
+            E5Task(name="get_league_table_iframes", stage="get_iframes", options={"family": cls.LEAGUE_TABLE},
+                   requires=("get_seasons",)),
+            E5Task(name="parse_league_table_iframes", stage="parse_league_tables",
+                   requires=("get_league_table_iframes",)),
+            E5Task(name="get_teams", stage="get_teams", requires=("parse_league_table_iframes",)),
+            E5Task(name="get_upcoming_matches", stage="get_upcoming_matches", requires=("get_teams",)),
+        ]
+
+    # E5
+    @classmethod
+    def build(cls, families: list[str]) -> list[E5Task]:
+        unknown: set[str] = set(families) - set(cls.family_names())
+        if unknown:
+            raise ValueError(f"E5ScrapeGraph : unknown families {sorted(unknown)}, "
+                             f"expected some of {', '.join(cls.family_names())}")
+
+        # Every family branch hangs off the teams and runs independently of the other families
+        tasks: list[E5Task] = cls.core_tasks()
+        for family in cls.FAMILIES:
+            if family.name in families:
+                tasks.extend(family.tasks(requires=("get_teams",)))
+        return tasks
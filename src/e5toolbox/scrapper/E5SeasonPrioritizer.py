@@ -0,0 +1,83 @@
+import dataclasses
+import datetime
+import logging
+import threading
+from typing import ClassVar, Iterable, Optional, TypeVar
+
+from django.conf import settings
+
+from Website.models import E5Fixture
+
+T = TypeVar("T")
+
+
+# E5
+@dataclasses.dataclass
+class E5SeasonPrioritizer:
+    SHARED: ClassVar[Optional["E5SeasonPrioritizer"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    # 0 : every season, otherwise only the first seasons of the order
+    limit: int = 0
+    # 0 : every season, otherwise only seasons with a fixture kicking off within these hours
+    horizon_hours: int = 0
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def kickoff(date: datetime.date, kickoff_time: str) -> datetime.datetime:
+        # Kickoff times are scraped as text, fixtures without a readable one count from the start of their day
+        try:
+            start: datetime.time = datetime.datetime.strptime(kickoff_time.strip(), "%H:%M").time()
+        except ValueError:
+            start = datetime.time.min
+        return datetime.datetime.combine(date, start)
+
+    # E5
+    @staticmethod
+    def next_kickoffs() -> dict[int, datetime.datetime]:
+        # Soonest upcoming kickoff of every season with fixtures
+        kickoffs: dict[int, datetime.datetime] = {}
+        for season_id, date, kickoff_time in (E5Fixture.objects.filter(date__gte=datetime.date.today())
+                                              .values_list('home_team__season', 'date', 'kickoff_time')):
+            kickoff: datetime.datetime = E5SeasonPrioritizer.kickoff(date=date, kickoff_time=kickoff_time)
+            if season_id not in kickoffs or kickoff < kickoffs[season_id]:
+                kickoffs[season_id] = kickoff
+        return kickoffs
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5SeasonPrioritizer":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls(limit=getattr(settings, "E5_PRIORITY_MAX_SEASONS", 0),
+                                 horizon_hours=getattr(settings, "E5_PRIORITY_HORIZON_HOURS", 0))
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def order(self, items: Iterable[T], season_id=lambda item: item.id) -> list[T]:
+        # Seasons playing soonest first, seasons without upcoming fixtures last in database order
+        items = list(items)
+        kickoffs: dict[int, datetime.datetime] = self.next_kickoffs()
+        ordered: list[T] = sorted(items, key=lambda item: (season_id(item) not in kickoffs,
+                                                           kickoffs.get(season_id(item), datetime.datetime.max)))
+
+        if self.horizon_hours:
+            horizon: datetime.datetime = datetime.datetime.now() + datetime.timedelta(hours=self.horizon_hours)
+            ordered = [item for item in ordered if kickoffs.get(season_id(item), datetime.datetime.max) <= horizon]
+        if self.limit:
+            ordered = ordered[:self.limit]
+
+        if len(ordered) < len(items):
+            logging.info(msg=f"E5SeasonPrioritizer.order() : {len(ordered)}/{len(items)} seasons kept")
+        return ordered
+
+    # E5
+    def order_seasons(self, seasons: Iterable) -> list:
+        return self.order(items=seasons)
+
+    # E5
+    def order_iframes(self, iframes: Iterable) -> list:
+        return self.order(items=iframes, season_id=lambda iframe: iframe.season_id)
@@ -1,19 +1,26 @@
 import dataclasses
 import datetime
+import hashlib
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Iterable
+from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup, ResultSet, Tag
-from django.db.models import QuerySet, Q
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model, QuerySet, Q
 from django.utils.text import slugify
-from selenium import webdriver
 from unidecode import unidecode
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 
 from Website.models import (E5Season, E5CardsIframes, E5BttsIframes, E5Over05GoalsIframe, E5ScoredFirstIframe,
                             E5Over15GoalsIframe, E5Over25GoalsIframe, E5Over35GoalsIframe, E5CornersIframes,
@@ -22,6 +29,18 @@ from Website.models import (E5Season, E5CardsIframes, E5BttsIframes, E5Over05Goa
                             E5WinDrawLossPercentageIframe, E5HalfTimeFullTimeIframe, E5RescuedPointsIframe,
                             E5Average1stGoalTimeIframe, E5AverageTeamGoalsIframe, E5EarlyGoalsIframe, E5LateGoalsIframe,
                             E5Fixture)
+from e5toolbox.base.E5CookieStore import E5CookieStore
+from e5toolbox.scrapper.E5AsyncFetcher import E5AsyncFetcher
+from e5toolbox.scrapper.E5FreshnessTracker import E5FreshnessTracker
+from e5toolbox.scrapper.E5HttpFetcher import E5HttpFetcher
+from e5toolbox.scrapper.E5PageArchive import E5PageArchive
+from e5toolbox.scrapper.E5RunJournal import E5RunJournal
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+from e5toolbox.scrapper.E5SeasonPrioritizer import E5SeasonPrioritizer
+from e5toolbox.scrapper.E5StatsWriter import E5StatsWriter
+from e5toolbox.scrapper.E5TableParser import E5TableParser, E5TableRecord, E5TableSpec
+from e5toolbox.scrapper.E5TeamResolver import E5TeamResolver
+from e5toolbox.scrapper.E5WebDriverPool import E5WebDriverPool
 from e5toolbox.utils.utils import ACTIVE_CHAMPIONSHIPS
 
 logging.basicConfig(level=logging.INFO, filename="management_command.log", filemode="a",
@@ -49,6 +68,7 @@ class E5SeleniumWebdriverError(Enum):
     ERROR_TYPE_GET_CORNER_IFRAME_URL_FAILED = "get_corner_iframe_url_failed"
     ERROR_TYPE_GET_CARD_IFRAME_URL_FAILED = "get_card_iframe_url_failed"
     ERROR_TYPE_GET_TABLE_TRS_FAILED = "get_table_trs_failed"
+    ERROR_TYPE_SAVE_STATS_FAILED = "save_stats_failed"
     # Empty
     ERROR_TYPE_IFRAME_EMPTY = "iframe_empty"
     # Bad Length
@@ -72,11 +92,30 @@ class E5SeleniumWebDriver:
     LEAGUES: ClassVar[QuerySet[E5League]] = E5League.objects.all()
     LEAGUE_TABLE_IFRAMES: ClassVar[QuerySet[E5LeagueTableIframe]] = E5LeagueTableIframe.objects.filter(
         season__active=True)
+    STATIC_TABLE_HOSTS: ClassVar[tuple[str, ...]] = ("docs.google.com",)
+    STATIC_TABLE_SELECTOR: ClassVar[str] = "table.waffle.no-grid"
+    PREDICTIONS_TABLE_SELECTOR: ClassVar[str] = "table.supsystic-table"
+    PREDICTIONS_DATE_SELECTOR: ClassVar[str] = "div.fusion-text.fusion-text-2 h1"
+    PREDICTIONS_URL: ClassVar[str] = "https://www.thestatsdontlie.com/football/predictions/"
+    PREDICTIONS_TIMEOUT: ClassVar[int] = getattr(settings, "E5_PREDICTIONS_TIMEOUT", 30)
+    SESSION_COOKIES: ClassVar[E5CookieStore] = E5CookieStore(fullpath=str(settings.E5_SESSION_COOKIES_PATH),
+                                                             ttl=settings.E5_SESSION_COOKIES_TTL)
+    LOGIN_LOCK: ClassVar[threading.Lock] = threading.Lock()
 
     soup: BeautifulSoup = None
     driver: WebDriver = None
     is_connected: bool = False
-    status: E5SeleniumWebdriverStatus = E5SeleniumWebdriverStatus()
+    # One status per scraper, stages of a run may share the process and its threads
+    status: E5SeleniumWebdriverStatus = dataclasses.field(default_factory=E5SeleniumWebdriverStatus)
+    prefetched_pages: dict[str, str] = dataclasses.field(default_factory=dict)
+    # Hash of the html behind the current soup, journaled with the units it completes
+    page_hash: str = ""
+    # Restricts the season loops to these seasons, a queued unit of work covers a single season
+    season_ids: list[int] | None = None
+    # Seconds the browser took to load the current page
+    page_load_time: float = 0.0
+    # Html behind the current soup, saved to the page archive when recording
+    page_html: str = ""
 
     ################################################## STATIC METHODS ##################################################
     # E5
@@ -92,30 +131,28 @@ class E5SeleniumWebDriver:
     ##################################################### METHODS ######################################################
     # E5
     def init(self) -> None:
+        # The browser is borrowed lazily, published sheets are fetched over http and may never need it
+        self.is_connected = True
+        self.status.success = True
+
+    # E5
+    def borrow_driver(self, error_context: str) -> None:
+        if self.driver is not None:
+            return
+
         try:
-            # service: Service = Service()
-            # chrome_options = Options()
-            # chrome_options.add_argument("--headless")
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            # self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.is_connected = True
-            self.status.success = True
+            # Borrow a warm browser from the shared pool instead of cold starting Chrome
+            self.driver = E5WebDriverPool.shared().borrow()
         except Exception as ex:
-            self.is_connected = False
-            self.status.success = False
-            self.status.error_context = "E5SeleniumWebDriver.init()"
-            self.status.error_type = E5SeleniumWebdriverError.ERROR_TYPE_INIT_FAILED
-            self.status.exception = ex
+            self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_INIT_FAILED,
+                           error_context=error_context, exception=ex)
 
     # E5
     def quit(self) -> None:
         try:
-            self.driver.quit()
+            # Return the browser to the pool, it is only really quit when the pool is closed
+            E5WebDriverPool.shared().give_back(driver=self.driver)
+            self.driver = None
             self.status.success = True
             self.is_connected = False
         except Exception as ex:
@@ -132,6 +169,14 @@ class E5SeleniumWebDriver:
         self.status.error_context = ""
         self.status.exception = ""
 
+    # E5
+    def active_seasons(self) -> list[E5Season]:
+        seasons: QuerySet[E5Season] = self.ACTIVE_SEASONS.all()
+        if self.season_ids is not None:
+            seasons = seasons.filter(id__in=self.season_ids)
+        # Seasons with the next fixtures first
+        return E5SeasonPrioritizer.shared().order_seasons(seasons=seasons)
+
     # E5
     def check_is_connected(self) -> None:
         if not self.is_connected:
@@ -148,32 +193,188 @@ class E5SeleniumWebDriver:
 
     # E5
     def get_only(self, url: str, error_context: str):
+        self.borrow_driver(error_context=error_context)
+        if not self.status.success:
+            return
+
         try:
+            start: float = time.perf_counter()
             self.driver.get(url)
+            self.page_load_time = time.perf_counter() - start
         except Exception as ex:
             self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_URL_FAILED,
                            error_context=error_context, exception=ex)
 
     # E5
     def get(self, url: str, error_context: str):
-        try:
-            self.driver.get(url)
-        except Exception as ex:
-            self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_URL_FAILED,
-                           error_context=error_context, exception=ex)
+        # Replayed runs are served from the page archive
+        if E5PageArchive.shared().replaying():
+            self.get_archived_soup(url=url, error_context=error_context)
+            return
+
+        # Published sheets are static html, render them in Chrome only when the table is missing
+        if not (self.is_static_table_url(url=url) and self.get_static_soup(url=url)):
+            self.get_only(url=url, error_context=error_context)
+            if self.status.success:
+                self.get_soup(error_context=error_context)
 
+        # Record the page for later replays
         if self.status.success:
-            self.get_soup(error_context=error_context)
+            success, message = E5PageArchive.shared().record(url=url, body=self.page_html)
+            if not success:
+                self.log_warning(message=f"E5SeleniumWebDriver.get() : {url} : not archived : {message}")
 
     # E5
     def get_soup(self, error_context: str) -> None:
         try:
-            self.soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            page_source: str = self.driver.page_source
+            self.soup = BeautifulSoup(page_source, 'html.parser')
+            self.page_hash = hashlib.sha256(page_source.encode()).hexdigest()
+            self.page_html = page_source
+            E5RunTelemetry.shared().page(size=len(page_source.encode()), latency=self.page_load_time)
         except Exception as ex:
             self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_SOUP_FAILED,
                            error_context=error_context, exception=ex)
 
-    ####################################################### UTILS ######################################################
+    # E5
+    def get_static_soup(self, url: str) -> bool:
+        try:
+            html: str | None = self.prefetched_pages.pop(url, None)
+            if html is None:
+                html = E5HttpFetcher.shared().fetch(url=url)
+            soup: BeautifulSoup = BeautifulSoup(html, 'html.parser')
+        except Exception as ex:
+            self.log_warning(message=f"E5SeleniumWebDriver.get_static_soup() : {url} : {ex}")
+            return False
+
+        if soup.select_one(selector=self.STATIC_TABLE_SELECTOR) is None:
+            self.log_info(message=f"E5SeleniumWebDriver.get_static_soup() : {url} : table missing, using browser")
+            return False
+
+        self.soup = soup
+        self.page_hash = hashlib.sha256(html.encode()).hexdigest()
+        self.page_html = html
+        return True
+
+    # E5
+    def get_archived_soup(self, url: str, error_context: str) -> None:
+        start: float = time.perf_counter()
+        html: str | None = E5PageArchive.shared().load(url=url)
+        if html is None:
+            self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_URL_FAILED,
+                           error_context=error_context, exception=f"{url} is not in the page archive")
+            return
+
+        self.soup = BeautifulSoup(html, 'html.parser')
+        self.page_hash = hashlib.sha256(html.encode()).hexdigest()
+        self.page_html = html
+        E5RunTelemetry.shared().page(size=len(html.encode()), latency=time.perf_counter() - start)
+
+    # E5
+    def prefetch_iframes(self, iframes: Iterable) -> dict[tuple[int, int], str]:
+        # Fetch every published sheet of a stat family concurrently, get() then serves them from memory
+        if E5PageArchive.shared().replaying():
+            return {}
+        jobs: list[tuple[tuple[int, int], str]] = []
+        for iframe in iframes:
+            for slot, url in enumerate(self.get_urls(iframe=iframe)):
+                if url and self.is_static_table_url(url=url):
+                    jobs.append(((iframe.season_id, slot), url))
+
+        pages: dict[tuple[int, int], str] = E5AsyncFetcher.from_settings().fetch_all(jobs=jobs)
+        urls: dict[tuple[int, int], str] = dict(jobs)
+        for key, html in pages.items():
+            self.prefetched_pages[urls[key]] = html
+
+        self.log_info(message=f"E5SeleniumWebDriver.prefetch_iframes() : {len(pages)}/{len(jobs)} pages prefetched")
+        return pages
+
+    # E5
+    def parse_table_iframes(self, iframes: Iterable, specs: tuple[E5TableSpec, ...], error_context: str) -> None:
+        # Check connection
+        self.check_is_connected()
+
+        if self.status.success:
+            # Class level querysets keep their results cache, clone them so every stage of a run reads current rows
+            if isinstance(iframes, QuerySet):
+                iframes = iframes.select_related('season')
+            if self.season_ids is not None:
+                iframes = [iframe for iframe in iframes if iframe.season_id in self.season_ids]
+
+            # Only seasons with matches played since the family's last parse, and not already saved by this run
+            iframes = E5FreshnessTracker.shared().stale_iframes(iframes=iframes)
+            iframes = [iframe for iframe in iframes
+                       if not E5RunJournal.shared().is_season_done(iframe=iframe, slots=len(specs))]
+            # Seasons with the next fixtures first, their fixture pages get the freshest stats
+            iframes = E5SeasonPrioritizer.shared().order_iframes(iframes=iframes)
+
+            # Prefetch every page of the family concurrently
+            self.prefetch_iframes(iframes=iframes)
+            known_misses: int = E5TeamResolver.shared().miss_count()
+
+            for iframe in iframes:
+                with E5RunTelemetry.shared().season(season=iframe.season):
+                    # Every page of the season fills the same per team rows, they are written once at the end
+                    season_rows: dict[type[Model], dict[int, dict[str, Any]]] = {spec.model: {} for spec in specs}
+                    season_complete: bool = True
+                    page_hashes: dict[int, str] = {}
+                    for slot, spec in enumerate(specs):
+                        # Get Url
+                        url: str = getattr(iframe, spec.url_field)
+                        self.get(url=url, error_context=error_context)
+                        if not self.status.success:
+                            self.init_status()
+                            season_complete = False
+                            continue
+
+                        # Get Stats
+                        start: float = time.perf_counter()
+                        records: list[E5TableRecord] | None = E5TableParser.parse(soup=self.soup, spec=spec)
+                        if records is None:
+                            self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_TABLE_TRS_FAILED,
+                                           error_context=error_context, exception=f"No stats table in {url}")
+                            self.init_status()
+                            season_complete = False
+                            continue
+                        self.log_info(message=f"{error_context} : {spec.url_field} : {len(records)} records parsed in "
+                                              f"{(time.perf_counter() - start) * 1000:.1f}ms")
+                        page_hashes[slot] = self.page_hash
+
+                        # Add Stats
+                        for record in records:
+                            # Get Team, unknown names are reported once by the resolver
+                            team: E5Team | None = E5TeamResolver.shared().resolve(season=iframe.season,
+                                                                                    name=record.team_name)
+                            if team is not None:
+                                E5StatsWriter.merge(rows=season_rows[spec.model], team_id=team.id, values=record.values)
+
+                    # Save Stats, readers never see a season with only part of its pages applied
+                    try:
+                        with transaction.atomic():
+                            for model, rows in season_rows.items():
+                                E5StatsWriter.upsert(model=model, rows=rows)
+
+                            # A season missing pages is parsed again by the next run
+                            if season_complete:
+                                E5FreshnessTracker.shared().record(
+                                    iframe=iframe,
+                                    matches_played=E5FreshnessTracker.parsed_matches_played(rows=season_rows.values()))
+                                E5RunJournal.shared().complete_season(iframe=iframe, page_hashes=page_hashes)
+                    except Exception as ex:
+                        self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_SAVE_STATS_FAILED,
+                                       error_context=error_context, exception=ex)
+                        self.init_status()
+
+            # Report unresolved team names
+            miss_count: int = E5TeamResolver.shared().miss_count() - known_misses
+            if miss_count:
+                self.log_warning(message=f"{error_context} : {miss_count} new team names could not be resolved")
+
+    # E5
+    @classmethod
+    def is_static_table_url(cls, url: str) -> bool:
+        return urlparse(url).netloc in cls.STATIC_TABLE_HOSTS
+
     # E5
     @staticmethod
     def convert_to_date(date_str: str) -> datetime.date:
@@ -346,7 +547,7 @@ class E5SeleniumWebDriver:
         elif isinstance(iframe, E5ScoredBothHalfIframes):
             urls = [iframe.scored_both_half_url, iframe.conceded_both_half_url]
         elif isinstance(iframe, E5WonBothHalfIframes):
-            urls = [iframe.won_both_half_url, iframe.won_both_half_url]
+            urls = [iframe.won_both_half_url, iframe.lost_both_half_url]
         elif isinstance(iframe, E51st2ndHalfGoalsIframe):
             urls = [iframe.overall_1st_2nd_half_goals_url, iframe.home_1st_2nd_half_goals_url,
                     iframe.away_1st_2nd_half_goals_url]
@@ -412,14 +613,17 @@ class E5SeleniumWebDriver:
 
                 # Check if league already exists
                 if new_league.exists():
-                    # Update League
+                    # Update League, unchanged ones are not written
                     target_league: E5League = E5League.objects.get(name=league_name)
+                    if target_league.url == league_url and target_league.slug == new_league.slug:
+                        continue
                     target_league.url = league_url
-                    target_league.slug = slugify(value=league_name)
+                    target_league.slug = new_league.slug
                     target_league.save()
                 else:
                     # Save League
                     new_league.save()
+                E5RunTelemetry.shared().rows(written=1)
 
     # E5
     def get_seasons(self, error_context: str) -> None:
@@ -427,7 +631,7 @@ class E5SeleniumWebDriver:
         self.check_is_connected()
 
         if self.status.success:
-            for league in self.LEAGUES:
+            for league in self.LEAGUES.all():
                 league: E5League  # Type hinting for Intellij
 
                 # Get Url
@@ -457,9 +661,12 @@ class E5SeleniumWebDriver:
                     season.save()
                 else:
                     target_season: E5Season = E5Season.objects.get(league=league, name=season.name)
-                    target_season.url = league.url
-                    target_season.active = league.name in ACTIVE_CHAMPIONSHIPS
+                    if target_season.url == season.url and target_season.active == season.active:
+                        continue
+                    target_season.url = season.url
+                    target_season.active = season.active
                     target_season.save()
+                E5RunTelemetry.shared().rows(written=1)
 
     # E5
     def get_teams(self, error_context: str) -> None:
@@ -467,7 +674,7 @@ class E5SeleniumWebDriver:
         self.check_is_connected()
 
         if self.status.success:
-            for league_table in self.LEAGUE_TABLE_IFRAMES:
+            for league_table in self.LEAGUE_TABLE_IFRAMES.select_related('season'):
                 league_table: E5LeagueTableIframe  # Type hinting for Intellij
 
                 # Get Url
@@ -505,9 +712,109 @@ class E5SeleniumWebDriver:
                         team.save()
                     else:
                         target_team: E5Team = E5Team.objects.get(name=team_name, season=league_table.season)
+                        if target_team.url == team_url and target_team.slug == team.slug:
+                            continue
                         target_team.url = team_url
-                        target_team.slug = slugify(value=team_name)
+                        target_team.slug = team.slug
                         target_team.save()
+                    E5RunTelemetry.shared().rows(written=1)
+
+                # Teams may have been created, the season index is rebuilt on next use
+                E5TeamResolver.shared().invalidate(season=league_table.season)
+
+    # E5
+    def load_predictions_page(self, endpoint: str, error_context: str) -> str | None:
+        try:
+            driver: WebDriver = E5WebDriverPool.shared().borrow()
+        except Exception as ex:
+            self.log_warning(message=f"{error_context} : {endpoint} : {ex}")
+            return None
+
+        try:
+            # Reuse the saved session, log in only when the login form shows up
+            session_version: int = self.apply_session_cookies(driver=driver)
+
+            # Get Url
+            driver.get(f"{self.PREDICTIONS_URL}{endpoint}")
+
+            # Check if user and pass required
+            if self.is_login_required(driver=driver):
+                self.login(driver=driver, session_version=session_version, error_context=error_context)
+
+            # Wait for the date and the upcoming matches table instead of sleeping a fixed time
+            try:
+                WebDriverWait(driver=driver, timeout=self.PREDICTIONS_TIMEOUT).until(self.predictions_page_loaded)
+            except TimeoutException:
+                self.log_warning(message=f"{error_context} : {endpoint} : predictions page not fully loaded after "
+                                         f"{self.PREDICTIONS_TIMEOUT}s")
+
+            return driver.page_source
+        except Exception as ex:
+            self.log_warning(message=f"{error_context} : {endpoint} : {ex}")
+            return None
+        finally:
+            E5WebDriverPool.shared().give_back(driver=driver)
+
+    # E5
+    @classmethod
+    def predictions_page_loaded(cls, driver: WebDriver) -> bool:
+        tables: list = driver.find_elements(by=By.CSS_SELECTOR, value=cls.PREDICTIONS_TABLE_SELECTOR)
+        return (len(tables) > 1 and
+                len(driver.find_elements(by=By.CSS_SELECTOR, value=cls.PREDICTIONS_DATE_SELECTOR)) > 0)
+
+    ###################################################### SESSION #####################################################
+    # E5
+    @staticmethod
+    def is_login_required(driver: WebDriver) -> bool:
+        return len(driver.find_elements(by=By.ID, value="user_login")) > 0
+
+    # E5
+    def apply_session_cookies(self, driver: WebDriver) -> int:
+        session_version: int = self.SESSION_COOKIES.version
+        for cookie in self.SESSION_COOKIES.load():
+            # CDP sets cookies for any domain without having to navigate to it first
+            cdp_cookie: dict = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly",
+                                                             "sameSite") if key in cookie}
+            if "expiry" in cookie:
+                cdp_cookie["expires"] = cookie["expiry"]
+            try:
+                driver.execute_cdp_cmd("Network.setCookie", cdp_cookie)
+            except Exception as ex:
+                self.log_warning(message=f"E5SeleniumWebDriver.apply_session_cookies() : {cookie.get('name')} : {ex}")
+        return session_version
+
+    # E5
+    def login(self, driver: WebDriver, session_version: int, error_context: str) -> None:
+        with self.LOGIN_LOCK:
+            # Another day page logged in while we were waiting, reuse its session
+            if self.SESSION_COOKIES.version != session_version:
+                self.apply_session_cookies(driver=driver)
+                driver.refresh()
+                if not self.is_login_required(driver=driver):
+                    return
+
+            # The saved session was rejected, it is dropped whether the login below succeeds or not
+            self.SESSION_COOKIES.clear()
+
+            if not settings.E5_PREDICTIONS_USER or not settings.E5_PREDICTIONS_PASSWORD:
+                self.log_warning(message=f"{error_context} : login required but E5_PREDICTIONS_USER or "
+                                         f"E5_PREDICTIONS_PASSWORD is not set")
+                return
+
+            try:
+                driver.find_element(by=By.ID, value="user_login").send_keys(settings.E5_PREDICTIONS_USER)
+                driver.find_element(by=By.ID, value="user_pass").send_keys(settings.E5_PREDICTIONS_PASSWORD)
+                driver.find_element(by=By.ID, value="wp-submit").click()
+                WebDriverWait(driver=driver, timeout=self.PREDICTIONS_TIMEOUT).until(
+                    lambda logged_driver: not self.is_login_required(driver=logged_driver))
+            except Exception as ex:
+                self.log_warning(message=f"{error_context} : login failed : {ex}")
+                return
+
+            # Save Session
+            success, message = self.SESSION_COOKIES.save(cookies=driver.get_cookies())
+            if not success:
+                self.log_warning(message=f"{error_context} : session cookies not saved : {message}")
 
     # E5
     def get_upcoming_matches(self, error_context: str) -> None:
@@ -515,40 +822,35 @@ class E5SeleniumWebDriver:
         self.check_is_connected()
 
         # Delete old fixtures
-        old_fixtures: QuerySet(E5Fixture) = E5Fixture.objects.filter(date__lte=datetime.date.today())
-        for old_fixture in old_fixtures:
-            old_fixture.delete()
+        E5Fixture.objects.filter(date__lte=datetime.date.today()).delete()
 
         if self.status.success:
             endpoints: tuple = ("saturday-uk/", "saturday/", "sunday/", "monday/", "tuesday/", "wednesday/",
                                 "thursday/", "friday/")
 
-            for endpoint in endpoints:
-                # Get Url
-                self.get_only(url=f"https://www.thestatsdontlie.com/football/predictions/{endpoint}",
-                              error_context=error_context)
-                if not self.status.success:
-                    self.init_status()
-                    continue
+            # Release our own browser, every day page borrows one from the pool
+            E5WebDriverPool.shared().give_back(driver=self.driver)
+            self.driver = None
 
-                # Check if user and pass required
-                try:
-                    self.driver.find_element(by=By.ID, value="user_login").send_keys("cairo.kevin72@gmail.com")
-                    self.driver.find_element(by=By.ID, value="user_pass").send_keys("31Mars1988")
-                    self.driver.find_element(by=By.ID, value="wp-submit").click()
-                    self.driver.implicitly_wait(10)
-                except Exception:
-                    pass
+            # Load the day pages in parallel, one pooled browser each
+            with ThreadPoolExecutor(max_workers=E5WebDriverPool.shared().size) as executor:
+                pages_source: list[str | None] = list(executor.map(
+                    lambda day_endpoint: self.load_predictions_page(endpoint=day_endpoint,
+                                                                    error_context=error_context), endpoints))
 
-                # Get Soup
-                time.sleep(30)
-                self.get_soup(error_context=error_context)
-                if not self.status.success:
-                    self.init_status()
+            for endpoint, page_source in zip(endpoints, pages_source):
+                if page_source is None:
                     continue
 
+                # Get Soup
+                self.soup = BeautifulSoup(page_source, 'html.parser')
+
                 # Get Upcoming Matches Date
-                date_str: str = self.soup.select_one(selector="div.fusion-text.fusion-text-2 h1").text
+                date_h1: Tag | None = self.soup.select_one(selector=self.PREDICTIONS_DATE_SELECTOR)
+                if date_h1 is None:
+                    self.log_warning(message=f"Upcoming matches date not found for endpoint {endpoint}")
+                    continue
+                date_str: str = date_h1.text
                 date_str += f" {datetime.datetime.now().year}"
                 date: datetime.date = self.convert_to_date(date_str=date_str)
 
@@ -557,11 +859,11 @@ class E5SeleniumWebDriver:
                     continue
 
                 # Get Upcoming Matches
-                time.sleep(30)
-                table_upcoming_matchs = self.soup.select(selector="table.supsystic-table")[1]
-                if table_upcoming_matchs is None:
+                tables_upcoming_matchs: ResultSet[Tag] = self.soup.select(selector=self.PREDICTIONS_TABLE_SELECTOR)
+                if len(tables_upcoming_matchs) < 2:
                     self.log_warning(message=f"Table upcoming matches not found for date {date}")
                     continue
+                table_upcoming_matchs: Tag = tables_upcoming_matchs[1]
 
                 upcoming_matches_trs: ResultSet[Tag] = table_upcoming_matchs.select(selector="tbody tr")
 
@@ -643,6 +945,7 @@ class E5SeleniumWebDriver:
                     # Check if fixture already exists
                     if not fixture.exists():
                         fixture.save()
+                        E5RunTelemetry.shared().rows(written=1)
 
     ##################################################### GET IFRAME ###################################################
     # E5
@@ -651,7 +954,7 @@ class E5SeleniumWebDriver:
         self.check_is_connected()
 
         if self.status.success:
-            for season in self.ACTIVE_SEASONS:
+            for season in self.active_seasons():
                 season: E5Season  # Type hinting for Intellij
 
                 # Get Url
@@ -693,7 +996,7 @@ class E5SeleniumWebDriver:
         self.check_is_connected()
 
         if self.status.success:
-            for season in self.ACTIVE_SEASONS:
+            for season in self.active_seasons():
                 season: E5Season  # Type hinting for Intellij
 
                 # Init Status
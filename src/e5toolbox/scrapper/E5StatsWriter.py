@@ -0,0 +1,41 @@
+import dataclasses
+from typing import Any, ClassVar
+
+from django.db import models
+
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+
+
+# E5
+@dataclasses.dataclass
+class E5StatsWriter:
+    UNIQUE_FIELDS: ClassVar[list[str]] = ["team"]
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def merge(rows: dict[int, dict[str, Any]], team_id: int, values: dict[str, Any]) -> None:
+        # A team shows up once per section of a page, its sections end up in the same row
+        rows.setdefault(team_id, {}).update(values)
+
+    # E5
+    @staticmethod
+    def touched_fields(model: type[models.Model]) -> list[str]:
+        # auto_now columns are only refreshed on conflict when they are listed explicitly
+        return [field.name for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def upsert(cls, model: type[models.Model], rows: dict[int, dict[str, Any]]) -> int:
+        # Rows sharing the same columns land in a single INSERT ... ON CONFLICT (team) DO UPDATE, the columns a page
+        # does not carry are left untouched on existing rows
+        groups: dict[tuple[str, ...], list[models.Model]] = {}
+        for team_id, values in rows.items():
+            groups.setdefault(tuple(sorted(values)), []).append(model(team_id=team_id, **values))
+
+        for fields, objs in groups.items():
+            model.objects.bulk_create(objs=objs, update_conflicts=True, unique_fields=cls.UNIQUE_FIELDS,
+                                      update_fields=[*fields, *cls.touched_fields(model=model)])
+        E5RunTelemetry.shared().rows(written=len(rows))
+        return len(rows)
@@ -0,0 +1,108 @@
+import dataclasses
+from typing import Any, Callable, ClassVar
+
+from bs4 import BeautifulSoup, Tag
+from django.db import models
+
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+
+
+# E5
+@dataclasses.dataclass(frozen=True)
+class E5TableColumn:
+    index: int
+    field: str
+    convert: Callable[[str], Any] = int
+
+
+# E5
+@dataclasses.dataclass(frozen=True)
+class E5TableSection:
+    # Index of the team link in the row, the columns are written to that team's stats
+    link: int
+    columns: tuple[E5TableColumn, ...]
+
+    # E5
+    @classmethod
+    def build(cls, link: int, start: int, prefix: str,
+              columns: tuple[tuple[str, Callable[[str], Any]], ...]) -> "E5TableSection":
+        return cls(link=link, columns=tuple(
+            E5TableColumn(index=start + offset, field=f"{prefix}_{name}", convert=convert)
+            for offset, (name, convert) in enumerate(columns)))
+
+
+# E5
+@dataclasses.dataclass(frozen=True)
+class E5TableSpec:
+    url_field: str
+    model: type[models.Model]
+    sections: tuple[E5TableSection, ...]
+
+    # E5
+    @classmethod
+    def home_away_overall(cls, url_field: str, model: type[models.Model], starts: tuple[int, ...],
+                          columns: tuple[tuple[str, Callable[[str], Any]], ...],
+                          prefixes: tuple[str, ...] = ("home", "away", "overall")) -> "E5TableSpec":
+        # Most sheets repeat the same column group once per team link : home, away then overall
+        return cls(url_field=url_field, model=model,
+                   sections=tuple(E5TableSection.build(link=link, start=start, prefix=prefix, columns=columns)
+                                  for link, (start, prefix) in enumerate(zip(starts, prefixes))))
+
+
+# E5
+@dataclasses.dataclass
+class E5TableRecord:
+    team_name: str
+    model: type[models.Model]
+    values: dict[str, Any]
+
+
+# E5
+class E5TableParser:
+    TABLE_SELECTOR: ClassVar[str] = "table.waffle.no-grid"
+    TEAM_LINK_TARGET: ClassVar[str] = "_blank"
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def percent(text: str) -> int:
+        return int(text.strip('%'))
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def find_rows(cls, soup: BeautifulSoup) -> list[Tag] | None:
+        table: Tag | None = soup.select_one(selector=cls.TABLE_SELECTOR)
+        return None if table is None else table.find_all('tr')
+
+    # E5
+    @classmethod
+    def parse_row(cls, table_tr: Tag, spec: E5TableSpec) -> list[E5TableRecord]:
+        # Cells and team links are pulled once per row, every section then indexes into them
+        cells: list[Tag] = table_tr.find_all('td')
+        links: list[Tag] = [link for cell in cells for link in cell.find_all('a', target=cls.TEAM_LINK_TARGET)]
+
+        # Header, spacer and partially filled rows fail conversion and are skipped as a whole
+        try:
+            return [E5TableRecord(team_name=links[section.link].text, model=spec.model,
+                                  values={column.field: column.convert(cells[column.index].text)
+                                          for column in section.columns})
+                    for section in spec.sections]
+        except (IndexError, ValueError):
+            return []
+
+    # E5
+    @classmethod
+    def parse(cls, soup: BeautifulSoup, spec: E5TableSpec) -> list[E5TableRecord] | None:
+        table_trs: list[Tag] | None = cls.find_rows(soup=soup)
+        if table_trs is None:
+            return None
+
+        records: list[E5TableRecord] = []
+        skipped: int = 0
+        for table_tr in table_trs:
+            row_records: list[E5TableRecord] = cls.parse_row(table_tr=table_tr, spec=spec)
+            records.extend(row_records)
+            skipped += not row_records
+        E5RunTelemetry.shared().rows(parsed=len(records), skipped=skipped)
+        return records
@@ -0,0 +1,69 @@
+import dataclasses
+import logging
+import threading
+from typing import ClassVar, Optional
+
+from Website.models import E5Season, E5Team
+
+
+# E5
+@dataclasses.dataclass
+class E5TeamResolver:
+    SHARED: ClassVar[Optional["E5TeamResolver"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    teams: dict[int, dict[str, E5Team]] = dataclasses.field(default_factory=dict)
+    misses: dict[int, set[str]] = dataclasses.field(default_factory=dict)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5TeamResolver":
+        # One index per process, every parser of a run resolves against the same seasons
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None:
+                cls.SHARED = cls()
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def season_teams(self, season: E5Season) -> dict[str, E5Team]:
+        with self.lock:
+            if season.id not in self.teams:
+                # Load every team of the season in a single query, the first one wins on duplicated names
+                index: dict[str, E5Team] = {}
+                for team in E5Team.objects.filter(season=season).select_related('season').order_by('id'):
+                    index.setdefault(team.name, team)
+                self.teams[season.id] = index
+            return self.teams[season.id]
+
+    # E5
+    def resolve(self, season: E5Season, name: str) -> E5Team | None:
+        team: E5Team | None = self.season_teams(season=season).get(name)
+        if team is None:
+            with self.lock:
+                season_misses: set[str] = self.misses.setdefault(season.id, set())
+                is_new_miss: bool = name not in season_misses
+                season_misses.add(name)
+
+            # Report each unknown name once per run instead of once per row and page
+            if is_new_miss:
+                logging.warning(msg=f"E5TeamResolver.resolve() : unknown team '{name}' in season {season}")
+        return team
+
+    # E5
+    def invalidate(self, season: E5Season | None = None) -> None:
+        # Teams were created or renamed, reload the season on next use
+        with self.lock:
+            if season is None:
+                self.teams.clear()
+                self.misses.clear()
+            else:
+                self.teams.pop(season.id, None)
+                self.misses.pop(season.id, None)
+
+    # E5
+    def miss_count(self) -> int:
+        with self.lock:
+            return sum(len(names) for names in self.misses.values())
@@ -0,0 +1,137 @@
+import atexit
+import dataclasses
+import logging
+import os
+import threading
+from typing import ClassVar, Optional
+
+from django.conf import settings
+from selenium import webdriver
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+
+# E5
+@dataclasses.dataclass
+class E5WebDriverPool:
+    SHARED: ClassVar[Optional["E5WebDriverPool"]] = None
+    SHARED_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    size: int = 1
+    borrow_timeout: float = 600.0
+    idle: list[WebDriver] = dataclasses.field(default_factory=list)
+    started: int = 0
+    closed: bool = False
+    condition: threading.Condition = dataclasses.field(default_factory=threading.Condition)
+
+    ################################################## STATIC METHODS ##################################################
+    # E5
+    @staticmethod
+    def start_driver() -> WebDriver:
+        chrome_options = webdriver.ChromeOptions()
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        return webdriver.Chrome(options=chrome_options)
+
+    # E5
+    @staticmethod
+    def default_size() -> int:
+        # E5_WEBDRIVER_POOL_SIZE, 0 leaves it to the run's parallelism, see E5RunContext.from_settings()
+        return getattr(settings, "E5_WEBDRIVER_POOL_SIZE", 0) or os.cpu_count() or 1
+
+    # E5
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        # Any round-trip to chromedriver fails once the browser or its session is gone
+        try:
+            _ = driver.current_url
+            return True
+        except Exception:
+            return False
+
+    # E5
+    @staticmethod
+    def stop_driver(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as ex:
+            logging.warning(msg=f"E5WebDriverPool.stop_driver() : {ex}")
+
+    ################################################### CLASS METHODS ##################################################
+    # E5
+    @classmethod
+    def shared(cls) -> "E5WebDriverPool":
+        with cls.SHARED_LOCK:
+            if cls.SHARED is None or cls.SHARED.closed:
+                cls.SHARED = cls(size=max(1, cls.default_size()))
+                atexit.register(cls.SHARED.close)
+            return cls.SHARED
+
+    ##################################################### METHODS ######################################################
+    # E5
+    def resize(self, size: int) -> None:
+        # Browsers above a smaller size are stopped as they are given back
+        with self.condition:
+            self.size = max(1, size)
+            self.condition.notify_all()
+
+    # E5
+    def borrow(self) -> WebDriver:
+        with self.condition:
+            while True:
+                # Reuse a warm browser if one is still alive
+                while self.idle:
+                    driver: WebDriver = self.idle.pop()
+                    if self.is_healthy(driver=driver):
+                        return driver
+                    self.started -= 1
+                    self.stop_driver(driver=driver)
+
+                # Lazy warm-up : start a new browser only while under the pool size
+                if self.started < self.size:
+                    self.started += 1
+                    break
+
+                if not self.condition.wait(timeout=self.borrow_timeout):
+                    raise TimeoutError(f"No webdriver available after {self.borrow_timeout}s")
+
+        # Start outside the lock, Chrome cold start takes seconds
+        try:
+            return self.start_driver()
+        except Exception:
+            with self.condition:
+                self.started -= 1
+                self.condition.notify()
+            raise
+
+    # E5
+    def give_back(self, driver: WebDriver) -> None:
+        if driver is None:
+            return
+
+        # Reset per-borrower state so the next borrower gets a clean browser
+        try:
+            driver.implicitly_wait(0)
+        except Exception:
+            pass
+
+        with self.condition:
+            if self.closed or self.started > self.size or not self.is_healthy(driver=driver):
+                self.started -= 1
+                self.stop_driver(driver=driver)
+            else:
+                self.idle.append(driver)
+            self.condition.notify()
+
+    # E5
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            drivers: list[WebDriver] = self.idle
+            self.idle = []
+            self.started -= len(drivers)
+            self.condition.notify_all()
+
+        for driver in drivers:
+            self.stop_driver(driver=driver)
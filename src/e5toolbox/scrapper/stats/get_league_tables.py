@@ -5,7 +5,12 @@ from bs4 import ResultSet, Tag
 from django.db.models import QuerySet
 
 from Website.models import E5Season, E5LeagueTableIframe, E5Team, E5TeamRanking
+from e5toolbox.scrapper.E5FreshnessTracker import E5FreshnessTracker
+from e5toolbox.scrapper.E5RunTelemetry import E5RunTelemetry
+from e5toolbox.scrapper.E5SeasonPrioritizer import E5SeasonPrioritizer
 from e5toolbox.scrapper.E5SeleniumWebdriver import E5SeleniumWebDriver, E5SeleniumWebdriverError
+from e5toolbox.scrapper.E5StatsWriter import E5StatsWriter
+from e5toolbox.scrapper.E5TeamResolver import E5TeamResolver
 
 
 # E5
@@ -22,12 +27,16 @@ class E5GetLeagueTables(E5SeleniumWebDriver):
         self.check_is_connected()
 
         if self.status.success:
-            for league_table in self.ACTIVE_LEAGUE_TABLE_IFRAMES:
+            # Seasons with the next fixtures first
+            for league_table in E5SeasonPrioritizer.shared().order_iframes(
+                    iframes=self.ACTIVE_LEAGUE_TABLE_IFRAMES.select_related('season')):
                 league_table: E5LeagueTableIframe  # Type hinting for Intellij
 
                 # Get Url
                 self.get(url=league_table.url, error_context=f"{self.ERROR_CONTEXT}.get_active_seasons_teams_ranking()")
                 if not self.status.success:
+                    # The season's stats families are parsed whatever their matches played
+                    E5FreshnessTracker.shared().league_table_failed(season_id=league_table.season_id)
                     self.init_status()
                     continue
 
@@ -36,6 +45,7 @@ class E5GetLeagueTables(E5SeleniumWebDriver):
                 table_trs: ResultSet[Tag] = self.soup.select(selector="table.waffle.no-grid tr")
 
                 # Get Team Ranking
+                rankings: dict[int, dict[str, int]] = {}
                 for table_tr in table_trs:
                     ranking: int = 0
                     team_name: str = ""
@@ -59,43 +69,31 @@ class E5GetLeagueTables(E5SeleniumWebDriver):
                         goals_difference: int = int(table_tr.select(selector="td")[9].text)
                         points: int = int(table_tr.select(selector="td")[10].text)
                     except Exception:
+                        E5RunTelemetry.shared().rows(skipped=1)
                         continue
+                    E5RunTelemetry.shared().rows(parsed=1)
 
-                    # Get Team
-                    try:
-                        team: E5Team | None = None
-                        team = E5Team.objects.get(name=team_name, season=league_table.season)
-                    except Exception as ex:
-                        self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_GET_TEAM_FAILED, exception=ex,
-                                       error_context=f"{self.ERROR_CONTEXT}.get_active_seasons_teams_ranking()")
-                        self.init_status()
+                    # Get Team, unknown names are reported once by the resolver
+                    team: E5Team | None = E5TeamResolver.shared().resolve(season=league_table.season, name=team_name)
+                    if team is None:
                         continue
 
-                    # Create Team Ranking
-                    team_ranking: E5TeamRanking = E5TeamRanking()
-                    team_ranking.ranking = ranking
-                    team_ranking.team = team
-                    team_ranking.matches_played = matchs_played
-                    team_ranking.matches_won = matchs_won
-                    team_ranking.matches_drawn = matchs_drawn
-                    team_ranking.matches_lost = matchs_lost
-                    team_ranking.goals_scored = goals_scored
-                    team_ranking.goals_conceded = goals_conceded
-                    team_ranking.goals_difference = goals_difference
-                    team_ranking.points = points
+                    # Add Team Ranking
+                    E5StatsWriter.merge(rows=rankings, team_id=team.id, values={
+                        "ranking": ranking, "matches_played": matchs_played, "matches_won": matchs_won,
+                        "matches_drawn": matchs_drawn, "matches_lost": matchs_lost, "goals_scored": goals_scored,
+                        "goals_conceded": goals_conceded, "goals_difference": goals_difference, "points": points})
+
+                # Save the whole table in a single upsert
+                try:
+                    E5StatsWriter.upsert(model=E5TeamRanking, rows=rankings)
+                except Exception as ex:
+                    self.exception(error_type=E5SeleniumWebdriverError.ERROR_TYPE_SAVE_STATS_FAILED, exception=ex,
+                                   error_context=f"{self.ERROR_CONTEXT}.get_active_seasons_teams_ranking()")
+                    self.init_status()
+                    rankings = {}
 
-                    # Check if team ranking already exists before saving or updating
-                    if not team_ranking.exists():
-                        team_ranking.save()
-                    else:
-                        target_team_ranking: E5TeamRanking = E5TeamRanking.objects.get(team=team)
-                        target_team_ranking.ranking = ranking
-                        target_team_ranking.matches_played = matchs_played
-                        target_team_ranking.matches_won = matchs_won
-                        target_team_ranking.matches_drawn = matchs_drawn
-                        target_team_ranking.matches_lost = matchs_lost
-                        target_team_ranking.goals_scored = goals_scored
-                        target_team_ranking.goals_conceded = goals_conceded
-                        target_team_ranking.goals_difference = goals_difference
-                        target_team_ranking.points = points
-                        target_team_ranking.save()
+                if rankings:
+                    E5FreshnessTracker.shared().league_table_saved(season_id=league_table.season_id)
+                else:
+                    E5FreshnessTracker.shared().league_table_failed(season_id=league_table.season_id)